@@ -132,18 +132,22 @@ glConvolutionFilter2D = images.setDimensionsAsInts(
 )
 
 @_lazy( glGetConvolutionFilter )
-def glGetConvolutionFilter( baseFunction, target, format, type ):
-    """Retrieve 1 or 2D convolution parameter "kernels" as pixel data"""
-    dims = (
-        glGetConvolutionParameteriv( target, GL_CONVOLUTION_WIDTH )[0],
-    )
-    if target != GL_CONVOLUTION_1D:
-        dims += (
-            glGetConvolutionParameteriv( target, GL_CONVOLUTION_HEIGHT )[0],
+def glGetConvolutionFilter( baseFunction, target, format, type, array=None ):
+    """Retrieve 1 or 2D convolution parameter "kernels" as pixel data
+    
+    array -- optional array into which to read the data
+    """
+    if array is None:
+        dims = (
+            glGetConvolutionParameteriv( target, GL_CONVOLUTION_WIDTH )[0],
         )
-    # is it always 4?  Seems to be, but the spec/man-page isn't really clear about it...
-    dims += (4,)
-    array = images.images.SetupPixelRead( format, dims, type )
+        if target != GL_CONVOLUTION_1D:
+            dims += (
+                glGetConvolutionParameteriv( target, GL_CONVOLUTION_HEIGHT )[0],
+            )
+        # is it always 4?  Seems to be, but the spec/man-page isn't really clear about it...
+        dims += (4,)
+        array = images.images.SetupPixelRead( format, dims, type )
     arrayType = arrays.GL_CONSTANT_TO_ARRAY_TYPE[
         images.images.TYPE_TO_ARRAYTYPE.get(type,type)
     ]
@@ -153,21 +157,26 @@ def glGetConvolutionFilter( baseFunction, target, format, type ):
     )
     return array
 @_lazy( glGetSeparableFilter )
-def glGetSeparableFilter( baseFunction, target, format, type ):
-    """Retrieve 2 1D convolution parameter "kernels" as pixel data"""
-    rowDims = (
-        glGetConvolutionParameteriv( GL_CONVOLUTION_WIDTH )[0],
-        4,
-    )
-    columnDims = (
-        glGetConvolutionParameteriv( GL_CONVOLUTION_HEIGHT )[0],
-        4,
-    )
+def glGetSeparableFilter( baseFunction, target, format, type, row=None, column=None ):
+    """Retrieve 2 1D convolution parameter "kernels" as pixel data
+    
+    row, column -- optional arrays into which to read the kernels
+    """
     arrayType = arrays.GL_CONSTANT_TO_ARRAY_TYPE[
         images.images.TYPE_TO_ARRAYTYPE.get(type,type)
     ]
-    row = images.images.SetupPixelRead( format, rowDims, type )
-    column = images.images.SetupPixelRead( format, columnDims, type )
+    if row is None:
+        rowDims = (
+            glGetConvolutionParameteriv( target, GL_CONVOLUTION_WIDTH )[0],
+            4,
+        )
+        row = images.images.SetupPixelRead( format, rowDims, type )
+    if column is None:
+        columnDims = (
+            glGetConvolutionParameteriv( target, GL_CONVOLUTION_HEIGHT )[0],
+            4,
+        )
+        column = images.images.SetupPixelRead( format, columnDims, type )
     baseFunction(
         target, format, type,
         ctypes.c_void_p( arrayType.dataPointer(row)),
@@ -176,13 +185,17 @@ def glGetSeparableFilter( baseFunction, target, format, type ):
     )
     return row, column
 @_lazy( glGetColorTable )
-def glGetColorTable( baseFunction, target, format, type ):
-    """Retrieve the current 1D color table as a bitmap"""
-    dims = (
-        glGetColorTableParameteriv(target, GL_COLOR_TABLE_WIDTH),
-        4, # Grr, spec *seems* to say that it's different sizes, but it doesn't really say...
-    )
-    array = images.images.SetupPixelRead( format, dims, type )
+def glGetColorTable( baseFunction, target, format, type, array=None ):
+    """Retrieve the current 1D color table as a bitmap
+    
+    array -- optional array into which to read the table
+    """
+    if array is None:
+        dims = (
+            glGetColorTableParameteriv(target, GL_COLOR_TABLE_WIDTH),
+            4, # Grr, spec *seems* to say that it's different sizes, but it doesn't really say...
+        )
+        array = images.images.SetupPixelRead( format, dims, type )
     arrayType = arrays.GL_CONSTANT_TO_ARRAY_TYPE[
         images.images.TYPE_TO_ARRAYTYPE.get(type,type)
     ]
@@ -0,0 +1,271 @@
+"""Lazy-loading support for the OpenGL.GL namespace
+
+With OpenGL.LAZY_GL_NAMESPACE set, OpenGL.GL does not star-import
+its (very large) set of VERSION modules, instead a module-level
+__getattr__ imports the module providing a name the first time that
+name is requested, so that:
+
+    from OpenGL.GL import glClear, GL_COLOR_BUFFER_BIT
+
+only loads the modules defining those two names.  The name to module
+mapping lives in the generated OpenGL.GL._lazyindex module, which
+must be regenerated (python -m OpenGL.GL._namespace) whenever the
+eager OpenGL.GL namespace changes (tests/test_lazynamespace.py checks
+that it is current).
+
+STAR_MODULES must match the star-imports of OpenGL/GL/__init__.py in
+order, later modules override earlier ones exactly as the star-imports
+do.
+
+The index is generated with the default value of each of INDEX_FLAGS.
+When one of those flags is set otherwise (e.g. PYOPENGL_SHADOW_PIXEL_STORE)
+the module whose exports depend on it is consulted before the index.
+"""
+
+import importlib, importlib.util, os, sys
+
+STAR_MODULES = (
+    'OpenGL.GL.VERSION.GL_1_1',
+    'OpenGL.GL.pointers',
+    'OpenGL.GL.images',
+    'OpenGL.GL.exceptional',
+    'OpenGL.GL.glget',
+    'OpenGL.GL.VERSION.GL_1_2',
+    'OpenGL.GL.VERSION.GL_1_3',
+    'OpenGL.GL.VERSION.GL_1_4',
+    'OpenGL.GL.VERSION.GL_1_5',
+    'OpenGL.GL.VERSION.GL_2_0',
+    'OpenGL.GL.VERSION.GL_2_1',
+    'OpenGL.GL.VERSION.GL_3_0',
+    'OpenGL.GL.VERSION.GL_3_1',
+    'OpenGL.GL.VERSION.GL_3_2',
+    'OpenGL.GL.VERSION.GL_3_3',
+    'OpenGL.GL.VERSION.GL_4_0',
+    'OpenGL.GL.VERSION.GL_4_1',
+    'OpenGL.GL.VERSION.GL_4_2',
+    'OpenGL.GL.VERSION.GL_4_3',
+    'OpenGL.GL.VERSION.GL_4_4',
+    'OpenGL.GL.VERSION.GL_4_5',
+    'OpenGL.GL.VERSION.GL_4_6',
+    'OpenGL.error',
+)
+
+# (moduleName, flag, value) STAR_MODULES whose exports depend on an
+# OpenGL flag, and the flag value the index is generated with
+INDEX_FLAGS = (
+    ('OpenGL.GL.images', 'SHADOW_PIXEL_STORE', False),
+    ('OpenGL.GL.exceptional', 'ERROR_CHECKING', True),
+)
+
+_INDEX = None
+_OVERRIDES = None
+_MISSING = object()
+
+
+def exported(module):
+    """Names a star-import of module would bind"""
+    names = getattr(module, '__all__', None)
+    if names is None:
+        names = [name for name in dir(module) if not name.startswith('_')]
+    return names
+
+
+def index():
+    """Retrieve {name: moduleName or None} for the lazy namespace
+
+    A None entry means the name is an alias, see ALIASES
+    """
+    global _INDEX
+    if _INDEX is None:
+        _lazyindex = importlib.import_module('OpenGL.GL._lazyindex')
+        result = {}
+        for moduleName, names in _lazyindex.MODULES:
+            for name in names.split():
+                result[name] = moduleName
+        for name in _lazyindex.ALIASES:
+            result[name] = None
+        _INDEX = result
+    return _INDEX
+
+
+def overrides():
+    """Retrieve [moduleName, ...] from INDEX_FLAGS whose flag is not as indexed"""
+    global _OVERRIDES
+    if _OVERRIDES is None:
+        from OpenGL import _configflags
+
+        _OVERRIDES = [
+            moduleName
+            for moduleName, flag, value in INDEX_FLAGS
+            if bool(getattr(_configflags, flag)) != value
+        ]
+    return _OVERRIDES
+
+
+def override(name, moduleName=_MISSING):
+    """Find the flag-dependent module which exports name over moduleName (or None)
+
+    Only modules from overrides() which come after moduleName in
+    STAR_MODULES are considered (they are imported to check), later
+    modules win as with the star-imports.
+    """
+    if moduleName is None:
+        # aliases follow their target
+        return None
+    position = STAR_MODULES.index(moduleName) if moduleName in STAR_MODULES else -1
+    for overrideName in reversed(overrides()):
+        if STAR_MODULES.index(overrideName) < position:
+            continue
+        module = importlib.import_module(overrideName)
+        if name in exported(module):
+            return module
+    return None
+
+
+def publicNames():
+    """All public names of the (lazy) OpenGL.GL namespace"""
+    result = set(index())
+    for moduleName in overrides():
+        result.update(exported(importlib.import_module(moduleName)))
+    return result
+
+
+def resolve(namespace, name):
+    """Import and return name for the (lazy) OpenGL.GL namespace dictionary
+
+    The value is stored in namespace, so __getattr__ is only called
+    once for each name.  Names which are not in the index but are
+    sub-modules of OpenGL.GL (e.g. images) are imported, as the eager
+    namespace has imported them.  Raises AttributeError for unknown names.
+    """
+    if name.startswith('_'):
+        # private names (and sub-modules) are never indexed
+        raise AttributeError("""module 'OpenGL.GL' has no attribute %r""" % (name,))
+    moduleName = index().get(name, _MISSING)
+    source = override(name, moduleName)
+    if source is not None:
+        value = getattr(source, name)
+    elif moduleName is _MISSING:
+        moduleName = 'OpenGL.GL.%s' % (name,)
+        if importlib.util.find_spec(moduleName) is None:
+            raise AttributeError("""module 'OpenGL.GL' has no attribute %r""" % (name,))
+        return importlib.import_module(moduleName)
+    elif moduleName is None:
+        aliases = importlib.import_module('OpenGL.GL._lazyindex').ALIASES
+        value = resolve(namespace, aliases[name])
+    else:
+        value = getattr(importlib.import_module(moduleName), name)
+    namespace[name] = value
+    return value
+
+
+def moduleGetattr(name):
+    """Module-level __getattr__ for the lazy OpenGL.GL"""
+    namespace = vars(sys.modules['OpenGL.GL'])
+    if name == '__all__':
+        # star-imports see (and so import) the whole eager namespace
+        value = namespace['__all__'] = sorted(publicNames())
+        return value
+    return resolve(namespace, name)
+
+
+def moduleDir():
+    """Module-level __dir__ for the lazy OpenGL.GL"""
+    return sorted(set(vars(sys.modules['OpenGL.GL'])) | publicNames())
+
+
+def buildIndex(namespace):
+    """Calculate (modules, aliases) for an eager OpenGL.GL namespace
+
+    modules -- [(moduleName, [name, ...]), ...] in STAR_MODULES order
+    aliases -- {name: targetName} for names bound in OpenGL.GL itself
+
+    Sub-modules of OpenGL.GL are not indexed (which of them are
+    present depends on what has been imported), resolve() imports
+    them on demand.
+    """
+    modules = [(name, sys.modules[name]) for name in STAR_MODULES]
+    sources = {}
+    aliases = {}
+    public = sorted(
+        name
+        for name in namespace
+        if not name.startswith('_')
+        and getattr(namespace[name], '__name__', None) != 'OpenGL.GL.%s' % (name,)
+    )
+    found = {}
+    unresolved = []
+    for name in public:
+        value = namespace[name]
+        for moduleName, module in reversed(modules):
+            if name in exported(module) and getattr(module, name, None) is value:
+                sources.setdefault(moduleName, []).append(name)
+                found[id(value)] = name
+                break
+        else:
+            unresolved.append(name)
+    for name in unresolved:
+        # bound in OpenGL.GL itself (glRotate = glRotated and the like)
+        target = found.get(id(namespace[name]))
+        if target is not None:
+            aliases[name] = target
+    return (
+        [
+            (moduleName, sources[moduleName])
+            for moduleName, _ in modules
+            if moduleName in sources
+        ],
+        aliases,
+    )
+
+
+def formatIndex(modules, aliases):
+    """Produce the source code of the OpenGL.GL._lazyindex module"""
+    lines = [
+        '"""Name index for the lazy OpenGL.GL namespace',
+        '',
+        'Generated by python -m OpenGL.GL._namespace, do not edit',
+        '"""',
+        'MODULES = (',
+    ]
+    for moduleName, names in modules:
+        lines.append('    (%r, """' % (moduleName,))
+        line = ''
+        for name in names:
+            if line and len(line) + len(name) > 78:
+                lines.append(line.rstrip())
+                line = ''
+            line += name + ' '
+        lines.append(line.rstrip())
+        lines.append('"""),')
+    lines.append(')')
+    lines.append('ALIASES = {')
+    for name, target in sorted(aliases.items()):
+        lines.append('    %r: %r,' % (name, target))
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def generate():
+    """Build the index source from an eagerly-imported OpenGL.GL"""
+    from OpenGL import _configflags
+
+    if _configflags.LAZY_GL_NAMESPACE:
+        raise RuntimeError(
+            """Generating the lazy index requires an eager OpenGL.GL (unset PYOPENGL_LAZY_GL_NAMESPACE)"""
+        )
+    for moduleName, flag, value in INDEX_FLAGS:
+        if bool(getattr(_configflags, flag)) != value:
+            raise RuntimeError(
+                """Generating the lazy index requires the default %s (unset PYOPENGL_%s)"""
+                % (flag, flag)
+            )
+    import OpenGL.GL
+
+    return formatIndex(*buildIndex(vars(OpenGL.GL)))
+
+
+if __name__ == '__main__':
+    target = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_lazyindex.py')
+    with open(target, 'w') as fh:
+        fh.write(generate())
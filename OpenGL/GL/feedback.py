@@ -1,8 +1,42 @@
-"""Utility module to parse a Feedback buffer"""
+"""Utility module to parse a Feedback buffer
+
+parseFeedback (used by glRenderMode when leaving GL_FEEDBACK mode)
+returns a FeedbackRecords instance when numpy is available.  It scans
+the buffer once for token positions and gathers all of the vertex
+data with vectorised indexing into structured arrays:
+
+    records.primitives -- one row per token: token, first (index of
+        the first vertex in records.vertices), count (number of
+        vertices) and value (the GL_PASS_THROUGH_TOKEN value)
+    records.vertices -- one row per vertex with a 'vertex' field and,
+        depending on the feedback type, 'color' and 'texture' fields
+
+The records also behave as the sequence of tuples produced by
+parseFeedbackObjects (e.g. (GL_LINE_TOKEN, Vertex, Vertex)), built
+lazily on first access, so existing code keeps working.
+"""
 from OpenGL import contextdata
 from OpenGL.GL.VERSION import GL_1_1 as _simple
+try:
+    import numpy
+except ImportError:
+    numpy = None
+try:
+    from collections.abc import Sequence as _Sequence
+except ImportError:
+    from collections import Sequence as _Sequence
 
 def parseFeedback( buffer, entryCount ):
+    """Parse the feedback buffer into records
+
+    returns FeedbackRecords if numpy is available, otherwise the list
+    produced by parseFeedbackObjects
+    """
+    if numpy is None:
+        return parseFeedbackObjects( buffer, entryCount )
+    return FeedbackRecords.fromBuffer( buffer, entryCount )
+
+def parseFeedbackObjects( buffer, entryCount ):
     """Parse the feedback buffer into Python object records"""
     bufferIndex = 0
     result = []
@@ -84,3 +118,159 @@ def createGetVertex( ):
             textureEnd = colorEnd + 4
             return (buffer[bufferIndex:end],buffer[end:colorEnd],buffer[colorEnd:textureEnd]),textureEnd
     return getVertex
+
+def vertexLayout( ):
+    """Determine per-vertex (coordinates, color, texture) value counts
+
+    Based on the type passed to glFeedbackBuffer and the current
+    colour-index mode.
+    """
+    mode = contextdata.getValue( "GL_FEEDBACK_BUFFER_TYPE" )
+    indexMode = _simple.glGetBooleanv( _simple.GL_INDEX_MODE )
+    colorSize = [ 4,1 ][ int(indexMode) ]
+    if mode == _simple.GL_2D:
+        return 2,0,0
+    elif mode == _simple.GL_3D:
+        return 3,0,0
+    elif mode == _simple.GL_3D_COLOR:
+        return 3,colorSize,0
+    elif mode == _simple.GL_3D_COLOR_TEXTURE:
+        return 3,colorSize,4
+    return 4,colorSize,4
+
+TOKENS = dict( [
+    (int(token),token) for token in list(SINGLE_VERTEX_TOKENS)+list(DOUBLE_VERTEX_TOKENS)+[
+        _simple.GL_PASS_THROUGH_TOKEN, _simple.GL_POLYGON_TOKEN,
+    ]
+])
+
+class FeedbackRecords( _Sequence ):
+    """Structured-array view of a parsed feedback buffer
+
+    primitives -- structured array (token, first, count, value)
+    vertices -- structured array (vertex[, color][, texture])
+
+    Indexing/iterating produces the same tuples as parseFeedbackObjects,
+    created on demand.
+    """
+    PRIMITIVE_DTYPE = [('token','u4'),('first','i8'),('count','i4'),('value','f4')]
+    def __init__( self, primitives, vertices ):
+        self.primitives = primitives
+        self.vertices = vertices
+        self._records = None
+    @classmethod
+    def fromBuffer( cls, buffer, entryCount, layout=None ):
+        """Scan buffer (entryCount values) into structured arrays
+
+        layout -- (size, colorSize, textureSize) as from vertexLayout,
+            by default queried from the current context
+        """
+        size, colorSize, textureSize = layout or vertexLayout()
+        stride = size + colorSize + textureSize
+        values = numpy.asarray( buffer, dtype='f' ).reshape( (-1,) )[:entryCount]
+        # only the token positions need a sequential scan; converting the
+        # whole buffer in one pass is still cheaper than converting each
+        # token as the scan reaches it...
+        tokens = values.astype( 'i4' ).tolist()
+        single = frozenset( int(t) for t in SINGLE_VERTEX_TOKENS )
+        double = frozenset( int(t) for t in DOUBLE_VERTEX_TOKENS )
+        passThrough = int(_simple.GL_PASS_THROUGH_TOKEN)
+        polygon = int(_simple.GL_POLYGON_TOKEN)
+        kinds, starts, counts = [], [], []
+        index = 0
+        while index < entryCount:
+            token = tokens[index]
+            if token in single:
+                start, count = index + 1, 1
+            elif token in double:
+                start, count = index + 1, 2
+            elif token == polygon:
+                start, count = index + 2, tokens[index+1]
+            elif token == passThrough:
+                start, count = index + 1, 0
+            else:
+                raise ValueError(
+                    """Unrecognised token %r in feedback stream"""%(token,)
+                )
+            kinds.append( token )
+            starts.append( start )
+            counts.append( count )
+            index = start + count * stride + (token == passThrough)
+        primitives = numpy.zeros( (len(kinds),), dtype=cls.PRIMITIVE_DTYPE )
+        primitives['token'] = kinds
+        counts = numpy.asarray( counts, dtype='i4' )
+        primitives['count'] = counts
+        starts = numpy.asarray( starts, dtype='i8' )
+        isPass = primitives['token'] == passThrough
+        if isPass.any():
+            primitives['value'][isPass] = values[starts[isPass]]
+        firsts = numpy.cumsum( counts ) - counts
+        primitives['first'] = firsts
+        # vectorised gather of every vertex record...
+        total = int(counts.sum())
+        vertexStarts = (
+            numpy.repeat( starts, counts ) +
+            (numpy.arange( total ) - numpy.repeat( firsts, counts )) * stride
+        )
+        rows = values[ vertexStarts[:,None] + numpy.arange( stride ) ]
+        fields = [('vertex','f4',(size,))]
+        if colorSize:
+            fields.append( ('color','f4',(colorSize,)) )
+        if textureSize:
+            fields.append( ('texture','f4',(textureSize,)) )
+        vertices = numpy.zeros( (total,), dtype=fields )
+        vertices['vertex'] = rows[:,:size]
+        if colorSize:
+            vertices['color'] = rows[:,size:size+colorSize]
+        if textureSize:
+            vertices['texture'] = rows[:,size+colorSize:]
+        return cls( primitives, vertices )
+    def __len__( self ):
+        return len(self.primitives)
+    def vertex( self, index ):
+        """Create a Vertex object for vertex row index"""
+        row = self.vertices[index]
+        names = self.vertices.dtype.names
+        return Vertex(
+            row['vertex'],
+            row['color'] if 'color' in names else None,
+            row['texture'] if 'texture' in names else None,
+        )
+    def record( self, index ):
+        """Create the parseFeedbackObjects-style tuple for primitive index"""
+        token, first, count, value = self.primitives[index].tolist()
+        constant = TOKENS.get( token, token )
+        if token == _simple.GL_PASS_THROUGH_TOKEN:
+            return (constant, value)
+        return tuple( [constant] + [
+            self.vertex( i ) for i in range( first, first+count )
+        ])
+    @property
+    def records( self ):
+        """All records as a list (created on first access)"""
+        if self._records is None:
+            self._records = [ self.record( i ) for i in range( len(self) ) ]
+        return self._records
+    def __getitem__( self, index ):
+        if self._records is not None:
+            return self._records[index]
+        if isinstance( index, slice ):
+            return [ self.record( i ) for i in range( *index.indices( len(self) ) ) ]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError( index )
+        return self.record( index )
+    def __iter__( self ):
+        return iter( self.records )
+    def __eq__( self, other ):
+        if isinstance( other, FeedbackRecords ):
+            other = other.records
+        return self.records == other
+    def __ne__( self, other ):
+        return not self.__eq__( other )
+    __hash__ = None
+    def __repr__( self ):
+        return '%s( %s primitives, %s vertices )'%(
+            self.__class__.__name__, len(self.primitives), len(self.vertices),
+        )
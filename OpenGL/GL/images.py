@@ -13,7 +13,8 @@
         glCompressedTexSubImage1D
 """
 from OpenGL.raw.GL.VERSION import GL_1_1,GL_1_2, GL_3_0
-from OpenGL import images, arrays, wrapper
+from OpenGL import images, arrays, wrapper, _configflags
+from OpenGL.lazywrapper import lazy as _lazy
 from OpenGL.arrays import arraydatatype
 from OpenGL._bytes import bytes,integer_types
 from OpenGL.raw.GL import _types
@@ -225,6 +226,12 @@ __all__ = (
 
     #'glGetMinmax',
 )
+if _configflags.SHADOW_PIXEL_STORE:
+    __all__ += (
+        'glPixelStoref',
+        'glPixelStorei',
+        'glPopClientAttrib',
+    )
 
 def _get_texture_level_dims(target,level):
     """Retrieve texture dims for given level and target"""
@@ -276,8 +283,8 @@ for suffix,type in [
             format,type,
             imageData
         )
-        if owned and outputType is bytes:
-            return images.returnFormat( array, type )
+        if owned and outputType in images.IMAGE_OUTPUT_TYPES:
+            return images.returnFormat( array, type, outputType, owned=True )
         else:
             return array
     globals()["glReadPixels%s"%(suffix,)] = glReadPixels
@@ -292,7 +299,9 @@ for suffix,type in [
 
         outputType -- default (bytes) provides string output of the
             results iff OpenGL.UNSIGNED_BYTE_IMAGES_AS_STRING is True
-            and type == GL_UNSIGNED_BYTE.  Any other value will cause
+            and type == GL_UNSIGNED_BYTE.  memoryview provides a
+            read-only memoryview onto the result array (no copy) when
+            type == GL_UNSIGNED_BYTE.  Any other value will cause
             output in the default array output format.
 
         returns the pixel data array in the format defined by the
@@ -313,8 +322,8 @@ for suffix,type in [
         GL_1_1.glGetTexImage(
             target, level, format, type, imageData
         )
-        if owned and outputType is bytes:
-            return images.returnFormat( array, type )
+        if owned and outputType in images.IMAGE_OUTPUT_TYPES:
+            return images.returnFormat( array, type, outputType, owned=True )
         else:
             return array
     globals()["glGetTexImage%s"%(suffix,)] = glGetTexImage
@@ -347,7 +356,9 @@ def glReadPixels( x,y,width,height,format,type, array=None, outputType=bytes ):
     array -- optional array/offset into which to store the value
     outputType -- default (bytes) provides string output of the
         results iff OpenGL.UNSIGNED_BYTE_IMAGES_AS_STRING is True
-        and type == GL_UNSIGNED_BYTE.  Any other value will cause
+        and type == GL_UNSIGNED_BYTE.  memoryview provides a
+        read-only memoryview onto the result array (no copy) when
+        type == GL_UNSIGNED_BYTE.  Any other value will cause
         output in the default array output format.
 
     returns the pixel data array in the format defined by the
@@ -372,8 +383,8 @@ def glReadPixels( x,y,width,height,format,type, array=None, outputType=bytes ):
         format,type,
         imageData
     )
-    if owned and outputType is bytes:
-        return images.returnFormat( array, type )
+    if owned and outputType in images.IMAGE_OUTPUT_TYPES:
+        return images.returnFormat( array, type, outputType, owned=True )
     else:
         return array
 
@@ -388,7 +399,9 @@ def glGetTexImage( target, level,format,type, array=None, outputType=bytes ):
 
     outputType -- default (bytes) provides string output of the
         results iff OpenGL.UNSIGNED_BYTE_IMAGES_AS_STRING is True
-        and type == GL_UNSIGNED_BYTE.  Any other value will cause
+        and type == GL_UNSIGNED_BYTE.  memoryview provides a
+        read-only memoryview onto the result array (no copy) when
+        type == GL_UNSIGNED_BYTE.  Any other value will cause
         output in the default array output format.
 
     returns the pixel data array in the format defined by the
@@ -398,17 +411,19 @@ def glGetTexImage( target, level,format,type, array=None, outputType=bytes ):
     if array is None:
         dims = _get_texture_level_dims(target,level)
         array = imageData = images.SetupPixelRead( format, tuple(dims), type )
+        owned = True
     else:
         if isinstance( array, integer_types):
             imageData = ctypes.c_void_p( array )
         else:
             array = arrayType.asArray( array )
             imageData = arrayType.voidDataPointer( array )
+        owned = False
     GL_1_1.glGetTexImage(
         target, level, format, type, imageData
     )
-    if outputType is bytes:
-        return images.returnFormat( array, type )
+    if outputType in images.IMAGE_OUTPUT_TYPES:
+        return images.returnFormat( array, type, outputType, owned=owned )
     else:
         return array
 
@@ -628,3 +643,22 @@ for suffix,arrayConstant in [
         del suffix,arrayConstant
     except NameError as err:
         pass
+
+if _configflags.SHADOW_PIXEL_STORE:
+    @_lazy( GL_1_1.glPixelStorei )
+    def glPixelStorei( baseFunction, pname, param ):
+        """Set pixel-store parameter, recording it in the images shadow"""
+        images.invalidatePixelStore( pname )
+        result = baseFunction( pname, param )
+        images.pixelStoreShadow()[pname] = param
+        return result
+    @_lazy( GL_1_1.glPixelStoref )
+    def glPixelStoref( baseFunction, pname, param ):
+        """Set pixel-store parameter, invalidating it in the images shadow"""
+        images.invalidatePixelStore( pname )
+        return baseFunction( pname, param )
+    @_lazy( GL_1_1.glPopClientAttrib )
+    def glPopClientAttrib( baseFunction ):
+        """Restore client attributes, invalidating the images pixel-store shadow"""
+        images.invalidatePixelStore()
+        return baseFunction()
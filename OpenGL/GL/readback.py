@@ -0,0 +1,266 @@
+"""Asynchronous pixel readback through a ring of pixel-pack buffers
+
+glReadPixels into client memory forces the driver to finish all
+outstanding rendering before it can return.  When capturing every
+frame (e.g. headless rendering) that stall serialises the CPU and GPU.
+AsyncReadback instead reads into a pixel-pack buffer object (the call
+returns immediately), inserts a fence, and hands back a ReadbackFuture
+which is resolved a frame or two later, once the GPU has finished,
+by mapping the buffer (glMapBufferRange) and copying the pixels out:
+
+    from OpenGL.GL import readback
+    capture = readback.AsyncReadback( width, height, GL_RGB, GL_UNSIGNED_BYTE )
+    pending = []
+    while rendering:
+        render()
+        pending.append( capture.read( 0, 0 ) )
+        while pending and pending[0].done():
+            save( pending.pop(0).result() )
+
+Futures are resolved on the thread which owns the GL context, either
+by polling done() (which never blocks) or by calling result(), which
+waits for the GPU if necessary.  Reusing a slot (more than `slots`
+reads outstanding) resolves that slot's future first.
+
+Requires OpenGL 3.2 (pixel buffer objects, glMapBufferRange and sync
+objects) and concurrent.futures (the "futures" backport on Python 2).
+Results use the same array shape and type as the array output of
+OpenGL.GL.glReadPixels.
+"""
+import ctypes
+try:
+    from concurrent import futures
+except ImportError as err:
+    # Python 2 without the "futures" backport, see AsyncReadback
+    futures = None
+from OpenGL import images, arrays, error
+from OpenGL.raw.GL import _types
+from OpenGL.raw.GL.VERSION import GL_1_1, GL_1_5, GL_2_1, GL_3_0, GL_3_2
+from OpenGL.GL.images import _get_texture_level_dims
+
+__all__ = ('AsyncReadback', 'ReadbackFuture')
+
+TIMEOUT = 1000000000  # nanoseconds per glClientWaitSync call
+
+
+class ReadbackFuture( futures.Future if futures is not None else object ):
+    """Future resolving to the pixel array read by AsyncReadback
+
+    As with OpenGL.GL.shaders.ProgramFuture, resolution happens on the
+    GL thread: done() polls the fence without blocking and resolves the
+    future once the GPU has finished, result() resolves immediately
+    (waiting on the fence if required).
+
+    A cancelled future releases its fence and slot the next time it
+    is polled or resolved (again, on the GL thread).
+    """
+    def __init__( self, readback, slot, out=None ):
+        super( ReadbackFuture, self ).__init__()
+        self.readback = readback
+        self.slot = slot
+        self.out = out
+    def ready( self ):
+        """Check (without blocking) whether the GPU has written the pixels"""
+        fence = self.readback.fences[self.slot]
+        if fence is None:
+            return True
+        result = GL_3_2.glClientWaitSync( fence, 0, 0 )
+        return result in (GL_3_2.GL_ALREADY_SIGNALED, GL_3_2.GL_CONDITION_SATISFIED)
+    def resolve( self ):
+        """Map the slot's buffer and copy the pixels out, setting the result"""
+        if self.cancelled():
+            self.readback.release( self.slot, self )
+            return
+        if futures.Future.done( self ):
+            return
+        if not self.set_running_or_notify_cancel():
+            self.readback.release( self.slot, self )
+            return
+        try:
+            result = self.readback.collect( self.slot, self.out )
+        except Exception as err:
+            self.set_exception( err )
+        else:
+            self.set_result( result )
+        finally:
+            self.readback.release( self.slot, self )
+    def done( self ):
+        """Poll the fence, resolving the future if the GPU has finished"""
+        if self.cancelled():
+            self.readback.release( self.slot, self )
+        elif not futures.Future.done( self ) and self.ready():
+            self.resolve()
+        return futures.Future.done( self )
+    def result( self, timeout=None ):
+        """Resolve (waiting for the GPU if necessary) and return the pixel array"""
+        self.resolve()
+        return super( ReadbackFuture, self ).result( timeout )
+    def exception( self, timeout=None ):
+        """Resolve (waiting for the GPU if necessary) and return any failure"""
+        self.resolve()
+        return super( ReadbackFuture, self ).exception( timeout )
+
+class AsyncReadback( object ):
+    """Ring of pixel-pack buffers for non-blocking glReadPixels/glGetTexImage
+
+    width, height -- dimensions of the image read by each call
+    format, type -- pixel format/type as for glReadPixels
+    slots -- number of buffers in the ring, i.e. the number of reads
+        which may be outstanding before read() has to wait for the GPU
+    """
+    def __init__( self, width, height, format=GL_1_1.GL_RGBA, type=GL_1_1.GL_UNSIGNED_BYTE, slots=3 ):
+        self.width = int(width)
+        self.height = int(height)
+        self.format = format
+        self.type = type
+        self.slots = slots
+        template = images.createTargetArray( format, (self.width,self.height), type )
+        self.arrayType = arrays.GL_CONSTANT_TO_ARRAY_TYPE[
+            images.TYPE_TO_ARRAYTYPE.get( type, type )
+        ]
+        self.dims = self.arrayType.dimensions( template )
+        self.nbytes = self.arrayType.arrayByteCount( template )
+        self.buffers = []
+        self.fences = [None] * slots
+        self.pending = [None] * slots
+        self.index = 0
+    def create_buffers( self ):
+        """Allocate the pixel-pack buffers"""
+        assert not self.buffers, """Already created the buffers"""
+        buffers = (_types.GLuint * self.slots)()
+        GL_1_5.glGenBuffers( self.slots, buffers )
+        self.buffers = list( buffers )
+        try:
+            for buffer in self.buffers:
+                GL_1_5.glBindBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER, buffer )
+                GL_1_5.glBufferData( GL_2_1.GL_PIXEL_PACK_BUFFER, self.nbytes, None, GL_1_5.GL_STREAM_READ )
+        finally:
+            GL_1_5.glBindBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER, 0 )
+        return self.buffers
+    def _acquire( self, out ):
+        """Find (waiting for, if necessary) the next slot, bind its buffer"""
+        if futures is None:
+            raise ImportError( """AsyncReadback requires concurrent.futures""" )
+        if not self.buffers:
+            self.create_buffers()
+        slot = self.index
+        self.index = (slot + 1) % self.slots
+        previous = self.pending[slot]
+        if previous is not None:
+            # ring is full, the oldest read must complete before reuse
+            previous.resolve()
+        future = self.pending[slot] = ReadbackFuture( self, slot, out )
+        GL_1_5.glBindBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER, self.buffers[slot] )
+        images.setupDefaultTransferMode()
+        images.rankPacking( 3 )
+        return slot, future
+    def _submitted( self, slot ):
+        """Unbind the buffer and fence the read issued into slot"""
+        GL_1_5.glBindBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER, 0 )
+        self.fences[slot] = GL_3_2.glFenceSync( GL_3_2.GL_SYNC_GPU_COMMANDS_COMPLETE, 0 )
+    def read( self, x=0, y=0, out=None ):
+        """Start a read of the width x height region at x,y of the read buffer
+
+        out -- optional array (of the result shape/type) to receive the
+            pixels, otherwise a new array is created on resolution
+
+        returns ReadbackFuture
+        """
+        slot, future = self._acquire( out )
+        try:
+            GL_1_1.glReadPixels(
+                int(x), int(y), self.width, self.height,
+                self.format, self.type, ctypes.c_void_p( 0 ),
+            )
+        finally:
+            self._submitted( slot )
+        return future
+    def readTexture( self, target, level=0, out=None ):
+        """Start a read of a texture level (whose size must match ours)
+
+        returns ReadbackFuture
+        """
+        dims = _get_texture_level_dims( target, level )
+        if tuple(dims) != (self.width, self.height):
+            raise ValueError(
+                """Texture level is %s, readback configured for %s"""%(
+                    dims, (self.width, self.height),
+                )
+            )
+        slot, future = self._acquire( out )
+        try:
+            GL_1_1.glGetTexImage( target, level, self.format, self.type, ctypes.c_void_p( 0 ) )
+        finally:
+            self._submitted( slot )
+        return future
+    def wait( self, slot ):
+        """Wait until the read into slot has completed"""
+        fence = self.fences[slot]
+        if fence is None:
+            return
+        self.fences[slot] = None
+        try:
+            while True:
+                result = GL_3_2.glClientWaitSync( fence, GL_3_2.GL_SYNC_FLUSH_COMMANDS_BIT, TIMEOUT )
+                if result == GL_3_2.GL_WAIT_FAILED:
+                    raise error.GLError(
+                        description='glClientWaitSync failed for readback slot %s'%( slot, ),
+                    )
+                if result != GL_3_2.GL_TIMEOUT_EXPIRED:
+                    break
+        finally:
+            GL_3_2.glDeleteSync( fence )
+    def collect( self, slot, out=None ):
+        """Wait for slot, copy its pixels into out (or a new array) and return it"""
+        self.wait( slot )
+        if out is None:
+            out = self.arrayType.zeros( self.dims )
+        elif self.arrayType.arrayByteCount( out ) != self.nbytes:
+            raise ValueError(
+                """Output array holds %s bytes, readback produces %s"""%(
+                    self.arrayType.arrayByteCount( out ), self.nbytes,
+                )
+            )
+        GL_1_5.glBindBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER, self.buffers[slot] )
+        try:
+            pointer = GL_3_0.glMapBufferRange(
+                GL_2_1.GL_PIXEL_PACK_BUFFER, 0, self.nbytes, GL_3_0.GL_MAP_READ_BIT,
+            )
+            if not pointer:
+                raise error.GLError(
+                    description='Unable to map readback slot %s'%( slot, ),
+                )
+            try:
+                ctypes.memmove( self.arrayType.dataPointer( out ), pointer, self.nbytes )
+            finally:
+                GL_1_5.glUnmapBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER )
+        finally:
+            GL_1_5.glBindBuffer( GL_2_1.GL_PIXEL_PACK_BUFFER, 0 )
+        return out
+    def release( self, slot, future ):
+        """Mark slot free once future is resolved"""
+        if self.pending[slot] is future:
+            self.pending[slot] = None
+            fence = self.fences[slot]
+            if fence is not None:
+                self.fences[slot] = None
+                GL_3_2.glDeleteSync( fence )
+    def poll( self ):
+        """Resolve every completed read, returns the resolved futures"""
+        return [
+            future for future in list( self.pending )
+            if future is not None and future.done()
+        ]
+    def delete( self ):
+        """Delete the fences and buffers (outstanding futures are cancelled)"""
+        for slot, future in enumerate( self.pending ):
+            if future is not None:
+                future.cancel()
+                self.release( slot, future )
+        if self.buffers:
+            buffers = (_types.GLuint * len(self.buffers))( *self.buffers )
+            self.buffers = []
+            try:
+                GL_1_5.glDeleteBuffers( len(buffers), buffers )
+            except (AttributeError, error.NullFunctionError) as err:
+                pass
@@ -0,0 +1,414 @@
+"""Cached introspection of linked shader programs
+
+Introspecting a program through glGetActiveUniform/glGetActiveAttrib
+costs several driver round trips per variable (each call re-queries
+the maximum name length and the variable count).  ProgramReflection
+instead describes every active uniform, vertex attribute, uniform
+block and shader storage block of a linked program in one pass, and
+ShaderProgram.reflection() caches the result with the program:
+
+    program = shaders.compileProgram( vertex, fragment )
+    reflection = program.reflection()
+    for uniform in reflection.uniforms:
+        print( uniform.name, uniform.location, uniform.type )
+    mvp = reflection.uniform( 'u_mvp' )
+
+With OpenGL 4.3 (or GL_ARB_program_interface_query) each resource is
+described by one glGetProgramResourceiv call fetching every property
+plus one glGetProgramResourceName call.  Older contexts fall back to
+the glGetActive* queries (with the counts and name lengths fetched
+once per program), and report no storage blocks or buffer variables.
+
+Properties which do not apply to a variable (the offset of a uniform
+in the default block, the location of a block member...) are -1, as
+OpenGL reports them.
+"""
+
+import ctypes
+from OpenGL._bytes import as_8_bit, unicode
+from OpenGL.raw.GL import _types
+from OpenGL.raw.GL.VERSION import GL_2_0, GL_3_1, GL_4_3
+from OpenGL.GL.ARB import program_interface_query, uniform_buffer_object
+
+__all__ = ('ProgramReflection', 'ProgramVariable', 'ProgramBlock')
+
+VARIABLE_PROPERTIES = (
+    GL_4_3.GL_LOCATION,
+    GL_4_3.GL_TYPE,
+    GL_4_3.GL_ARRAY_SIZE,
+    GL_4_3.GL_OFFSET,
+    GL_4_3.GL_BLOCK_INDEX,
+    GL_4_3.GL_ARRAY_STRIDE,
+    GL_4_3.GL_MATRIX_STRIDE,
+)
+ATTRIBUTE_PROPERTIES = (
+    GL_4_3.GL_LOCATION,
+    GL_4_3.GL_TYPE,
+    GL_4_3.GL_ARRAY_SIZE,
+)
+BUFFER_VARIABLE_PROPERTIES = (
+    GL_4_3.GL_TYPE,
+    GL_4_3.GL_ARRAY_SIZE,
+    GL_4_3.GL_OFFSET,
+    GL_4_3.GL_BLOCK_INDEX,
+    GL_4_3.GL_ARRAY_STRIDE,
+    GL_4_3.GL_MATRIX_STRIDE,
+)
+BLOCK_PROPERTIES = (
+    GL_4_3.GL_BUFFER_BINDING,
+    GL_4_3.GL_BUFFER_DATA_SIZE,
+    GL_4_3.GL_NUM_ACTIVE_VARIABLES,
+)
+
+
+class ProgramVariable(object):
+    """Description of one active uniform, attribute or buffer variable
+
+    name -- the name reported by OpenGL (arrays end in [0])
+    index -- index of the variable within its interface
+    location -- uniform/attribute location, -1 for block members
+    type -- type constant (GL_FLOAT_MAT4 and the like)
+    size -- number of array elements (1 for non-arrays)
+    offset, blockIndex, arrayStride, matrixStride -- layout within
+        the variable's block, -1 outside of blocks
+    """
+
+    __slots__ = (
+        'name',
+        'index',
+        'location',
+        'type',
+        'size',
+        'offset',
+        'blockIndex',
+        'arrayStride',
+        'matrixStride',
+    )
+
+    def __init__(
+        self,
+        name,
+        index,
+        location=-1,
+        type=0,
+        size=1,
+        offset=-1,
+        blockIndex=-1,
+        arrayStride=-1,
+        matrixStride=-1,
+    ):
+        self.name = name
+        self.index = index
+        self.location = location
+        self.type = type
+        self.size = size
+        self.offset = offset
+        self.blockIndex = blockIndex
+        self.arrayStride = arrayStride
+        self.matrixStride = matrixStride
+
+    def __repr__(self):
+        return '%s( %r, location=%s, type=%r, size=%s, offset=%s )' % (
+            self.__class__.__name__,
+            self.name,
+            self.location,
+            self.type,
+            self.size,
+            self.offset,
+        )
+
+
+class ProgramBlock(object):
+    """Description of one active uniform or shader storage block
+
+    name -- the block name reported by OpenGL
+    index -- block index (for glUniformBlockBinding and the like)
+    binding -- buffer binding point currently assigned to the block
+    dataSize -- minimum size in bytes of a buffer backing the block
+    variables -- tuple of the block's ProgramVariables
+    """
+
+    __slots__ = ('name', 'index', 'binding', 'dataSize', 'variables')
+
+    def __init__(self, name, index, binding=0, dataSize=0, variables=()):
+        self.name = name
+        self.index = index
+        self.binding = binding
+        self.dataSize = dataSize
+        self.variables = variables
+
+    def __repr__(self):
+        return '%s( %r, index=%s, binding=%s, dataSize=%s, variables=%s )' % (
+            self.__class__.__name__,
+            self.name,
+            self.index,
+            self.binding,
+            self.dataSize,
+            len(self.variables),
+        )
+
+
+def _key(name):
+    """Normalise a lookup name (str or bytes, with or without [0])"""
+    if not isinstance(name, unicode):
+        name = as_8_bit(name).decode('utf-8')
+    if name.endswith('[0]'):
+        name = name[:-3]
+    return name
+
+
+def _index(records):
+    """Build {name: record} for records, also keyed by array base names"""
+    result = {}
+    for record in records:
+        result[_key(record.name)] = record
+        result.setdefault(record.name, record)
+    return result
+
+
+def interfaceQuerySupported():
+    """Check whether the context supports glGetProgramResourceiv"""
+    return bool(program_interface_query.glInitProgramInterfaceQueryARB())
+
+
+class ProgramReflection(object):
+    """Active uniforms, attributes and blocks of a linked program
+
+    Attributes (tuples in index order):
+
+        uniforms -- ProgramVariable for each active uniform, including
+            the members of uniform blocks
+        attributes -- ProgramVariable for each active program input
+            (vertex attribute)
+        uniformBlocks -- ProgramBlock for each active uniform block
+        storageBlocks -- ProgramBlock for each active shader storage block
+        bufferVariables -- ProgramVariable for each member of a shader
+            storage block
+        interfaceQuery -- whether glGetProgramResourceiv was used
+
+    The reflection describes the program as linked, it must be rebuilt
+    (see ShaderProgram.reflection) if the program is re-linked.
+    """
+
+    def __init__(self, program, interfaceQuery=None):
+        """Query the description of program
+
+        interfaceQuery -- if None, use glGetProgramResourceiv when the
+            context supports it, otherwise force (True) or prevent
+            (False) its use
+        """
+        self.program = int(program)
+        if interfaceQuery is None:
+            interfaceQuery = interfaceQuerySupported()
+        self.interfaceQuery = bool(interfaceQuery)
+        if self.interfaceQuery:
+            self._queryInterfaces()
+        else:
+            self._queryActive()
+        self._uniforms = _index(self.uniforms)
+        self._attributes = _index(self.attributes)
+        self._uniformBlocks = _index(self.uniformBlocks)
+        self._storageBlocks = _index(self.storageBlocks)
+
+    def uniform(self, name):
+        """Retrieve the ProgramVariable for uniform name (KeyError if inactive)"""
+        return self._uniforms[_key(name)]
+
+    def attribute(self, name):
+        """Retrieve the ProgramVariable for attribute name (KeyError if inactive)"""
+        return self._attributes[_key(name)]
+
+    def uniformBlock(self, name):
+        """Retrieve the ProgramBlock for uniform block name (KeyError if inactive)"""
+        return self._uniformBlocks[_key(name)]
+
+    def storageBlock(self, name):
+        """Retrieve the ProgramBlock for storage block name (KeyError if inactive)"""
+        return self._storageBlocks[_key(name)]
+
+    def __repr__(self):
+        return (
+            '%s( %s: %s uniforms, %s attributes, %s uniform blocks, %s storage blocks )'
+            % (
+                self.__class__.__name__,
+                self.program,
+                len(self.uniforms),
+                len(self.attributes),
+                len(self.uniformBlocks),
+                len(self.storageBlocks),
+            )
+        )
+
+    # GL 4.3 program interface query
+    def _resources(self, interface, properties):
+        """Yield (index, name, [value, ...]) for each resource of interface"""
+        program = self.program
+        count = _types.GLint(0)
+        GL_4_3.glGetProgramInterfaceiv(
+            program, interface, GL_4_3.GL_ACTIVE_RESOURCES, count
+        )
+        if not count.value:
+            return
+        nameLength = _types.GLint(0)
+        GL_4_3.glGetProgramInterfaceiv(
+            program, interface, GL_4_3.GL_MAX_NAME_LENGTH, nameLength
+        )
+        name = ctypes.create_string_buffer(max(nameLength.value, 1))
+        props = (_types.GLenum * len(properties))(*properties)
+        values = (_types.GLint * len(properties))()
+        length = _types.GLsizei(0)
+        for index in range(count.value):
+            GL_4_3.glGetProgramResourceName(
+                program, interface, index, len(name), length, name
+            )
+            resourceName = name.raw[: length.value].decode('utf-8')
+            GL_4_3.glGetProgramResourceiv(
+                program,
+                interface,
+                index,
+                len(props),
+                props,
+                len(values),
+                length,
+                values,
+            )
+            yield index, resourceName, list(values)
+
+    def _blocks(self, interface, members):
+        """Describe the blocks of interface, members are the block variables"""
+        program = self.program
+        result = []
+        for index, name, (binding, dataSize, count) in self._resources(
+            interface, BLOCK_PROPERTIES
+        ):
+            variables = ()
+            if count:
+                prop = _types.GLenum(GL_4_3.GL_ACTIVE_VARIABLES)
+                indices = (_types.GLint * count)()
+                length = _types.GLsizei(0)
+                GL_4_3.glGetProgramResourceiv(
+                    program, interface, index, 1, prop, count, length, indices
+                )
+                variables = tuple(members[i] for i in indices[: length.value])
+            result.append(ProgramBlock(name, index, binding, dataSize, variables))
+        return tuple(result)
+
+    def _queryInterfaces(self):
+        """Describe the program with glGetProgramResourceiv"""
+        self.uniforms = tuple(
+            ProgramVariable(name, index, *values)
+            for index, name, values in self._resources(
+                GL_4_3.GL_UNIFORM, VARIABLE_PROPERTIES
+            )
+        )
+        self.attributes = tuple(
+            ProgramVariable(name, index, *values)
+            for index, name, values in self._resources(
+                GL_4_3.GL_PROGRAM_INPUT, ATTRIBUTE_PROPERTIES
+            )
+        )
+        self.bufferVariables = tuple(
+            ProgramVariable(name, index, -1, *values)
+            for index, name, values in self._resources(
+                GL_4_3.GL_BUFFER_VARIABLE, BUFFER_VARIABLE_PROPERTIES
+            )
+        )
+        self.uniformBlocks = self._blocks(GL_4_3.GL_UNIFORM_BLOCK, self.uniforms)
+        self.storageBlocks = self._blocks(
+            GL_4_3.GL_SHADER_STORAGE_BLOCK, self.bufferVariables
+        )
+
+    # GL 2.0/3.1 fallback
+    def _programiv(self, pname):
+        value = _types.GLint(0)
+        GL_2_0.glGetProgramiv(self.program, pname, value)
+        return value.value
+
+    def _active(self, function, countName, lengthName, locate):
+        """Describe active variables with glGetActiveUniform/glGetActiveAttrib"""
+        program = self.program
+        count = self._programiv(countName)
+        name = ctypes.create_string_buffer(max(self._programiv(lengthName), 1))
+        length = _types.GLsizei(0)
+        size = _types.GLint(0)
+        type = _types.GLenum(0)
+        result = []
+        for index in range(count):
+            function(program, index, len(name), length, size, type, name)
+            raw = name.raw[: length.value]
+            result.append(
+                ProgramVariable(
+                    raw.decode('utf-8'),
+                    index,
+                    locate(program, raw + b'\000'),
+                    type.value,
+                    size.value,
+                )
+            )
+        return result
+
+    def _queryActive(self):
+        """Describe the program with the GL 2.0 (and 3.1) glGetActive* queries"""
+        program = self.program
+        uniforms = self._active(
+            GL_2_0.glGetActiveUniform,
+            GL_2_0.GL_ACTIVE_UNIFORMS,
+            GL_2_0.GL_ACTIVE_UNIFORM_MAX_LENGTH,
+            GL_2_0.glGetUniformLocation,
+        )
+        self.attributes = tuple(
+            self._active(
+                GL_2_0.glGetActiveAttrib,
+                GL_2_0.GL_ACTIVE_ATTRIBUTES,
+                GL_2_0.GL_ACTIVE_ATTRIBUTE_MAX_LENGTH,
+                GL_2_0.glGetAttribLocation,
+            )
+        )
+        self.uniformBlocks = ()
+        self.storageBlocks = ()
+        self.bufferVariables = ()
+        if not (uniform_buffer_object.glInitUniformBufferObjectARB() and uniforms):
+            self.uniforms = tuple(uniforms)
+            return
+        indices = (_types.GLuint * len(uniforms))(*range(len(uniforms)))
+        values = (_types.GLint * len(uniforms))()
+        for pname, attribute in (
+            (GL_3_1.GL_UNIFORM_OFFSET, 'offset'),
+            (GL_3_1.GL_UNIFORM_BLOCK_INDEX, 'blockIndex'),
+            (GL_3_1.GL_UNIFORM_ARRAY_STRIDE, 'arrayStride'),
+            (GL_3_1.GL_UNIFORM_MATRIX_STRIDE, 'matrixStride'),
+        ):
+            GL_3_1.glGetActiveUniformsiv(program, len(uniforms), indices, pname, values)
+            for uniform, value in zip(uniforms, values):
+                setattr(uniform, attribute, value)
+        self.uniforms = tuple(uniforms)
+        count = self._programiv(GL_3_1.GL_ACTIVE_UNIFORM_BLOCKS)
+        if not count:
+            return
+        name = ctypes.create_string_buffer(
+            max(self._programiv(GL_3_1.GL_ACTIVE_UNIFORM_BLOCK_MAX_NAME_LENGTH), 1)
+        )
+        length = _types.GLsizei(0)
+        value = _types.GLint(0)
+        blocks = []
+        for index in range(count):
+            GL_3_1.glGetActiveUniformBlockName(program, index, len(name), length, name)
+            properties = []
+            for pname in (
+                GL_3_1.GL_UNIFORM_BLOCK_BINDING,
+                GL_3_1.GL_UNIFORM_BLOCK_DATA_SIZE,
+            ):
+                GL_3_1.glGetActiveUniformBlockiv(program, index, pname, value)
+                properties.append(value.value)
+            blocks.append(
+                ProgramBlock(
+                    name.raw[: length.value].decode('utf-8'),
+                    index,
+                    properties[0],
+                    properties[1],
+                    tuple(
+                        uniform for uniform in uniforms if uniform.blockIndex == index
+                    ),
+                )
+            )
+        self.uniformBlocks = tuple(blocks)
@@ -8,13 +8,26 @@ shader rendering.
 There are also two utility methods compileProgram and compileShader
 which make it easy to create demos which are shader-using.
 """
-import logging
+import hashlib, logging, os, struct, tempfile
+try:
+    from concurrent import futures
+except ImportError as err:
+    # Python 2 without the "futures" backport, see compileProgramsAsync
+    futures = None
 log = logging.getLogger( __name__ )
 from OpenGL import GL
 from OpenGL.GL.ARB import (
     shader_objects, fragment_shader, vertex_shader, vertex_program,
     geometry_shader4, separate_shader_objects, get_program_binary,
+    parallel_shader_compile as arb_parallel_shader_compile,
 )
+from OpenGL.GL.KHR import parallel_shader_compile
+from OpenGL.GL.reflection import ProgramReflection
+from OpenGL.raw.GL.VERSION import (
+    GL_2_0 as _GL_2_0, GL_2_1 as _GL_2_1, GL_3_0 as _GL_3_0,
+    GL_4_0 as _GL_4_0, GL_4_1 as _GL_4_1,
+)
+from OpenGL import arrays
 from OpenGL.extensions import alternate
 from OpenGL._bytes import bytes,unicode,as_8_bit
 
@@ -27,11 +40,18 @@ __all__ = [
     'glGetShaderiv',
     'compileProgram',
     'compileShader',
+    'compileProgramsAsync',
+    'ProgramFuture',
     'GL_VALIDATE_STATUS',
     'GL_LINK_STATUS',
     'ShaderCompilationError', 
     'ShaderValidationError', 
     'ShaderLinkError',
+    'ShaderProgram',
+    'ProgramCache',
+    'ProgramReflection',
+    'UniformSetter',
+    'uniformSetter',
     # automatically added stuff here...
 ]
 
@@ -80,15 +100,127 @@ glGetShaderInfoLog = alternate( GL.glGetShaderInfoLog, shader_objects.glGetInfoL
 glGetShaderiv = alternate( GL.glGetShaderiv, shader_objects.glGetObjectParameterivARB )
 glGetProgramiv = alternate( GL.glGetProgramiv, shader_objects.glGetObjectParameterivARB )
 
+glMaxShaderCompilerThreads = alternate(
+    parallel_shader_compile.glMaxShaderCompilerThreadsKHR,
+    arb_parallel_shader_compile.glMaxShaderCompilerThreadsARB,
+)
+
 GL_VALIDATE_STATUS = GL.GL_VALIDATE_STATUS
 GL_COMPILE_STATUS = GL.GL_COMPILE_STATUS
 GL_LINK_STATUS = GL.GL_LINK_STATUS
 GL_FALSE = GL.GL_FALSE
 GL_TRUE = GL.GL_TRUE
 
+class UniformSetter( object ):
+    """Uploads values for one uniform type via the raw glUniform*/glProgramUniform* entry point
+
+    function -- raw entry point, a glProgramUniform* variant if separate
+    arrayType -- array data type used to convert values
+    components -- number of values per uniform element
+    matrix -- whether function takes a transpose argument
+    separate -- whether function takes the program (glProgramUniform*)
+    """
+    __slots__ = ('function','arrayType','components','matrix','separate')
+    def __init__( self, function, arrayType, components, matrix=False, separate=False ):
+        self.function = function
+        self.arrayType = arrayType
+        self.components = components
+        self.matrix = matrix
+        self.separate = separate
+    def __call__( self, program, location, value, transpose=False ):
+        """Convert value and upload it as the uniform at location"""
+        value = self.arrayType.asArray( value )
+        count, extra = divmod( self.arrayType.arraySize( value ), self.components )
+        if extra or not count:
+            raise ValueError(
+                """Uniform requires a multiple of %s values, got %s"""%(
+                    self.components, self.arrayType.arraySize( value ),
+                )
+            )
+        if self.matrix:
+            args = (location, count, bool(transpose), value)
+        else:
+            args = (location, count, value)
+        if self.separate:
+            return self.function( program, *args )
+        return self.function( *args )
+
+# uniform type constant: (entry point suffix, array type, components)
+UNIFORM_TYPES = {
+    GL.GL_FLOAT: ('1fv', arrays.GLfloatArray, 1),
+    GL.GL_FLOAT_VEC2: ('2fv', arrays.GLfloatArray, 2),
+    GL.GL_FLOAT_VEC3: ('3fv', arrays.GLfloatArray, 3),
+    GL.GL_FLOAT_VEC4: ('4fv', arrays.GLfloatArray, 4),
+    GL.GL_INT: ('1iv', arrays.GLintArray, 1),
+    GL.GL_INT_VEC2: ('2iv', arrays.GLintArray, 2),
+    GL.GL_INT_VEC3: ('3iv', arrays.GLintArray, 3),
+    GL.GL_INT_VEC4: ('4iv', arrays.GLintArray, 4),
+    GL.GL_BOOL: ('1iv', arrays.GLintArray, 1),
+    GL.GL_BOOL_VEC2: ('2iv', arrays.GLintArray, 2),
+    GL.GL_BOOL_VEC3: ('3iv', arrays.GLintArray, 3),
+    GL.GL_BOOL_VEC4: ('4iv', arrays.GLintArray, 4),
+    GL.GL_UNSIGNED_INT: ('1uiv', arrays.GLuintArray, 1),
+    GL.GL_UNSIGNED_INT_VEC2: ('2uiv', arrays.GLuintArray, 2),
+    GL.GL_UNSIGNED_INT_VEC3: ('3uiv', arrays.GLuintArray, 3),
+    GL.GL_UNSIGNED_INT_VEC4: ('4uiv', arrays.GLuintArray, 4),
+    GL.GL_DOUBLE: ('1dv', arrays.GLdoubleArray, 1),
+    GL.GL_DOUBLE_VEC2: ('2dv', arrays.GLdoubleArray, 2),
+    GL.GL_DOUBLE_VEC3: ('3dv', arrays.GLdoubleArray, 3),
+    GL.GL_DOUBLE_VEC4: ('4dv', arrays.GLdoubleArray, 4),
+    GL.GL_FLOAT_MAT2: ('Matrix2fv', arrays.GLfloatArray, 4),
+    GL.GL_FLOAT_MAT3: ('Matrix3fv', arrays.GLfloatArray, 9),
+    GL.GL_FLOAT_MAT4: ('Matrix4fv', arrays.GLfloatArray, 16),
+    GL.GL_FLOAT_MAT2x3: ('Matrix2x3fv', arrays.GLfloatArray, 6),
+    GL.GL_FLOAT_MAT2x4: ('Matrix2x4fv', arrays.GLfloatArray, 8),
+    GL.GL_FLOAT_MAT3x2: ('Matrix3x2fv', arrays.GLfloatArray, 6),
+    GL.GL_FLOAT_MAT3x4: ('Matrix3x4fv', arrays.GLfloatArray, 12),
+    GL.GL_FLOAT_MAT4x2: ('Matrix4x2fv', arrays.GLfloatArray, 8),
+    GL.GL_FLOAT_MAT4x3: ('Matrix4x3fv', arrays.GLfloatArray, 12),
+    GL.GL_DOUBLE_MAT2: ('Matrix2dv', arrays.GLdoubleArray, 4),
+    GL.GL_DOUBLE_MAT3: ('Matrix3dv', arrays.GLdoubleArray, 9),
+    GL.GL_DOUBLE_MAT4: ('Matrix4dv', arrays.GLdoubleArray, 16),
+    GL.GL_DOUBLE_MAT2x3: ('Matrix2x3dv', arrays.GLdoubleArray, 6),
+    GL.GL_DOUBLE_MAT2x4: ('Matrix2x4dv', arrays.GLdoubleArray, 8),
+    GL.GL_DOUBLE_MAT3x2: ('Matrix3x2dv', arrays.GLdoubleArray, 6),
+    GL.GL_DOUBLE_MAT3x4: ('Matrix3x4dv', arrays.GLdoubleArray, 12),
+    GL.GL_DOUBLE_MAT4x2: ('Matrix4x2dv', arrays.GLdoubleArray, 8),
+    GL.GL_DOUBLE_MAT4x3: ('Matrix4x3dv', arrays.GLdoubleArray, 12),
+}
+# samplers, images and the like are set by (texture/image) unit
+DEFAULT_UNIFORM_TYPE = ('1iv', arrays.GLintArray, 1)
+_UNIFORM_SETTERS = {}
+
+def uniformSetter( type, separate=False ):
+    """Retrieve the (shared) UniformSetter for uniform type constant
+    
+    separate -- if True use the glProgramUniform* entry points, which 
+        do not require the program to be in use
+    """
+    key = (type, bool(separate))
+    setter = _UNIFORM_SETTERS.get( key )
+    if setter is None:
+        suffix, arrayType, components = UNIFORM_TYPES.get( type, DEFAULT_UNIFORM_TYPE )
+        name = ('glProgramUniform' if separate else 'glUniform') + suffix
+        function = None
+        for module in (_GL_2_0, _GL_2_1, _GL_3_0, _GL_4_0, _GL_4_1):
+            function = getattr( module, name, None )
+            if function is not None:
+                break
+        setter = _UNIFORM_SETTERS[key] = UniformSetter(
+            function, arrayType, components, 
+            matrix=suffix.startswith( 'Matrix' ), separate=separate,
+        )
+    return setter
+
+def _separateUniforms( ):
+    """Check whether glProgramUniform* (GL 4.1/ARB_separate_shader_objects) is available"""
+    return bool( separate_shader_objects.glInitSeparateShaderObjectsARB() )
+
 class ShaderProgram( int ):
     """Integer sub-class with context-manager operation"""
     validated = False
+    _reflection = None
+    _uniforms = None
     def __enter__( self ):
         """Start use of the program"""
         glUseProgram( self )
@@ -138,30 +270,238 @@ class ShaderProgram( int ):
         returns (format,binaryData) for the shader program
         """
         from OpenGL.raw.GL._types import GLint,GLenum 
-        from OpenGL.arrays import GLbyteArray
+        from OpenGL.arrays import GLubyteArray
         size = GLint()
         glGetProgramiv( self, get_program_binary.GL_PROGRAM_BINARY_LENGTH, size )
-        result = GLbyteArray.zeros( (size.value,))
+        # must match the wrapper's output type, otherwise the driver
+        # fills a converted copy rather than our result array
+        result = GLubyteArray.zeros( (size.value,))
         size2 = GLint()
         format = GLenum()
         get_program_binary.glGetProgramBinary( self, size.value, size2, format, result )
-        return format.value, result 
+        if size2.value < size.value:
+            result = result[:size2.value]
+        return format.value, result
     def load( self, format, binary, validate=True ):
         """Attempt to load binary-format for a pre-compiled shader
         
         See notes in retrieve
         """
         get_program_binary.glProgramBinary( self, format, binary, len(binary))
+        self._reflection = None
+        self._uniforms = None
         if validate:
             self.check_validate()
         self.check_linked()
         return self
+    def reflection( self, refresh=False ):
+        """Retrieve the (cached) ProgramReflection for this linked program
+        
+        The reflection is queried on first use and kept with the 
+        program; pass refresh=True after re-linking the program 
+        (load() discards it automatically).
+        
+        returns OpenGL.GL.reflection.ProgramReflection
+        """
+        if refresh or self._reflection is None:
+            self._reflection = ProgramReflection( self )
+            self._uniforms = None
+        return self._reflection
+    def _uniform( self, name ):
+        """Resolve and cache (location, UniformSetter) for uniform name"""
+        reflection = self.reflection()
+        if self._uniforms is None:
+            self._uniforms = {}
+        try:
+            variable = reflection.uniform( name )
+        except KeyError:
+            variable = None
+        key = name
+        if variable is not None and (
+            as_8_bit( name ) == as_8_bit( variable.name ) or 
+            as_8_bit( name ) + b'[0]' == as_8_bit( variable.name )
+        ):
+            location = variable.location
+        else:
+            # element (u_lights[2]) of an array uniform
+            base = as_8_bit( name ).rsplit( b'[', 1 )[0]
+            try:
+                variable = reflection.uniform( base )
+            except KeyError:
+                variable = None
+            location = glGetUniformLocation( self, name )
+        if variable is None or location == -1:
+            entry = (-1, None)
+        else:
+            entry = (location, uniformSetter( variable.type, separate=_separateUniforms() ))
+        self._uniforms[key] = entry
+        return entry
+    def uniformLocation( self, name ):
+        """Retrieve the (cached) location of uniform name, -1 if inactive
+        
+        Locations of every active uniform come from the program's 
+        reflection, array elements (u_lights[2]) are looked up with 
+        glGetUniformLocation once and then cached.
+        """
+        uniforms = self._uniforms
+        entry = uniforms.get( name ) if uniforms is not None else None
+        if entry is None:
+            entry = self._uniform( name )
+        return entry[0]
+    def set( self, name, value, transpose=False ):
+        """Set uniform name to value using the entry point for its reflected type
+        
+        value -- anything convertible to an array of the uniform's 
+            base type (float, int, unsigned int or double), holding a 
+            whole number of elements (e.g. 16 floats per mat4), arrays 
+            of uniforms may be set with several elements at once
+        transpose -- for matrix uniforms, whether value is row-major
+        
+        Uses glProgramUniform* where available (OpenGL 4.1 or 
+        GL_ARB_separate_shader_objects), otherwise glUniform*, which 
+        requires this program to be in use.  Samplers and images are 
+        set with integer (unit) values.  As with glUniform* and a 
+        location of -1, setting an inactive uniform does nothing.
+        """
+        uniforms = self._uniforms
+        entry = uniforms.get( name ) if uniforms is not None else None
+        if entry is None:
+            entry = self._uniform( name )
+        location, setter = entry
+        if setter is not None:
+            setter( self, location, value, transpose )
+
+class ProgramCache( object ):
+    """On-disk cache of linked program binaries (GL_ARB_get_program_binary)
+
+    Entries are keyed by a hash of the shader sources and types, the
+    GL_RENDERER and GL_VERSION strings and the link flags, so a driver
+    upgrade or a different GPU simply misses the cache.  Each entry is
+    a single file holding the binary format and the binary itself.
+
+    Program binaries are *not* portable, the cache is only intended to
+    avoid compile/link overhead for the same program on the same
+    machine.  Pass an instance (or a directory name, or True for the
+    default directory) as the cache argument of compileProgram.
+    """
+    MAGIC = b'PYOGLPB1'
+    HEADER = struct.Struct( '<8sI' )
+    def __init__( self, directory=None ):
+        """Initialise the cache
+
+        directory -- directory in which to store binaries, defaults to
+            $PYOPENGL_PROGRAM_CACHE_DIR or ~/.cache/pyopengl/programs
+        """
+        if directory is None:
+            directory = self.defaultDirectory()
+        self.directory = directory
+    @staticmethod
+    def defaultDirectory( ):
+        """Retrieve the default program cache directory"""
+        return os.environ.get( 'PYOPENGL_PROGRAM_CACHE_DIR' ) or os.path.join(
+            os.path.expanduser( '~' ), '.cache', 'pyopengl', 'programs',
+        )
+    def key( self, sources, flags=() ):
+        """Calculate the cache key for the given sources and link flags
+
+        sources -- sequence of (shaderType, source) where source is a
+            bytes object or sequence of bytes objects
+        flags -- sequence of (name, value) link flags
+
+        returns hexadecimal digest
+        """
+        digest = hashlib.sha256()
+        for constant in (GL.GL_RENDERER, GL.GL_VERSION):
+            digest.update( as_8_bit( GL.glGetString( constant ) or b'' ) )
+            digest.update( b'\0' )
+        for name, value in sorted( flags ):
+            digest.update( as_8_bit( '%s=%r;'%( name, value ) ) )
+        for shaderType, source in sources:
+            if isinstance( source, (bytes,unicode) ):
+                source = [ source ]
+            digest.update( as_8_bit( '\0%d:%d\0'%( int(shaderType), len(source) ) ) )
+            for segment in source:
+                digest.update( as_8_bit( segment ) )
+                digest.update( b'\0' )
+        return digest.hexdigest()
+    def filename( self, key ):
+        """Retrieve the filename in which key is stored"""
+        return os.path.join( self.directory, '%s.bin'%( key, ) )
+    def get( self, key ):
+        """Retrieve (format, binary) for key or None if not cached"""
+        try:
+            with open( self.filename( key ), 'rb' ) as fh:
+                data = fh.read()
+        except (IOError, OSError):
+            return None
+        if len(data) < self.HEADER.size:
+            return None
+        magic, format = self.HEADER.unpack_from( data )
+        if magic != self.MAGIC:
+            return None
+        return format, data[self.HEADER.size:]
+    def set( self, key, format, binary ):
+        """Store (format, binary) for key, returns success"""
+        try:
+            if not os.path.isdir( self.directory ):
+                os.makedirs( self.directory )
+            # write-then-rename so concurrent processes never see partial files
+            handle, temporary = tempfile.mkstemp( dir=self.directory, suffix='.tmp' )
+            with os.fdopen( handle, 'wb' ) as fh:
+                fh.write( self.HEADER.pack( self.MAGIC, format ) )
+                fh.write( bytes( bytearray( binary ) ) )
+            os.replace( temporary, self.filename( key ) )
+        except (IOError, OSError) as err:
+            log.info( 'Unable to store program binary %s: %s', key, err )
+            return False
+        return True
+    def discard( self, key ):
+        """Remove the entry for key (e.g. after a format mismatch)"""
+        try:
+            os.remove( self.filename( key ) )
+        except (IOError, OSError):
+            return False
+        return True
+
+def _programCache( cache ):
+    """Coerce compileProgram's cache argument to a ProgramCache (or None)"""
+    if not cache:
+        return None
+    if cache is True:
+        return ProgramCache()
+    if isinstance( cache, ProgramCache ):
+        return cache
+    return ProgramCache( cache )
+
+def _binariesSupported( ):
+    """Check whether the context can load and retrieve program binaries"""
+    if not get_program_binary.glProgramBinary:
+        return False
+    try:
+        return GL.glGetIntegerv( get_program_binary.GL_NUM_PROGRAM_BINARY_FORMATS ) > 0
+    except GL.GLError:
+        return False
+
+def _shaderSources( shaders ):
+    """Retrieve (shaderType, source) for each shader (compiled or source-tuple)"""
+    result = []
+    for shader in shaders:
+        if isinstance( shader, tuple ):
+            result.append( (shader[1], shader[0]) )
+        else:
+            result.append( (
+                glGetShaderiv( shader, GL.GL_SHADER_TYPE ),
+                glGetShaderSource( shader ),
+            ))
+    return result
 
 def compileProgram(*shaders, **named):
     """Create a new program, attach shaders and validate
 
     shaders -- arbitrary number of shaders to attach to the
-        generated program.
+        generated program.  Each is either a compiled shader
+        reference (see compileShader) or a (source, shaderType)
+        tuple which will be compiled only if required.
     separable (keyword only) -- set the separable flag to allow 
         for partial installation of shader into the pipeline (see 
         glUseProgramStages)
@@ -174,6 +514,12 @@ def compileProgram(*shaders, **named):
         function is *not* really intended for advanced usage,
         if you're finding yourself specifying this flag you 
         likely should be using your own shader management code.
+    cache (keyword only) -- ProgramCache instance, directory name or 
+        True (default directory) enabling the on-disk program binary 
+        cache.  On a hit the linked binary is loaded (and source-tuple 
+        shaders are never compiled), if the driver rejects the binary 
+        the entry is discarded and the program is built from source.
+        Ignored when GL_ARB_get_program_binary is unavailable.
 
     This convenience function is *not* standard OpenGL,
     but it does wind up being fairly useful for demos
@@ -198,10 +544,40 @@ def compileProgram(*shaders, **named):
         ShaderCompilationError, ShaderValidationError, ShaderLinkError,
     } when a link/validation failure occurs
     """
+    cache = _programCache( named.get('cache') )
+    if cache is not None and not _binariesSupported():
+        cache = None
+    key = None
+    if cache is not None:
+        key = cache.key( _shaderSources( shaders ), [
+            ('separable', bool(named.get('separable'))),
+        ])
+        entry = cache.get( key )
+        if entry is not None:
+            program = ShaderProgram( glCreateProgram() )
+            if named.get('separable'):
+                glProgramParameteri( program, separate_shader_objects.GL_PROGRAM_SEPARABLE, GL_TRUE )
+            try:
+                program.load( entry[0], entry[1], validate=False )
+            except (ShaderLinkError, GL.GLError) as err:
+                log.info( 'Discarding cached program binary %s: %s', key, err )
+                GL.glDeleteProgram( program )
+                cache.discard( key )
+            else:
+                if named.get('validate', True):
+                    program.check_validate()
+                for shader in shaders:
+                    if not isinstance( shader, tuple ):
+                        glDeleteShader(shader)
+                return program
+    shaders = [
+        compileShader( *shader ) if isinstance( shader, tuple ) else shader
+        for shader in shaders
+    ]
     program = glCreateProgram()
     if named.get('separable'):
         glProgramParameteri( program, separate_shader_objects.GL_PROGRAM_SEPARABLE, GL_TRUE )
-    if named.get('retrievable'):
+    if named.get('retrievable') or cache is not None:
         glProgramParameteri( program, get_program_binary.GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE )
     for shader in shaders:
         glAttachShader(program, shader)
@@ -210,6 +586,10 @@ def compileProgram(*shaders, **named):
     if named.get('validate', True):
         program.check_validate()
     program.check_linked()
+    if cache is not None:
+        format, binary = program.retrieve()
+        if len(binary):
+            cache.set( key, format, binary )
     for shader in shaders:
         glDeleteShader(shader)
     return program
@@ -222,12 +602,22 @@ def compileShader( source, shaderType ):
     returns GLuint compiled shader reference
     raises RuntimeError when a compilation failure occurs
     """
+    shader, source = _submitShader( source, shaderType )
+    return _checkShader( shader, source, shaderType )
+def _submitShader( source, shaderType ):
+    """Create and start compilation of a shader without querying status
+
+    returns (shader, source) with source normalised to a list of bytes
+    """
     if isinstance( source, (bytes,unicode)):
         source = [ source ]
     source = [ as_8_bit(s) for s in source ]
     shader = glCreateShader(shaderType)
     glShaderSource( shader, source )
     glCompileShader( shader )
+    return shader, source
+def _checkShader( shader, source, shaderType ):
+    """Check compile status of shader, raising ShaderCompilationError on failure"""
     result = glGetShaderiv( shader, GL_COMPILE_STATUS )
     if not(result):
         # TODO: this will be wrong if the user has
@@ -242,6 +632,144 @@ def compileShader( source, shaderType ):
         )
     return shader
 
+def _parallelCompile( ):
+    """Check whether the context supports GL_COMPLETION_STATUS polling"""
+    return bool(
+        parallel_shader_compile.glInitParallelShaderCompileKHR() or
+        arb_parallel_shader_compile.glInitParallelShaderCompileARB()
+    )
+
+class ProgramFuture( futures.Future if futures is not None else object ):
+    """Future resolving to a ShaderProgram submitted by compileProgramsAsync
+
+    GL objects may only be queried from the thread which owns the
+    context, so unlike most futures this one is resolved by polling
+    from the rendering thread: done() checks GL_COMPLETION_STATUS_KHR
+    (without blocking) and resolves the future once the driver has
+    finished, while result()/exception() resolve immediately, blocking
+    in the driver if the link is still in progress.  Do not wait on
+    these futures from another thread (e.g. concurrent.futures.wait),
+    nothing would ever resolve them.
+
+    Without the parallel-compile extension done() resolves the future
+    on first call; status queries are still deferred until every
+    program has been submitted, so the driver may compile in the
+    background while the remaining programs are queued.
+
+    A cancelled future deletes its program and shaders the next time
+    it is polled or resolved (again, on the GL thread).
+    """
+    def __init__( self, program, shaders, named, poll=True ):
+        super( ProgramFuture, self ).__init__()
+        self.program = program
+        self.shaders = shaders
+        self.named = named
+        self.poll = poll
+    def ready( self ):
+        """Check (without blocking) whether the driver has finished the link"""
+        if not self.poll:
+            return True
+        status = GL.GLint( 0 )
+        glGetProgramiv( self.program, parallel_shader_compile.GL_COMPLETION_STATUS_KHR, status )
+        return bool( status.value )
+    def discard( self ):
+        """Delete the (unresolved) program and shaders, once"""
+        program, shaders, self.shaders = self.program, self.shaders, ()
+        if program is not None:
+            self.program = None
+            GL.glDeleteProgram( program )
+            for shader, source, shaderType in shaders:
+                glDeleteShader( shader )
+    def resolve( self ):
+        """Check compile/link status and set the future's result/exception"""
+        if self.cancelled():
+            self.discard()
+            return
+        if futures.Future.done( self ):
+            return
+        if not self.set_running_or_notify_cancel():
+            self.discard()
+            return
+        program, shaders, self.shaders = self.program, self.shaders, ()
+        try:
+            try:
+                for shader, source, shaderType in shaders:
+                    _checkShader( shader, source, shaderType )
+                program.check_linked()
+                if self.named.get('validate', True):
+                    program.check_validate()
+            except Exception:
+                GL.glDeleteProgram( program )
+                raise
+            finally:
+                for shader, source, shaderType in shaders:
+                    glDeleteShader( shader )
+        except Exception as err:
+            self.set_exception( err )
+        else:
+            self.set_result( program )
+    def done( self ):
+        """Poll the driver, resolving the future if it has completed"""
+        if self.cancelled():
+            self.discard()
+        elif not futures.Future.done( self ) and self.ready():
+            self.resolve()
+        return futures.Future.done( self )
+    def result( self, timeout=None ):
+        """Resolve (blocking in the driver if necessary) and return the ShaderProgram"""
+        self.resolve()
+        return super( ProgramFuture, self ).result( timeout )
+    def exception( self, timeout=None ):
+        """Resolve (blocking in the driver if necessary) and return any failure"""
+        self.resolve()
+        return super( ProgramFuture, self ).exception( timeout )
+
+def compileProgramsAsync( programs, **named ):
+    """Submit many programs for compilation, returning ProgramFuture instances
+
+    programs -- iterable of sequences of (source, shaderType) tuples,
+        each sequence producing a single linked program
+    threads (keyword only) -- if specified (and the parallel compile
+        extension is available) passed to glMaxShaderCompilerThreadsKHR
+        (or the ARB equivalent)
+    separable, validate (keyword only) -- as for compileProgram
+
+    Every shader is submitted and every program linked before any
+    status is queried, so drivers with background compiler threads
+    can work on all of them at once.  With GL_KHR_parallel_shader_compile
+    (or the ARB equivalent) ProgramFuture.done() polls
+    GL_COMPLETION_STATUS_KHR so a renderer can keep drawing while
+    programs finish.  Futures must be polled/resolved from the thread
+    which owns the GL context.
+
+    Requires concurrent.futures (the "futures" backport on Python 2).
+
+    returns [ ProgramFuture, ... ] in the same order as programs
+    """
+    if futures is None:
+        raise ImportError( """compileProgramsAsync requires concurrent.futures""" )
+    poll = _parallelCompile()
+    if poll and named.get('threads') is not None:
+        glMaxShaderCompilerThreads( named['threads'] )
+    submitted = []
+    for sources in programs:
+        submitted.append( [
+            _submitShader( source, shaderType ) + (shaderType,)
+            for (source, shaderType) in sources
+        ])
+    result = []
+    for shaders in submitted:
+        program = ShaderProgram( glCreateProgram() )
+        if named.get('separable'):
+            glProgramParameteri( program, separate_shader_objects.GL_PROGRAM_SEPARABLE, GL_TRUE )
+        if named.get('retrievable'):
+            glProgramParameteri( program, get_program_binary.GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE )
+        for shader, source, shaderType in shaders:
+            glAttachShader( program, shader )
+        glLinkProgram( program )
+        result.append( ProgramFuture( program, shaders, named, poll=poll ) )
+    return result
+
 class ShaderCompilationError(RuntimeError):
     """Raised when a shader compilation fails"""
 class ShaderValidationError(RuntimeError):
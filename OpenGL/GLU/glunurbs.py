@@ -24,6 +24,8 @@ __all__ = (
     'gluNurbsCurve',
     'gluNurbsSurface',
     'gluPwlCurve',
+    'gluEndCurve',
+    'gluEndSurface',
 )
 
 # /usr/include/GL/glu.h 242
@@ -169,11 +171,20 @@ def gluNewNurbsRenderer( baseFunction ):
 
 @_lazy( _simple.gluNurbsCallbackData )
 def gluNurbsCallbackData( baseFunction, nurb, userData ):
-    """Note the Python object for use as userData by the nurb"""
+    """Note the Python object for use as userData by the nurb (replacing any previous userData)"""
     return baseFunction(
-        nurb, nurb.noteObject( userData )
+        nurb, ctypes.c_void_p( nurb.noteUserData( userData ) )
     )
 
+def _retain( nurb, *objects ):
+    """Retain objects until the end of the curve/surface (raw pointers can't retain)"""
+    if isinstance( nurb, glustruct.GLUStruct ):
+        nurb.retain( *objects )
+def _releaseScope( nurb ):
+    """Release the curve/surface references of nurb"""
+    if isinstance( nurb, glustruct.GLUStruct ):
+        nurb.releaseScope()
+
 MAX_ORDER = 8
 def checkOrder( order,knotCount,name ):
     """Check that order is valid..."""
@@ -201,9 +212,9 @@ def checkKnots( knots, name ):
 
 @_lazy( _simple.gluNurbsCallbackDataEXT )
 def gluNurbsCallbackDataEXT( baseFunction,nurb, userData ):
-    """Note the Python object for use as userData by the nurb"""
+    """Note the Python object for use as userData by the nurb (replacing any previous userData)"""
     return baseFunction(
-        nurb, nurb.noteObject( userData )
+        nurb, ctypes.c_void_p( nurb.noteUserData( userData ) )
     )
 
 @_lazy( _simple.gluNurbsCurve )
@@ -223,6 +234,7 @@ def gluNurbsCurve( baseFunction, nurb, knots, control, type ):
     if _configflags.ERROR_CHECKING:
         checkOrder( order, knotCount, 'order of NURBS curve')
         checkKnots( knots, 'knots of NURBS curve')
+    _retain( nurb, knots, control )
     return baseFunction(
         nurb, knotCount, knots, step, control, order, type,
     )
@@ -261,6 +273,7 @@ def gluNurbsSurface( baseFunction, nurb, sKnots, tKnots, control, type ):
             type
         )
 
+    _retain( nurb, sKnots, tKnots, control )
     result = baseFunction(
         nurb, sKnotCount, sKnots, tKnotCount, tKnots,
         sStride, tStride, control,
@@ -285,4 +298,21 @@ def gluPwlCurve( baseFunction, nurb, data, type ):
         raise ValueError( """Unrecognised type constant: %s"""%(type))
     size = arrays.GLfloatArray.arraySize( data )
     size = int(size//divisor)
+    _retain( nurb, data )
     return baseFunction( nurb, size, data, divisor, type )
+
+@_lazy( _simple.gluEndCurve )
+def gluEndCurve( baseFunction, nurb ):
+    """Finish the curve (running the callbacks), then release its references"""
+    try:
+        return baseFunction( nurb )
+    finally:
+        _releaseScope( nurb )
+
+@_lazy( _simple.gluEndSurface )
+def gluEndSurface( baseFunction, nurb ):
+    """Finish the surface (running the callbacks), then release its references"""
+    try:
+        return baseFunction( nurb )
+    finally:
+        _releaseScope( nurb )
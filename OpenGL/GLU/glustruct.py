@@ -18,6 +18,13 @@ class GLUStruct( object ):
             like.
     Creates a dictionary member dataPointers if original-object-return is used
     Creates a dictionary member callbacks if callback registration is used
+
+    References needed only while GLU processes one polygon/curve/surface
+    (vertex data, combine results, converted arrays) are "scoped", they
+    are held until releaseScope() is called at the end of the polygon
+    (gluTessEndPolygon) or curve/surface (gluEndCurve/gluEndSurface), so
+    a long-lived structure does not accumulate references.  See
+    retainedStatistics() for the current/peak retention.
     """
     def getAsParam( self ):
         """Gets as a ctypes pointer to the underlying structure"""
@@ -26,19 +33,65 @@ class GLUStruct( object ):
     CALLBACK_TYPES = None
     CALLBACK_FUNCTION_REGISTRARS = None
     WRAPPER_METHODS = None
-    def noteObject( self, object ):
+    def noteObject( self, object, scoped=True ):
         """Note object for later retrieval as a Python object pointer
         
         This is the registration point for "original object return", returns 
         a void pointer to the Python object, though this is, effectively, an 
         opaque value.
+
+        scoped -- if True, the reference is held until the next
+            releaseScope(), otherwise for the life of the structure
         """
         identity = id(object)
-        try:
-            self.dataPointers[ identity ] = object
-        except AttributeError as err:
-            self.dataPointers = { identity: object }
+        if scoped:
+            storage = getattr( self, 'scopedPointers', None )
+            if storage is None:
+                storage = self.scopedPointers = {}
+        else:
+            storage = getattr( self, 'dataPointers', None )
+            if storage is None:
+                storage = self.dataPointers = {}
+        storage[ identity ] = object
         return identity
+    def noteUserData( self, object ):
+        """Note structure-wide user data, replacing any previously noted user data"""
+        previous = getattr( self, 'userDataIdentity', None )
+        if previous is not None:
+            getattr( self, 'dataPointers', {} ).pop( previous, None )
+        self.userDataIdentity = self.noteObject( object, scoped=False )
+        return self.userDataIdentity
+    def retain( self, *objects ):
+        """Keep objects (e.g. converted arrays) alive until the next releaseScope()"""
+        retained = getattr( self, 'scopedObjects', None )
+        if retained is None:
+            retained = self.scopedObjects = []
+        retained.extend( objects )
+    def releaseScope( self ):
+        """Release the scoped references, called at the end of each polygon/curve/surface"""
+        count = len( getattr( self, 'scopedPointers', () ) ) + len( getattr( self, 'scopedObjects', () ) )
+        if count > getattr( self, 'peakScoped', 0 ):
+            self.peakScoped = count
+        self.scopedPointers = {}
+        self.scopedObjects = []
+        self.releasedScopes = getattr( self, 'releasedScopes', 0 ) + 1
+    def retainedStatistics( self ):
+        """Report reference retention as a dictionary
+
+        persistent -- objects held for the life of the structure
+        scoped -- objects held for the current polygon/curve/surface
+        peakScoped -- largest number of scoped objects released at once
+        releasedScopes -- number of calls to releaseScope()
+        callbacks -- number of registered callbacks
+        """
+        scoped = len( getattr( self, 'scopedPointers', () ) ) + len( getattr( self, 'scopedObjects', () ) )
+        return {
+            'persistent': len( getattr( self, 'dataPointers', () ) ),
+            'scoped': scoped,
+            'peakScoped': max( scoped, getattr( self, 'peakScoped', 0 ) ),
+            'releasedScopes': getattr( self, 'releasedScopes', 0 ),
+            'callbacks': len( getattr( self, 'callbacks', None ) or () ),
+        }
     def originalObject( self, voidPointer ):
         """Given a void-pointer, try to find our original Python object"""
         if isinstance( voidPointer, integer_types):
@@ -50,10 +103,12 @@ class GLUStruct( object ):
                 identity = voidPointer.value 
             except AttributeError as err:
                 identity = voidPointer[0]
-        try:
-            return self.dataPointers[ identity ]
-        except (KeyError,AttributeError) as err:
-            return voidPointer
+        for storage in ('scopedPointers', 'dataPointers'):
+            try:
+                return getattr( self, storage )[ identity ]
+            except (KeyError,AttributeError) as err:
+                pass
+        return voidPointer
     def addCallback( self, which, function ):
         """Register a callback for this structure object"""
         callbackType = self.CALLBACK_TYPES.get( which )
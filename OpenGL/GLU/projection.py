@@ -1,8 +1,18 @@
-"""glu[Un]Project[4] convenience wrappers"""
+"""glu[Un]Project[4] convenience wrappers
+
+gluProjectArray and gluUnProjectArray are numpy-based versions which
+transform a whole (N,3) or (N,4) array of points in one pass, fetching
+whichever of the current matrices/viewport were not passed in once per
+call rather than once per point.
+"""
 from OpenGL.raw import GLU as _simple
 from OpenGL import GL
 from OpenGL.lazywrapper import lazy as _lazy
 import ctypes 
+try:
+    import numpy
+except ImportError as err:
+    numpy = None
 POINTER = ctypes.POINTER
 
 @_lazy( _simple.gluProject )
@@ -85,16 +95,126 @@ def gluUnProject4(
     objZ = _simple.GLdouble( 0.0 )
     objW = _simple.GLdouble( 0.0 )
     result = baseFunction( 
-        winX,winY,winZ,
+        winX,winY,winZ,clipW,
         model,proj,view,
+        near,far,
         ctypes.byref(objX),ctypes.byref(objY),ctypes.byref(objZ),ctypes.byref(objW)
     )
     if not result:
         raise ValueError( """Projection failed!""" )
     return objX.value, objY.value, objZ.value, objW.value
 
+def _currentMatrices( model, proj, view ):
+    """Convert (fetching if None) model, proj and view for the array functions
+
+    returns (model, proj, view) as (4,4), (4,4) and (4,) double arrays,
+    the matrices in OpenGL's (column-major) layout, so that a row
+    vector multiplied by model gives the transformed row vector.
+    """
+    if numpy is None:
+        raise ImportError( """gluProjectArray/gluUnProjectArray require numpy""" )
+    if model is None:
+        model = GL.glGetDoublev( GL.GL_MODELVIEW_MATRIX )
+    if proj is None:
+        proj = GL.glGetDoublev( GL.GL_PROJECTION_MATRIX )
+    if view is None:
+        view = GL.glGetIntegerv( GL.GL_VIEWPORT )
+    return (
+        numpy.asarray( model, dtype='d' ).reshape( (4,4) ),
+        numpy.asarray( proj, dtype='d' ).reshape( (4,4) ),
+        numpy.asarray( view, dtype='d' ).reshape( (4,) ),
+    )
+
+def _pointArray( points ):
+    """Convert points to an (N,3) or (N,4) double array"""
+    points = numpy.asarray( points, dtype='d' )
+    if points.ndim == 1:
+        points = points.reshape( (1,-1) )
+    if points.ndim != 2 or points.shape[1] not in (3,4):
+        raise ValueError( 
+            """Expected an (N,3) or (N,4) array of points, got shape %s"""%( 
+                points.shape, 
+            )
+        )
+    return points
+
+def gluProjectArray( points, model=None, proj=None, view=None ):
+    """Vectorised gluProject for an (N,3) or (N,4) array of object coordinates
+
+    points -- (N,3) object coordinates or (N,4) homogeneous object 
+        coordinates (gluProject itself uses a w of 1.0)
+    model, proj, view -- as for gluProject, fetched (once) from the 
+        current context if not provided
+
+    Points which gluProject would reject (clip-space w of 0) produce 
+    rows of NaN rather than raising, so one degenerate point does not 
+    discard the rest of the batch.
+
+    returns (N,3) double array of (winX,winY,winZ)
+    """
+    model, proj, view = _currentMatrices( model, proj, view )
+    points = _pointArray( points )
+    if points.shape[1] == 3:
+        clip = numpy.dot( points, model[:3] ) + model[3]
+    else:
+        clip = numpy.dot( points, model )
+    clip = numpy.dot( clip, proj )
+    w = clip[:,3:]
+    with numpy.errstate( divide='ignore', invalid='ignore' ):
+        ndc = numpy.where( w == 0.0, numpy.nan, clip[:,:3] / w )
+    result = numpy.empty( (len(points),3), dtype='d' )
+    result[:,0] = view[0] + (1.0 + ndc[:,0]) * view[2] / 2.0
+    result[:,1] = view[1] + (1.0 + ndc[:,1]) * view[3] / 2.0
+    result[:,2] = (1.0 + ndc[:,2]) / 2.0
+    return result
+
+def gluUnProjectArray( 
+    points, model=None, proj=None, view=None, 
+    near=0.0, far=1.0,
+):
+    """Vectorised gluUnProject/gluUnProject4 for an array of window coordinates
+
+    points -- (N,3) window coordinates (winX,winY,winZ), transformed as
+        by gluUnProject, or (N,4) (winX,winY,winZ,clipW), transformed 
+        as by gluUnProject4 using near and far
+    model, proj, view -- as for gluUnProject, fetched (once) from the 
+        current context if not provided
+
+    The combined matrix is inverted once for the whole batch, a 
+    singular matrix raises ValueError as gluUnProject does.  Points 
+    which gluUnProject would reject (object-space w of 0) produce rows 
+    of NaN.
+
+    returns (N,3) double array of (objX,objY,objZ) for (N,3) input, or
+    (N,4) (objX,objY,objZ,objW) for (N,4) input
+    """
+    model, proj, view = _currentMatrices( model, proj, view )
+    points = _pointArray( points )
+    try:
+        inverse = numpy.linalg.inv( numpy.dot( model, proj ) )
+    except numpy.linalg.LinAlgError as err:
+        raise ValueError( """Projection failed!""" )
+    ndc = numpy.empty( (len(points),4), dtype='d' )
+    ndc[:,0] = (points[:,0] - view[0]) * 2.0 / view[2] - 1.0
+    ndc[:,1] = (points[:,1] - view[1]) * 2.0 / view[3] - 1.0
+    if points.shape[1] == 3:
+        ndc[:,2] = points[:,2] * 2.0 - 1.0
+        ndc[:,3] = 1.0
+    else:
+        ndc[:,2] = (points[:,2] - near) / (far - near) * 2.0 - 1.0
+        ndc[:,3] = points[:,3]
+    obj = numpy.dot( ndc, inverse )
+    failed = obj[:,3] == 0.0
+    if points.shape[1] == 3:
+        with numpy.errstate( divide='ignore', invalid='ignore' ):
+            obj = obj[:,:3] / obj[:,3:]
+    obj[failed] = numpy.nan
+    return obj
+
 __all__ = (
     'gluProject',
     'gluUnProject',
     'gluUnProject4',
+    'gluProjectArray',
+    'gluUnProjectArray',
 )
@@ -1,4 +1,5 @@
 """Wrapper/Implementation of the GLU tessellator objects for PyOpenGL"""
+
 from OpenGL.raw import GLU as _simple
 from OpenGL.raw.GL.VERSION import GL_1_1
 from OpenGL.platform import createBaseFunction
@@ -8,7 +9,13 @@ from OpenGL.platform import PLATFORM
 
 GLU = PLATFORM.GLU
 from OpenGL.lazywrapper import lazy as _lazy
-import ctypes
+from OpenGL import constant, error
+import ctypes, threading
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class GLUtesselator(glustruct.GLUStruct, _simple.GLUtesselator):
@@ -64,11 +71,10 @@ class GLUtesselator(glustruct.GLUStruct, _simple.GLUtesselator):
     }
 
     def gluTessVertex(self, location, data=None):
-        """Add a vertex to this tessellator, storing data for later lookup"""
-        vertexCache = getattr(self, 'vertexCache', None)
-        if vertexCache is None:
-            self.vertexCache = []
-            vertexCache = self.vertexCache
+        """Add a vertex to this tessellator, storing data for later lookup
+
+        The location and data are retained until gluTessEndPolygon
+        """
         location = arrays.GLdoubleArray.asArray(location, GL_1_1.GL_DOUBLE)
         if arrays.GLdoubleArray.arraySize(location) != 3:
             raise ValueError(
@@ -76,13 +82,20 @@ class GLUtesselator(glustruct.GLUStruct, _simple.GLUtesselator):
             )
         oorValue = self.noteObject(data)
         vp = ctypes.c_void_p(oorValue)
-        self.vertexCache.append(location)
+        self.retain(location)
         return gluTessVertexBase(self, location, vp)
 
     def gluTessBeginPolygon(self, data):
         """Note the object pointer to return it as a Python object"""
         return _simple.gluTessBeginPolygon(self, ctypes.c_void_p(self.noteObject(data)))
 
+    def gluTessEndPolygon(self):
+        """Finish the polygon (running the callbacks), then release its references"""
+        try:
+            return _simple.gluTessEndPolygon(self)
+        finally:
+            self.releaseScope()
+
     def combineWrapper(self, function):
         """Wrap a Python function with ctypes-compatible wrapper for combine callback
 
@@ -228,6 +241,13 @@ def gluTessVertex(tess, location, data=None):
     return tess.gluTessVertex(location, data)
 
 
+def gluTessEndPolygon(tess):
+    """Finish the tessellator's current polygon, releasing the polygon's references"""
+    if isinstance(tess, GLUtesselator):
+        return tess.gluTessEndPolygon()
+    return _simple.gluTessEndPolygon(tess)
+
+
 # /usr/include/GL/glu.h 293
 @_lazy(
     createBaseFunction(
@@ -258,10 +278,239 @@ gluTessVertexBase = wrapper.wrapper(_simple.gluTessVertex).setInputArraySize(
     3,
 )
 
+_RAW = None
+
+
+def _rawTess():
+    """Retrieve unchecked GLU tessellator entry points taking plain addresses
+
+    The tessellator pointer, vertex locations and vertex data are all
+    passed as integers, avoiding per-call argument conversion.
+    """
+    global _RAW
+    if _RAW is None:
+        p, d, e = ctypes.c_void_p, _simple.GLdouble, _simple.GLenum
+        functionType = PLATFORM.functionTypeFor(GLU)
+        signatures = {
+            'gluNewTess': (p,),
+            'gluDeleteTess': (None, p),
+            'gluTessCallback': (None, p, e, p),
+            'gluTessProperty': (None, p, e, d),
+            'gluTessNormal': (None, p, d, d, d),
+            'gluTessBeginPolygon': (None, p, p),
+            'gluTessBeginContour': (None, p),
+            'gluTessVertex': (None, p, p, p),
+            'gluTessEndContour': (None, p),
+            'gluTessEndPolygon': (None, p),
+        }
+        _RAW = dict(
+            (name, functionType(*signature)((name, GLU)))
+            for name, signature in signatures.items()
+        )
+    return _RAW
+
+
+def contourPoints(contours):
+    """Convert contours to a contiguous (N,3) double array and per-contour counts
+
+    contours -- sequence of (n,2) or (n,3) arrays (a single 2D array is
+        treated as one contour), 2D points get z=0
+    """
+    if isinstance(contours, numpy.ndarray) and contours.ndim == 2:
+        contours = [contours]
+    converted = []
+    for contour in contours:
+        contour = numpy.asarray(contour, dtype='d')
+        if contour.ndim != 2 or contour.shape[1] not in (2, 3):
+            raise ValueError(
+                """Require (n,2) or (n,3) contour arrays, got shape %s"""
+                % (contour.shape,)
+            )
+        if contour.shape[1] == 2:
+            contour = numpy.hstack((contour, numpy.zeros((len(contour), 1), 'd')))
+        converted.append(contour)
+    if not converted:
+        return numpy.zeros((0, 3), 'd'), []
+    points = numpy.ascontiguousarray(numpy.concatenate(converted))
+    return points, [len(contour) for contour in converted]
+
+
+class BatchTessellator(object):
+    """Index-only driver for the GLU tessellator, see tessellate()
+
+    The GLU vertex data for each vertex is just its (1-based) index, the
+    vertex callback is list.append itself, so no Python code runs for
+    each emitted vertex, and an edge-flag callback is registered so that
+    GLU produces independent triangles (no fans or strips).  Only
+    combine (intersection) and error events go through Python.
+
+    An instance holds a GLU tessellator object (release it with
+    delete()) and is not thread-safe, tessellate() keeps one per thread.
+    """
+
+    FUNCTION_TYPE = PLATFORM.functionTypeFor(GLU)
+    INDEX_CALLBACK = FUNCTION_TYPE(None, ctypes.c_size_t)
+    FLAG_CALLBACK = FUNCTION_TYPE(None, _simple.GLboolean)
+    ERROR_CALLBACK = FUNCTION_TYPE(None, _simple.GLenum)
+    COMBINE_CALLBACK = FUNCTION_TYPE(
+        None,
+        ctypes.POINTER(_simple.GLdouble),
+        ctypes.POINTER(ctypes.c_size_t),
+        ctypes.POINTER(_simple.GLfloat),
+        ctypes.POINTER(ctypes.c_size_t),
+    )
+
+    def __init__(self):
+        if numpy is None:
+            raise ImportError("""BatchTessellator requires numpy""")
+        self.raw = _rawTess()
+        self.tess = self.raw['gluNewTess']()
+        if not self.tess:
+            raise error.GLUError("""Unable to create GLU tessellator""")
+        self.count = 0
+        self.indices = []
+        self.flags = []
+        self.errors = []
+        self.combined = []
+        self.sources = []
+        self.weights = []
+        self.callbacks = {
+            _simple.GLU_TESS_VERTEX: self.INDEX_CALLBACK(self.indices.append),
+            # edge flags are only registered to force GL_TRIANGLES output
+            _simple.GLU_TESS_EDGE_FLAG: self.FLAG_CALLBACK(self.flags.append),
+            _simple.GLU_TESS_ERROR: self.ERROR_CALLBACK(self.errors.append),
+            _simple.GLU_TESS_COMBINE: self.COMBINE_CALLBACK(self.combine),
+        }
+        for which, callback in self.callbacks.items():
+            self.raw['gluTessCallback'](
+                self.tess, which, ctypes.cast(callback, ctypes.c_void_p)
+            )
+
+    def combine(self, coords, data, weights, outData):
+        """Record a combine-created vertex, its index is returned as vertex data"""
+        self.combined.append((coords[0], coords[1], coords[2]))
+        self.sources.append((data[0], data[1], data[2], data[3]))
+        self.weights.append((weights[0], weights[1], weights[2], weights[3]))
+        outData[0] = self.count + len(self.combined)
+
+    def reset(self, count):
+        """Clear the recorded results before tessellating count vertices"""
+        self.count = count
+        for collected in (
+            self.indices,
+            self.flags,
+            self.errors,
+            self.combined,
+            self.sources,
+            self.weights,
+        ):
+            del collected[:]
+
+    def tessellate(
+        self,
+        contours,
+        windingRule=_simple.GLU_TESS_WINDING_ODD,
+        normal=None,
+        tolerance=None,
+    ):
+        """Tessellate contours, see tessellate() for details"""
+        if not self.tess:
+            raise error.GLUError("""BatchTessellator has been deleted""")
+        points, counts = contourPoints(contours)
+        raw, tess = self.raw, self.tess
+        self.reset(len(points))
+        raw['gluTessProperty'](tess, _simple.GLU_TESS_WINDING_RULE, windingRule)
+        if tolerance is not None:
+            raw['gluTessProperty'](tess, _simple.GLU_TESS_TOLERANCE, tolerance)
+        if normal is None:
+            normal = (0.0, 0.0, 0.0)
+        raw['gluTessNormal'](tess, *normal)
+        vertex = raw['gluTessVertex']
+        beginContour, endContour = raw['gluTessBeginContour'], raw['gluTessEndContour']
+        stride = points.strides[0]
+        address = points.ctypes.data
+        first = 1
+        raw['gluTessBeginPolygon'](tess, None)
+        try:
+            for count in counts:
+                beginContour(tess)
+                try:
+                    for index in range(first, first + count):
+                        vertex(tess, address, index)
+                        address += stride
+                finally:
+                    endContour(tess)
+                first += count
+        finally:
+            raw['gluTessEndPolygon'](tess)
+        if self.errors:
+            code = self.errors[0]
+            raise error.GLUError(
+                """Tessellation failed: %s"""
+                % (constant.nameFor(code, 'GLU_') or code,)
+            )
+        triangles = numpy.array(self.indices, dtype='I').reshape((-1, 3))
+        triangles -= 1
+        combined = numpy.array(self.combined, dtype='d').reshape((-1, 3))
+        sources = numpy.array(self.sources, dtype='i8').reshape((-1, 4))
+        # NULL vertex data (unused source) becomes -1
+        sources = (sources - 1).astype('i')
+        weights = numpy.array(self.weights, dtype='f').reshape((-1, 4))
+        return triangles, combined, sources, weights
+
+    def delete(self):
+        """Release the GLU tessellator object"""
+        if self.tess:
+            self.raw['gluDeleteTess'](self.tess)
+            self.tess = None
+
+
+_local = threading.local()
+
+
+def tessellate(
+    contours,
+    windingRule=_simple.GLU_TESS_WINDING_ODD,
+    normal=None,
+    tolerance=None,
+):
+    """Tessellate polygon contours into triangles without per-vertex callbacks
+
+    contours -- sequence of (n,2) or (n,3) numpy arrays (or anything
+        numpy.asarray accepts), each a closed contour of the polygon
+    windingRule -- GLU_TESS_WINDING_* rule selecting the interior
+    normal -- optional polygon normal (GLU computes one otherwise)
+    tolerance -- optional GLU_TESS_TOLERANCE for merging vertices
+
+    Vertices are numbered in order through the concatenated contours,
+    vertices created where edges intersect are numbered after them.
+
+    returns (triangles, combined, sources, weights) where
+
+        triangles -- (t,3) uint32 array of vertex indices, suitable for
+            glDrawElements( GL_TRIANGLES, ..., GL_UNSIGNED_INT, ... )
+        combined -- (c,3) double array of the created vertices, created
+            vertex k has index (number of input vertices) + k
+        sources -- (c,4) int32 array of the vertex indices combined to
+            produce each created vertex (-1 where unused)
+        weights -- (c,4) float32 array of the combination weights, for
+            interpolating per-vertex attributes
+
+    raises GLUError if GLU reports a tessellation error
+    """
+    tessellator = getattr(_local, 'tessellator', None)
+    if tessellator is None:
+        tessellator = _local.tessellator = BatchTessellator()
+    return tessellator.tessellate(
+        contours, windingRule=windingRule, normal=normal, tolerance=tolerance
+    )
+
+
 __all__ = (
     'gluNewTess',
     'gluGetTessProperty',
     'gluTessBeginPolygon',
     'gluTessCallback',
+    'gluTessEndPolygon',
     'gluTessVertex',
 )
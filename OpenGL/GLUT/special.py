@@ -343,10 +343,22 @@ def glutDestroyWindow( window ):
     context = 0
     try:
         GLUT.glutSetWindow(window)
+        contextdata.invalidateContext()
         context = contextdata.getContext()
         result = contextdata.cleanupContext( context )
         _log.info( """Cleaning up context data for window %s: %s""", window, result )
     except Exception as err:
         _log.error( """Error attempting to clean up context data for GLUT window %s: %s""", window, result )
-    return _base_glutDestroyWindow( window )
+    try:
+        return _base_glutDestroyWindow( window )
+    finally:
+        contextdata.invalidateContext()
 glutDestroyWindow.wrappedOperation = _simple.glutDestroyWindow
+
+def glutSetWindow( window ):
+    """Set the current window, invalidating the cached current context"""
+    try:
+        return _simple.glutSetWindow( window )
+    finally:
+        contextdata.invalidateContext()
+glutSetWindow.wrappedOperation = _simple.glutSetWindow
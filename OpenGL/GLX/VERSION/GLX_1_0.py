@@ -20,4 +20,15 @@ def glInitGlx10VERSION():
     return extensions.hasGLExtension( _EXTENSION_NAME )
 
 
-### END AUTOGENERATED SECTION
\ No newline at end of file
+### END AUTOGENERATED SECTION
+
+from OpenGL.lazywrapper import lazy as _lazy
+from OpenGL import contextdata as _contextdata
+
+@_lazy( glXMakeCurrent )
+def glXMakeCurrent( baseFunction, dpy, drawable, ctx ):
+    """Make the context current, invalidating the cached current context"""
+    try:
+        return baseFunction( dpy, drawable, ctx )
+    finally:
+        _contextdata.invalidateContext()
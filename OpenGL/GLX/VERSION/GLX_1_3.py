@@ -20,4 +20,15 @@ def glInitGlx13VERSION():
     return extensions.hasGLExtension( _EXTENSION_NAME )
 
 
-### END AUTOGENERATED SECTION
\ No newline at end of file
+### END AUTOGENERATED SECTION
+
+from OpenGL.lazywrapper import lazy as _lazy
+from OpenGL import contextdata as _contextdata
+
+@_lazy( glXMakeContextCurrent )
+def glXMakeContextCurrent( baseFunction, dpy, draw, read, ctx ):
+    """Make the context current, invalidating the cached current context"""
+    try:
+        return baseFunction( dpy, draw, read, ctx )
+    finally:
+        _contextdata.invalidateContext()
@@ -1,3 +1,14 @@
 from OpenGL.raw.WGL.VERSION.WGL_1_0 import *
 
 wglUseFontBitmaps = wglUseFontBitmapsW
+
+from OpenGL.lazywrapper import lazy as _lazy
+from OpenGL import contextdata as _contextdata
+
+@_lazy( wglMakeCurrent )
+def wglMakeCurrent( baseFunction, hDc, newContext ):
+    """Make the context current, invalidating the cached current context"""
+    try:
+        return baseFunction( hDc, newContext )
+    finally:
+        _contextdata.invalidateContext()
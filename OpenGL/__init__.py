@@ -59,6 +59,9 @@ import occurs the flags should no longer be changed.
         This effectively disables all list/tuple array
         support, as they are inherently copy-based.
 
+        To find the copies in an existing application without
+        raising errors see OpenGL.arrays.copyprofile.
+
         This feature allows for optimisation of your
         application.  It should only be enabled during
         testing stages to prevent raising errors on
@@ -78,6 +81,27 @@ import occurs the flags should no longer be changed.
 
         Default: False
 
+    CACHE_CURRENT_CONTEXT -- if set to True, OpenGL.contextdata
+        caches the current context handle per-thread instead of
+        querying the platform on every context-data lookup (which
+        happens on every gl*Pointer call when STORE_POINTERS is set).
+        PyOpenGL's own make-current functions invalidate the cache,
+        if your GUI library switches contexts you must call
+        OpenGL.contextdata.invalidateContext() after doing so.
+
+        Default: False
+
+    SHADOW_PIXEL_STORE -- if set to True, OpenGL.images keeps a
+        per-context shadow of the glPixelStorei parameters it sets up
+        for image reads/writes and only issues the calls whose values
+        have changed.  OpenGL.GL.glPixelStorei, glPixelStoref and
+        glPopClientAttrib keep the shadow up to date; code which
+        changes pixel-store state by other means (raw entry points,
+        other libraries sharing the context) must call
+        OpenGL.images.invalidatePixelStore() afterward.
+
+        Default: False
+
     STORE_POINTERS -- if set to True, PyOpenGL array operations
         will attempt to store references to pointers which are
         being passed in order to prevent memory-access failures
@@ -145,6 +169,14 @@ import occurs the flags should no longer be changed.
 
         Default: True
 
+    UNSIGNED_BYTE_IMAGES_AS_MEMORYVIEW -- if True (and
+        UNSIGNED_BYTE_IMAGES_AS_STRING is True), GL_UNSIGNED_BYTE
+        image-data is returned as a read-only memoryview onto the
+        result array instead of a copied string.  Individual calls
+        can request this with outputType=memoryview.
+
+        Default: False
+
     FORWARD_COMPATIBLE_ONLY -- only include OpenGL 3.1 compatible
         entry points.  Note that this will generally break most
         PyOpenGL code that hasn't been explicitly made "legacy free"
@@ -166,8 +198,9 @@ import occurs the flags should no longer be changed.
         Default: True
     
     MODULE_ANNOTATIONS -- if True, attempt to annotate alternates() and 
-        constants to track in which module they are defined (only useful 
-        for the documentation-generation passes, really).
+        functions to track in which module they are defined (only useful 
+        for the documentation-generation passes, really).  Constants are
+        shared between modules (see OpenGL.constant) so are not annotated.
         
         Default: False
     
@@ -177,6 +210,26 @@ import occurs the flags should no longer be changed.
         annotations dictionary are generally either ctypes types or 
         ArrayDataType references, so this isn't *likely* to be all that useful
         without further work.
+
+    LAZY_GL_NAMESPACE -- if True, OpenGL.GL does not import all of
+        its VERSION modules up front, instead each name is imported
+        (along with the module which defines it) on first access,
+        using the generated index in OpenGL.GL._lazyindex.  Greatly
+        reduces the import time of programs which use only a few
+        entry points.  Note that dir(OpenGL.GL) and star-imports
+        still see every name, the latter importing everything.
+
+        Default: False
+
+    WRAPPER_CODEGEN -- if True, and OpenGL_accelerate is not in use,
+        finalised wrappers use generated straight-line Python call
+        functions (see OpenGL.wrappergen) instead of the generic
+        generator-based implementations.  The generated code is cached
+        on disk (PYOPENGL_WRAPPER_CACHE_DIR, default ~/.cache/pyopengl,
+        empty to disable) keyed by PyOpenGL version, interpreter and
+        generator source.
+
+        Default: False
 """
 from OpenGL.version import __version__
 import os
@@ -203,12 +256,19 @@ FORWARD_COMPATIBLE_ONLY = False
 SIZE_1_ARRAY_UNPACK = True
 USE_ACCELERATE = environ_key("USE_ACCELERATE", True)
 CONTEXT_CHECKING = environ_key("CONTEXT_CHECKING", False)
+CACHE_CURRENT_CONTEXT = environ_key("CACHE_CURRENT_CONTEXT", False)
+SHADOW_PIXEL_STORE = environ_key("SHADOW_PIXEL_STORE", False)
 
 FULL_LOGGING = environ_key("FULL_LOGGING", False)
 ALLOW_NUMPY_SCALARS = environ_key("ALLOW_NUMPY_SCALARS", False)
 UNSIGNED_BYTE_IMAGES_AS_STRING = environ_key("UNSIGNED_BYTE_IMAGES_AS_STRING", True)
+UNSIGNED_BYTE_IMAGES_AS_MEMORYVIEW = environ_key(
+    "UNSIGNED_BYTE_IMAGES_AS_MEMORYVIEW", False
+)
 MODULE_ANNOTATIONS = False
 TYPE_ANNOTATIONS = False
+LAZY_GL_NAMESPACE = environ_key("LAZY_GL_NAMESPACE", False)
+WRAPPER_CODEGEN = environ_key("WRAPPER_CODEGEN", False)
 
 
 # Declarations of plugins provided by PyOpenGL itself
@@ -373,3 +433,9 @@ FormatHandler(
     ["OpenGL.arrays.vbo.VBOOffset", "OpenGL_accelerate.vbo.VBOOffset"],
     isOutput=False,
 )
+FormatHandler(
+    "streamingvbo",
+    "OpenGL.arrays.vbo.StreamingVBOHandler",
+    ["OpenGL.arrays.vbo.StreamingVBO"],
+    isOutput=False,
+)
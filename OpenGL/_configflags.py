@@ -10,10 +10,15 @@ from OpenGL import (
     SIZE_1_ARRAY_UNPACK,
     USE_ACCELERATE,
     CONTEXT_CHECKING,
+    CACHE_CURRENT_CONTEXT,
+    SHADOW_PIXEL_STORE,
 
     FULL_LOGGING,
     ALLOW_NUMPY_SCALARS,
     UNSIGNED_BYTE_IMAGES_AS_STRING,
+    UNSIGNED_BYTE_IMAGES_AS_MEMORYVIEW,
     MODULE_ANNOTATIONS,
     TYPE_ANNOTATIONS,
+    LAZY_GL_NAMESPACE,
+    WRAPPER_CODEGEN,
 )
@@ -25,13 +25,35 @@ if acceleratesupport.ACCELERATE_AVAILABLE:
 if ADT is None:
     # Python-coded version
     class HandlerRegistry(dict):
+        """Registry mapping types to format handlers
+
+        Types which are not directly registered are resolved by walking
+        their __mro__ (and the plugin matcher) once, after which the
+        exact type is cached in the registry.  Types for which no
+        handler can be found are recorded in a negative cache so that
+        repeated failures are cheap.  Cached (derived and negative)
+        entries are bounded by CACHE_SIZE and are discarded whenever
+        register() or registerReturn() is called.
+
+        Attributes:
+
+            hits -- lookups satisfied directly by the registry
+            misses -- lookups requiring an __mro__/plugin walk
+            negativeHits -- lookups failed via the negative cache
+            failures -- lookups which failed after a full walk
+        """
+
         GENERIC_OUTPUT_PREFERENCES = ["numpy", "ctypesarrays"]
+        CACHE_SIZE = 256
 
         def __init__(self, plugin_match):
             self.match = plugin_match
             self.output_handler = None
             self.preferredOutput = None
             self.all_output_handlers = []
+            self.derived = set()
+            self.negative = set()
+            self.resetStatistics()
 
         def __call__(self, value):
             """Lookup of handler for given value"""
@@ -40,27 +62,72 @@ if ADT is None:
             except AttributeError:
                 typ = type(value)
             handler = self.get(typ)
-            if not handler:
-                if hasattr(typ, "__mro__"):
-                    for base in typ.__mro__:
-                        handler = self.get(base)
-                        if not handler:
-                            handler = self.match(base)
-                            if handler:
-                                handler = handler.load()
-                                if handler:
-                                    handler = handler()
-                        if handler:
-                            self[typ] = handler
-                            if hasattr(handler, "registerEquivalent"):
-                                handler.registerEquivalent(typ, base)
-                            return handler
-                print(self.keys())
+            if handler:
+                self.hits += 1
+                return handler
+            if typ in self.negative:
+                self.negativeHits += 1
                 raise TypeError(
                     """No array-type handler for type %s.%s (value: %s) registered"""
                     % (typ.__module__, typ.__name__, repr(value)[:50])
                 )
-            return handler
+            self.misses += 1
+            if hasattr(typ, "__mro__"):
+                for base in typ.__mro__:
+                    handler = self.get(base)
+                    if not handler:
+                        handler = self.match(base)
+                        if handler:
+                            handler = handler.load()
+                            if handler:
+                                handler = handler()
+                    if handler:
+                        self.cacheResult(typ, handler)
+                        if hasattr(handler, "registerEquivalent"):
+                            handler.registerEquivalent(typ, base)
+                        return handler
+            self.failures += 1
+            self.cacheResult(typ, None)
+            raise TypeError(
+                """No array-type handler for type %s.%s (value: %s) registered"""
+                % (typ.__module__, typ.__name__, repr(value)[:50])
+            )
+
+        def cacheResult(self, typ, handler):
+            """Record result of a full lookup for typ (None for failure)"""
+            if len(self.derived) + len(self.negative) >= self.CACHE_SIZE:
+                self.invalidateCache()
+            if handler is None:
+                self.negative.add(typ)
+            else:
+                self[typ] = handler
+                self.derived.add(typ)
+
+        def invalidateCache(self):
+            """Discard all derived and negative lookup results"""
+            for typ in self.derived:
+                self.pop(typ, None)
+            self.derived.clear()
+            self.negative.clear()
+
+        def resetStatistics(self):
+            """Reset the lookup counters"""
+            self.hits = self.misses = self.negativeHits = self.failures = 0
+
+        def statistics(self):
+            """Report lookup counters and hit rate as a dictionary"""
+            total = self.hits + self.misses + self.negativeHits
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'negativeHits': self.negativeHits,
+                'failures': self.failures,
+                'derived': len(self.derived),
+                'negative': len(self.negative),
+                'hitRate': (
+                    float(self.hits + self.negativeHits) / total if total else 0.0
+                ),
+            }
 
         def handler_by_plugin_name(self, name):
             plugin = plugins.FormatHandler.by_name(name)
@@ -94,6 +161,7 @@ if ADT is None:
             """Register this class as handler for given set of types"""
             if not isinstance(types, (list, tuple)):
                 types = [types]
+            self.invalidateCache()
             for type in types:
                 self[type] = handler
             if handler.isOutput:
@@ -101,6 +169,7 @@ if ADT is None:
 
         def registerReturn(self, handler):
             """Register this handler as the default return-type handler"""
+            self.invalidateCache()
             if isinstance(handler, (str, unicode)):
                 self.preferredOutput = handler
                 self.output_handler = None
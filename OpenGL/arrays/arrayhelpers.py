@@ -184,9 +184,10 @@ class storePointerType(object):
 
     def finalise(self, wrapper):
         self.pointerIndex = wrapper.pyArgIndex(self.pointerName)
+        self.slot = contextdata.slotFor(self.constant)
 
     def __call__(self, result, baseOperation, pyArgs, cArgs):
-        contextdata.setValue(self.constant, pyArgs[self.pointerIndex])
+        contextdata.setSlot(self.slot, pyArgs[self.pointerIndex])
 
 
 def setInputArraySizeType(baseOperation, size, type, argName=0):
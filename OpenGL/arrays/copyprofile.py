@@ -0,0 +1,247 @@
+"""Accounting of array copies made while converting arguments
+
+OpenGL.ERROR_ON_COPY turns every copying conversion into an error,
+which is useful for new code but makes it hard to find the copies
+which actually matter in a large existing application.  A
+CopyProfiler instead records each copying conversion, keyed by the
+GL entry point being called and the (non-PyOpenGL) call site, along
+with the bytes copied and the source types:
+
+    from OpenGL.arrays import copyprofile
+    with copyprofile.CopyProfiler() as profiler:
+        render_frame()
+    print(profiler.format(limit=10))
+
+Profiling is off unless a profiler is active, the conversion code only
+tests the module-level ACTIVE reference before doing any work.
+
+Entry points are found by walking the Python stack.  The
+OpenGL_accelerate (Cython) converters leave no Python frames to walk,
+so while a profiler is active they pass their wrapper in through
+converting() instead.  Calls made directly through raw ctypes functions
+are reported with an entry point of None.
+"""
+
+import ctypes, os, sys, threading
+
+ACTIVE = None
+_PACKAGE = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+_lock = threading.Lock()
+_state = threading.local()
+
+
+def _entryName(frame):
+    """Find the GL entry-point name for a frame inside PyOpenGL (if any)"""
+    name = frame.f_code.co_name
+    if name.startswith('gl'):
+        return name
+    current = frame.f_locals.get('self')
+    if current is not None and hasattr(current, 'wrappedOperation'):
+        return getattr(current, '__name__', None)
+    return None
+
+
+def _functionName(function):
+    """Find the GL entry-point name for a wrapper (or raw function)"""
+    operation = getattr(function, 'wrappedOperation', function)
+    return getattr(operation, '__name__', None)
+
+
+def converting(function, convert, *args):
+    """Call convert(*args) with function as the entry point for any copies
+
+    Used by converters whose frames are not visible to callSite (the
+    OpenGL_accelerate ones), only worth calling while ACTIVE is set.
+    """
+    previous = getattr(_state, 'function', None)
+    _state.function = function
+    try:
+        return convert(*args)
+    finally:
+        _state.function = previous
+
+
+def callSite(frame=None):
+    """Determine (entryPoint, 'filename:lineno') for the current conversion
+
+    entryPoint is the outermost GL function found on the stack inside
+    PyOpenGL (or the function registered with converting() if there is
+    none), the call site is the first frame outside of PyOpenGL.
+    """
+    if frame is None:
+        frame = sys._getframe(1)
+    entry = None
+    site = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_PACKAGE) or filename.startswith('<OpenGL'):
+            entry = _entryName(frame) or entry
+            frame = frame.f_back
+        else:
+            site = '%s:%s' % (filename, frame.f_lineno)
+            break
+    if entry is None:
+        function = getattr(_state, 'function', None)
+        if function is not None:
+            entry = _functionName(function)
+    return entry, site
+
+
+def describe(source):
+    """Describe source as (type/dtype name, contiguous flag or None)"""
+    dtype = getattr(source, 'dtype', None)
+    flags = getattr(source, 'flags', None)
+    contiguous = None
+    if flags is not None:
+        contiguous = bool(getattr(flags, 'contiguous', False))
+    if dtype is not None:
+        return str(dtype), contiguous
+    return type(source).__name__, contiguous
+
+
+class CopyRecord(object):
+    """Statistics for copies made by one entry point at one call site"""
+
+    __slots__ = ('entryPoint', 'callSite', 'count', 'bytes', 'sources', 'reasons')
+
+    def __init__(self, entryPoint, callSite):
+        self.entryPoint = entryPoint
+        self.callSite = callSite
+        self.count = 0
+        self.bytes = 0
+        self.sources = {}
+        self.reasons = {}
+
+    def add(self, nbytes, source, reason):
+        self.count += 1
+        self.bytes += nbytes
+        self.sources[source] = self.sources.get(source, 0) + 1
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+    def __repr__(self):
+        return '%s( %s @ %s: %s copies, %s bytes )' % (
+            self.__class__.__name__,
+            self.entryPoint,
+            self.callSite,
+            self.count,
+            self.bytes,
+        )
+
+
+class CopyProfiler(object):
+    """Records copying array conversions while active
+
+    Use as a context manager (or call start()/stop()) to scope the
+    profiling; profilers nest, the previously active profiler is
+    restored by stop().
+
+    Attributes:
+
+        records -- {(entryPoint, callSite): CopyRecord}
+        count -- total number of copies recorded
+        bytes -- total number of bytes copied
+    """
+
+    def __init__(self):
+        self.records = {}
+        self.count = 0
+        self.bytes = 0
+        self._previous = []
+
+    def start(self):
+        """Make this the active profiler"""
+        global ACTIVE
+        with _lock:
+            self._previous.append(ACTIVE)
+            ACTIVE = self
+        return self
+
+    def stop(self):
+        """Restore the previously active profiler (if any)"""
+        global ACTIVE
+        with _lock:
+            if self._previous:
+                ACTIVE = self._previous.pop()
+        return self
+
+    __enter__ = start
+
+    def __exit__(self, exc_type=None, exc_val=None, exc_tb=None):
+        self.stop()
+        return False
+
+    def reset(self):
+        """Discard all recorded statistics"""
+        self.records = {}
+        self.count = 0
+        self.bytes = 0
+
+    def record(self, source, result, reason):
+        """Record a copy of source into result (a new array)
+
+        source -- the value passed in by the caller
+        result -- the newly created (copied) array, used to count bytes
+        reason -- short description of why the copy was required
+        """
+        nbytes = getattr(result, 'nbytes', None)
+        if nbytes is None:
+            try:
+                nbytes = ctypes.sizeof(result)
+            except TypeError:
+                nbytes = 0
+        key = callSite(sys._getframe(1))
+        current = self.records.get(key)
+        if current is None:
+            current = self.records[key] = CopyRecord(*key)
+        current.add(nbytes, describe(source), reason)
+        self.count += 1
+        self.bytes += nbytes
+
+    def report(self, limit=None, key='bytes'):
+        """Retrieve CopyRecords sorted by key ('bytes' or 'count'), largest first"""
+        records = sorted(
+            self.records.values(),
+            key=lambda record: getattr(record, key),
+            reverse=True,
+        )
+        if limit is not None:
+            records = records[:limit]
+        return records
+
+    def format(self, limit=None, key='bytes'):
+        """Produce a human-readable report of the worst copy hot spots"""
+        lines = ['%s copies, %s bytes' % (self.count, self.bytes)]
+        for record in self.report(limit, key):
+            lines.append(
+                '%10d bytes %6d copies  %s  %s'
+                % (
+                    record.bytes,
+                    record.count,
+                    record.entryPoint or '<unknown>',
+                    record.callSite,
+                )
+            )
+            for (source, contiguous), count in sorted(
+                record.sources.items(), key=lambda item: -item[1]
+            ):
+                lines.append(
+                    '        %6d x %s%s'
+                    % (
+                        count,
+                        source,
+                        '' if contiguous in (None, True) else ' (non-contiguous)',
+                    )
+                )
+            for reason, count in sorted(
+                record.reasons.items(), key=lambda item: -item[1]
+            ):
+                lines.append('        %6d x %s' % (count, reason))
+        return '\n'.join(lines)
+
+
+def recordCopy(source, result, reason):
+    """Record a copy with the active profiler (no-op if none is active)"""
+    profiler = ACTIVE
+    if profiler is not None:
+        profiler.record(source, result, reason)
+    return result
@@ -8,20 +8,45 @@ Note:
 """
 
 REGISTRY_NAME = 'lists'
-import ctypes, _ctypes
+import array, ctypes, _ctypes
+from itertools import chain
 
 # Note: these are the same definitions as for GLES, so we are not cross-polluting
 from OpenGL.raw.GL import _types
 from OpenGL.arrays import _arrayconstants as GL_1_1
 from OpenGL import constant, error
 from OpenGL._configflags import ERROR_ON_COPY
-from OpenGL.arrays import formathandler
+from OpenGL.arrays import formathandler, copyprofile
 from OpenGL._bytes import bytes, unicode, as_8_bit
 
 HANDLED_TYPES = (list, tuple)
+_SEQUENCE_TYPES = set(HANDLED_TYPES)
 import operator
 
 
+def flatten(value):
+    """Flatten a homogeneous nested list/tuple in a single pass per level
+
+    returns (dims, items) where dims is the list of dimensions and items
+    the flat list of leaf values, or None if value is empty or not a
+    uniformly-shaped nesting of lists/tuples
+    """
+    dims = [len(value)]
+    level = value
+    while level:
+        types = set(map(type, level))
+        if not types & _SEQUENCE_TYPES:
+            return dims, level
+        if not types <= _SEQUENCE_TYPES:
+            return None
+        sizes = set(map(len, level))
+        if len(sizes) != 1:
+            return None
+        dims.append(sizes.pop())
+        level = list(chain.from_iterable(level))
+    return None
+
+
 def err_on_copy(func):
     """Decorator which raises informative error if we try to copy while ERROR_ON_COPY"""
     if not ERROR_ON_COPY:
@@ -85,28 +110,16 @@ class ListHandler(formathandler.FormatHandler):
     def dimsOf(cls, x):
         """Calculate total dimension-set of the elements in x
 
-        This is *extremely* messy, as it has to track nested arrays
-        where the arrays could be different sizes on all sorts of
-        levels...
+        raises ValueError if x is not uniformly shaped
         """
-        try:
-            _ = [len(x)]
-        except (TypeError, AttributeError, ValueError) as err:
+        if not isinstance(x, HANDLED_TYPES):
             return []
-        else:
-            childDimension = None
-            for child in x:
-                newDimension = cls.dimsOf(child)
-                if childDimension is not None:
-                    if newDimension != childDimension:
-                        raise ValueError(
-                            """Non-uniform array encountered: %s versus %s"""
-                            % (
-                                newDimension,
-                                childDimension,
-                            ),
-                            x,
-                        )
+        if not x:
+            return [0]
+        flat = flatten(x)
+        if flat is None:
+            raise ValueError("""Non-uniform array encountered""", x)
+        return flat[0]
 
     @classmethod
     def arrayToGLType(cls, value):
@@ -160,14 +173,69 @@ class ListHandler(formathandler.FormatHandler):
         This does a *lot* of work just to get the data into the correct
         format.  It's not going to be anywhere near as fast as a numpy
         or similar approach!
+
+        Uniformly-shaped nestings of lists/tuples are flattened and
+        packed in bulk (see packFlat), anything else falls back to
+        building the array recursively.
+        """
+        result = None
+        if isinstance(value, HANDLED_TYPES) and typeCode is not None:
+            result = cls.packFlat(value, typeCode)
+        if result is None:
+            result = cls._asArray(value, typeCode)
+        if copyprofile.ACTIVE is not None:
+            copyprofile.recordCopy(value, result, 'list conversion')
+        return result
+
+    _ARRAY_TYPES = {}
+
+    @classmethod
+    def arrayTypeFor(cls, typeCode, dims):
+        """Retrieve (cached) nested ctypes array type for typeCode and dims"""
+        key = (typeCode, tuple(dims))
+        arrayType = cls._ARRAY_TYPES.get(key)
+        if arrayType is None:
+            arrayType = GL_TYPE_TO_ARRAY_MAPPING[typeCode]
+            for dim in dims[::-1]:
+                arrayType *= dim
+            cls._ARRAY_TYPES[key] = arrayType
+        return arrayType
+
+    @classmethod
+    def packFlat(cls, value, typeCode):
+        """Pack a uniformly-shaped list/tuple nesting into a ctypes array
+
+        Flattens value once (validating the shape as it goes) and packs
+        the leaf values with the array module, creating the ctypes array
+        from that single buffer.
+
+        returns None if value cannot take the fast path (irregular shape,
+        values the array module rejects, type without an array code)
         """
+        flat = flatten(value)
+        if flat is None:
+            return None
+        dims, items = flat
+        base = GL_TYPE_TO_ARRAY_MAPPING[typeCode]
+        code = getattr(base, '_type_', None)
+        if code not in array.typecodes:
+            return None
+        try:
+            packed = array.array(code, items)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        return cls.arrayTypeFor(typeCode, dims).from_buffer_copy(packed)
+
+    @classmethod
+    def _asArray(cls, value, typeCode=None):
+        """Recursive implementation of asArray"""
         if typeCode is None:
             raise NotImplementedError(
                 """Haven't implemented type-inference for lists yet"""
             )
         arrayType = GL_TYPE_TO_ARRAY_MAPPING[typeCode]
         if isinstance(value, (list, tuple)):
-            subItems = [cls.asArray(item, typeCode) for item in value]
+            subItems = [cls._asArray(item, typeCode) for item in value]
             if subItems:
                 for dim in cls.dimensions(subItems[0])[::-1]:
                     arrayType *= dim
@@ -0,0 +1,174 @@
+"""Pooled allocation of output arrays for readback loops
+
+Operations which return arrays (glReadPixels, glGetTexImage, the
+glGet* output converters...) normally allocate a new zero-filled
+array on every call.  Capture loops reading large images every frame
+spend a good deal of their time allocating (and garbage collecting)
+those arrays.  While an OutputPool is active, those allocations are
+satisfied from arrays of the same type and shape which have been
+handed back to the pool with release():
+
+    from OpenGL.arrays import outputpool
+    with outputpool.OutputPool() as pool:
+        while capturing:
+            image = glReadPixels(
+                0, 0, width, height, GL_RGB, GL_UNSIGNED_BYTE, outputType=None
+            )
+            save(image)
+            pool.release(image)
+
+Pools are per-thread, a pool started in one thread does not affect
+allocations in any other thread.  Only arrays of at least minBytes
+are pooled, and the pool holds at most maxBytes of idle arrays (and
+maxPerKey arrays for any one type/shape), so small glGet results
+are simply allocated as usual.
+
+Arrays handed out by the pool are cleared before reuse (a memset is
+still far cheaper than allocating and collecting a new array), so
+they are zero-filled like a fresh allocation.  A released array must
+not be used afterward, as it will be returned by a later allocation.
+
+Unsigned-byte image reads returned as bytes (the default for
+OpenGL.UNSIGNED_BYTE_IMAGES_AS_STRING) release their intermediate
+array automatically.
+"""
+
+import ctypes, threading, weakref
+
+ACTIVE = 0
+_local = threading.local()
+_lock = threading.Lock()
+
+
+def current():
+    """Retrieve the OutputPool active in this thread (or None)"""
+    stack = getattr(_local, 'pools', None)
+    if stack:
+        return stack[-1]
+    return None
+
+
+class OutputPool(object):
+    """Per-thread pool of reusable output arrays
+
+    Attributes:
+
+        maxBytes -- maximum bytes held in idle (released) arrays
+        maxPerKey -- maximum idle arrays for any one type and shape
+        minBytes -- arrays smaller than this are not pooled
+        idle -- {(handler, typeConstant, dims): [array, ...]}
+        bytes -- total bytes in idle arrays
+        hits -- count of allocations satisfied from the pool
+        misses -- count of (poolable) allocations which were not
+    """
+
+    def __init__(self, maxBytes=64 * 1024 * 1024, maxPerKey=4, minBytes=4096):
+        self.maxBytes = maxBytes
+        self.maxPerKey = maxPerKey
+        self.minBytes = minBytes
+        self.idle = {}
+        self.issued = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def start(self):
+        """Make this the active pool for the current thread"""
+        global ACTIVE
+        stack = getattr(_local, 'pools', None)
+        if stack is None:
+            stack = _local.pools = []
+        stack.append(self)
+        with _lock:
+            ACTIVE += 1
+        return self
+
+    def stop(self):
+        """Restore the previously active pool (if any) for this thread"""
+        global ACTIVE
+        stack = getattr(_local, 'pools', None)
+        if stack and stack[-1] is self:
+            stack.pop()
+            with _lock:
+                ACTIVE -= 1
+        return self
+
+    __enter__ = start
+
+    def __exit__(self, exc_type=None, exc_val=None, exc_tb=None):
+        self.stop()
+        return False
+
+    def clear(self):
+        """Discard all idle arrays"""
+        self.idle = {}
+        self.bytes = 0
+
+    def zeros(self, arrayType, dims):
+        """Retrieve a zero-filled array of arrayType with dims, reusing released arrays"""
+        dims = tuple(dims)
+        key = (arrayType.returnHandler(), arrayType.typeConstant, dims)
+        available = self.idle.get(key)
+        if available:
+            array, nbytes = available.pop()
+            self.bytes -= nbytes
+            ctypes.memset(arrayType.dataPointer(array), 0, nbytes)
+            self.hits += 1
+        else:
+            array = arrayType.zeros(dims)
+            nbytes = arrayType.arrayByteCount(array)
+            if nbytes < self.minBytes:
+                return array
+            self.misses += 1
+        self._track(array, key, nbytes)
+        return array
+
+    def _track(self, array, key, nbytes):
+        """Remember key for array (without keeping it alive) until released"""
+        identity = id(array)
+
+        def forget(ref, identity=identity, issued=self.issued):
+            record = issued.get(identity)
+            if record is not None and record[0] is ref:
+                del issued[identity]
+
+        try:
+            ref = weakref.ref(array, forget)
+        except TypeError:
+            # not weak-referenceable, can't be recognised on release
+            return
+        self.issued[identity] = (ref, key, nbytes)
+
+    def release(self, array):
+        """Return array to the pool for reuse, returns True if it was pooled
+
+        Arrays which were not allocated by this pool, or which do not
+        fit within maxBytes/maxPerKey, are ignored.
+        """
+        record = self.issued.get(id(array))
+        if record is None or record[0]() is not array:
+            return False
+        del self.issued[id(array)]
+        ref, key, nbytes = record
+        available = self.idle.setdefault(key, [])
+        if len(available) >= self.maxPerKey or self.bytes + nbytes > self.maxBytes:
+            return False
+        available.append((array, nbytes))
+        self.bytes += nbytes
+        return True
+
+
+def zeros(arrayType, dims):
+    """Allocate an output array from the thread's active pool (if any)"""
+    pool = current()
+    if pool is None:
+        return arrayType.zeros(dims)
+    return pool.zeros(arrayType, dims)
+
+
+def release(array):
+    """Return array to the thread's active pool (no-op if none is active)"""
+    pool = current()
+    if pool is None:
+        return False
+    return pool.release(array)
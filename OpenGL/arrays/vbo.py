@@ -43,7 +43,7 @@ from OpenGL._bytes import long, integer_types
 
 import weakref
 
-__all__ = ('VBO', 'VBOHandler', 'mapVBO')
+__all__ = ('VBO', 'VBOHandler', 'mapVBO', 'StreamingVBO')
 
 
 class Implementation(object):
@@ -59,6 +59,10 @@ class Implementation(object):
     @classmethod
     def get_implementation(cls, *args):
         if cls.CHOSEN is None:
+            if not cls.IMPLEMENTATION_CLASSES:
+                # e.g. OpenGL.LAZY_GL_NAMESPACE, which doesn't register these
+                from OpenGL.GL import vboimplementation
+                from OpenGL.GL.ARB import vboimplementation
             for possible in cls.IMPLEMENTATION_CLASSES:
                 implementation = possible()
                 if possible:
@@ -141,6 +145,45 @@ class Implementation(object):
 
 get_implementation = Implementation.get_implementation
 
+# dirty ranges closer than this many bytes are uploaded as one range
+COALESCE_GAP = 1024
+
+
+def dirtySpan(index, length):
+    """Calculate the (start, stop) row span touched by index on length rows
+
+    index -- slice (possibly stepped or negative) or integer index
+
+    returns None if no rows are touched
+    """
+    if isinstance(index, slice):
+        rows = range(*index.indices(length))
+        if not rows:
+            return None
+        first, last = rows[0], rows[-1]
+        if first > last:
+            first, last = last, first
+        return first, last + 1
+    index = int(index)
+    if index < 0:
+        index += length
+    return index, index + 1
+
+
+def mergeRanges(ranges, gap=0):
+    """Merge (start, stop) ranges which overlap or are within gap of each other
+
+    returns sorted list of disjoint (start, stop) ranges
+    """
+    result = []
+    for start, stop in sorted(ranges):
+        if result and start <= result[-1][1] + gap:
+            if stop > result[-1][1]:
+                result[-1] = (result[-1][0], stop)
+        else:
+            result.append((start, stop))
+    return result
+
 from OpenGL import acceleratesupport
 
 VBO = None
@@ -168,6 +211,7 @@ if VBO is None:
         """
 
         copied = False
+        coalesce_gap = COALESCE_GAP
         _no_cache_ = True  # do not cache in context data arrays
 
         def __init__(
@@ -249,53 +293,37 @@ if VBO is None:
         def __setitem__(self, slice, array):
             """Set slice of data on the array and vbo (if copied already)
 
-            slice -- the Python slice object determining how the data should
-                be copied into the vbo/array
+            slice -- the Python slice object (or integer index) determining
+                how the data should be copied into the vbo/array, stepped
+                slices are supported
             array -- something array-compatible that will be used as the
                 source of the data, note that the data-format will have to
                 be the same as the internal data-array to work properly, if
                 not, the amount of data copied will be wrong.
 
-            This is a reasonably complex operation, it has to have all sorts
-            of state-aware changes to correctly map the source into the low-level
-            OpenGL view of the buffer (which is just bytes as far as the GL
-            is concerned).
+            The assignment is made on our data-array immediately, while the
+            GL-side update is recorded as a dirty byte-range which is
+            merged with the other dirty ranges and uploaded from our
+            data-array on the next bind (see copy_data).
             """
-            if slice.step and not slice.step == 1:
-                raise NotImplementedError(
-                    """Don't know how to map stepped arrays yet"""
-                )
             # TODO: handle e.g. mapping character data into an integer data-set
             data = ArrayDatatype.asArray(array)
-            # data_length = ArrayDatatype.arrayByteCount(array)
-            start = slice.start or 0
-            stop = slice.stop or len(self.data)
-            if start < 0:
-                start += len(self.data)
-                start = max((start, 0))
-            if stop < 0:
-                stop += len(self.data)
-                stop = max((stop, 0))
             self.data[slice] = data
             if self.copied and self.buffers:
-                if start - stop == len(self.data):
+                span = dirtySpan(slice, len(self.data))
+                if span is None:
+                    return
+                start, stop = span
+                if stop - start == len(self.data):
                     # re-copy the whole data-set
                     self.copied = False
-                elif len(data):
-                    # now the fun part, we need to make the array match the
-                    # structure of the array we're going to copy into and make
-                    # the "size" parameter match the value we're going to copy in,
-                    # note that a 2D array (rather than a 1D array) may require
-                    # multiple mappings to copy into the memory area...
-
-                    # find the step size from the dimensions and base size...
-                    size = ArrayDatatype.arrayByteCount(self.data[0])
-                    # baseSize = ArrayDatatype.unitSize( data )
-                    # now create the start and distance values...
-                    start *= size
-                    stop *= size
+                    del self._copy_segments[:]
+                else:
+                    # rows of a 2D array are contiguous, so the affected
+                    # byte range is just the row span times the row size...
+                    size = ArrayDatatype.arrayByteCount(self.data) // len(self.data)
                     # wait until the last moment (bind) to copy the data...
-                    self._copy_segments.append((start, (stop - start), data))
+                    self._copy_segments.append((start * size, stop * size))
 
         def __len__(self):
             """Delegate length/truth checks to our data-array"""
@@ -333,17 +361,24 @@ if VBO is None:
 
             Ensures that the GL's version of the data in the VBO matches our
             internal view of the data, either by copying the entire data-set
-            over with glBufferData or by updating the already-transferred
-            data with glBufferSubData.
+            over with glBufferData or by updating the dirty ranges of the
+            already-transferred data with glBufferSubData.  Dirty ranges
+            which overlap or are separated by no more than coalesce_gap
+            bytes are merged (re-uploading the unchanged bytes between
+            them) to reduce the number of driver calls.
             """
             assert self.buffers, """Should do create_buffers before copy_data"""
             if self.copied:
                 if self._copy_segments:
-                    while self._copy_segments:
-                        start, size, data = self._copy_segments.pop(0)
-                        dataptr = ArrayDatatype.voidDataPointer(data)
+                    ranges = mergeRanges(self._copy_segments, self.coalesce_gap)
+                    del self._copy_segments[:]
+                    base = ArrayDatatype.dataPointer(self.data)
+                    for start, stop in ranges:
                         self.implementation.glBufferSubData(
-                            self.target, start, size, dataptr
+                            self.target,
+                            start,
+                            stop - start,
+                            ctypes.c_void_p(base + start),
                         )
             else:
                 if self.data is not None and self.size is None:
@@ -355,6 +390,7 @@ if VBO is None:
                     self.usage,
                 )
                 self.copied = True
+                del self._copy_segments[:]
 
         def delete(self):
             """Delete this buffer explicitly"""
@@ -499,6 +535,275 @@ if VBO is None:
             return ctypes.c_void_p(instance.offset)
 
 
+class StreamingVBO(object):
+    """Persistently-mapped ring buffer for per-frame dynamic data
+
+    Allocates immutable storage (glBufferStorage) large enough for
+    `segments` copies of an array of the given shape/dtype, maps it once
+    with GL_MAP_PERSISTENT_BIT|GL_MAP_COHERENT_BIT and exposes each
+    segment as a numpy view.  Each frame you write directly into the
+    current segment (no intermediate copy, no glBufferSubData) and then
+    call advance() after issuing the draw calls that use it:
+
+        stream = vbo.StreamingVBO( (count,3), 'f' )
+        ...
+        stream.data[:] = positions  # or compute in place
+        with stream:
+            glVertexPointer( 3, GL_FLOAT, 0, stream )
+            glDrawArrays( GL_POINTS, 0, count )
+        stream.advance()
+
+    advance() inserts a fence (glFenceSync) after the draws using the
+    current segment and moves on to the next; it only waits
+    (glClientWaitSync) if the GL has not yet finished with the segment
+    it is about to hand out, so with the default triple-buffering the
+    CPU never stalls on the GPU in steady state.
+
+    Passing the instance as array data uses the current segment's
+    offset into the bound buffer (stream + n gives a further offset).
+
+    Requires OpenGL 4.4 (or GL_ARB_buffer_storage) and OpenGL 3.2 sync
+    objects; this class does not use the VBO Implementation abstraction
+    and is not available under GLES.
+    """
+
+    _no_cache_ = True  # do not cache in context data arrays
+    TIMEOUT = 1000000000  # nanoseconds per glClientWaitSync call
+
+    def __init__(
+        self,
+        shape,
+        dtype='f',
+        target='GL_ARRAY_BUFFER',
+        segments=3,
+        alignment=256,
+    ):
+        """Initialize the streaming buffer (no GL operations occur here)
+
+        shape -- shape of the per-frame numpy array
+        dtype -- numpy dtype of the per-frame array
+        target -- VBO target to which to bind
+        segments -- number of segments in the ring (3 for triple buffering)
+        alignment -- byte alignment of each segment's start, the default
+            satisfies GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT on common hardware
+        """
+        import numpy
+
+        self.shape = tuple(shape) if isinstance(shape, (tuple, list)) else (shape,)
+        self.dtype = numpy.dtype(dtype)
+        self.target = target
+        self.segments = segments
+        self.nbytes = int(numpy.prod(self.shape)) * self.dtype.itemsize
+        self.stride = -(-self.nbytes // alignment) * alignment
+        self.size = self.stride * segments
+        self.index = 0
+        self.buffers = []
+        self.views = []
+        self.fences = [None] * segments
+        self.waits = 0
+        self._mapping = None
+
+    def _functions(self):
+        """Import the (raw) GL entry points used for streaming"""
+        from OpenGL.raw.GL.VERSION import GL_1_5, GL_3_0, GL_3_2, GL_4_4
+
+        return GL_1_5, GL_3_0, GL_3_2, GL_4_4
+
+    @property
+    def implementation(self):
+        return get_implementation()
+
+    def create_buffers(self):
+        """Allocate immutable storage and map it persistently"""
+        assert not self.buffers, """Already created the buffer"""
+        from numpy import frombuffer
+
+        GL_1_5, GL_3_0, GL_3_2, GL_4_4 = self._functions()
+        if not GL_4_4.glBufferStorage:
+            raise error.NullFunctionError(
+                """StreamingVBO requires glBufferStorage (OpenGL 4.4/ARB_buffer_storage)"""
+            )
+        if isinstance(self.target, (bytes, unicode)):
+            self.target = getattr(
+                self.implementation, self.implementation.basename(self.target)
+            )
+        buffer = _types.GLuint(0)
+        GL_1_5.glGenBuffers(1, buffer)
+        self.buffers = [long(buffer.value)]
+        self.implementation._DELETERS_[id(self)] = weakref.ref(
+            self, self.implementation.deleter(self.buffers, id(self))
+        )
+        flags = (
+            GL_4_4.GL_MAP_WRITE_BIT
+            | GL_4_4.GL_MAP_PERSISTENT_BIT
+            | GL_4_4.GL_MAP_COHERENT_BIT
+        )
+        GL_1_5.glBindBuffer(self.target, self.buffers[0])
+        try:
+            GL_4_4.glBufferStorage(self.target, self.size, None, flags)
+            pointer = GL_3_0.glMapBufferRange(self.target, 0, self.size, flags)
+        finally:
+            GL_1_5.glBindBuffer(self.target, 0)
+        if not pointer:
+            raise error.GLError(
+                description='Unable to persistently map streaming buffer',
+            )
+        self._mapping = (ctypes.c_ubyte * self.size).from_address(pointer)
+        raw = frombuffer(self._mapping, 'B')
+        self.views = [
+            raw[offset : offset + self.nbytes].view(self.dtype).reshape(self.shape)
+            for offset in range(0, self.size, self.stride)
+        ]
+        return self.buffers
+
+    @property
+    def data(self):
+        """numpy view of the current segment (write your frame's data here)"""
+        if not self.buffers:
+            self.create_buffers()
+        return self.views[self.index]
+
+    @property
+    def offset(self):
+        """Byte offset of the current segment within the buffer"""
+        return self.index * self.stride
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __int__(self):
+        """Get our VBO id"""
+        if not self.buffers:
+            self.create_buffers()
+        return self.buffers[0]
+
+    def __add__(self, other):
+        """Offset within the current segment, as a c_void_p"""
+        return ctypes.c_void_p(self.offset + other)
+
+    def wait(self, index):
+        """Wait until the GL has finished with segment index (if fenced)"""
+        fence = self.fences[index]
+        if fence is None:
+            return
+        GL_1_5, GL_3_0, GL_3_2, GL_4_4 = self._functions()
+        self.fences[index] = None
+        try:
+            while True:
+                result = GL_3_2.glClientWaitSync(
+                    fence, GL_3_2.GL_SYNC_FLUSH_COMMANDS_BIT, self.TIMEOUT
+                )
+                if result == GL_3_2.GL_WAIT_FAILED:
+                    raise error.GLError(
+                        description='glClientWaitSync failed for streaming segment %s'
+                        % (index,),
+                    )
+                if result != GL_3_2.GL_TIMEOUT_EXPIRED:
+                    break
+                self.waits += 1
+        finally:
+            GL_3_2.glDeleteSync(fence)
+
+    def advance(self):
+        """Fence the current segment and move to the next one
+
+        Call after issuing the draw calls which read the current segment.
+
+        returns the (writable) numpy view of the new current segment
+        """
+        if not self.buffers:
+            self.create_buffers()
+        GL_1_5, GL_3_0, GL_3_2, GL_4_4 = self._functions()
+        if self.fences[self.index] is not None:
+            GL_3_2.glDeleteSync(self.fences[self.index])
+        self.fences[self.index] = GL_3_2.glFenceSync(
+            GL_3_2.GL_SYNC_GPU_COMMANDS_COMPLETE, 0
+        )
+        self.index = (self.index + 1) % self.segments
+        self.wait(self.index)
+        return self.views[self.index]
+
+    def bind(self):
+        """Bind the streaming buffer to its target"""
+        if not self.buffers:
+            self.create_buffers()
+        self._functions()[0].glBindBuffer(self.target, self.buffers[0])
+
+    def unbind(self):
+        """Unbind the buffer (make normal array operations active)"""
+        self._functions()[0].glBindBuffer(self.target, 0)
+
+    __enter__ = bind
+
+    def __exit__(self, exc_type=None, exc_val=None, exc_tb=None):
+        """Context manager exit"""
+        self.unbind()
+        return False  # do not supress exceptions...
+
+    def delete(self):
+        """Delete the fences and buffer (which implicitly unmaps it)"""
+        GL_1_5, GL_3_0, GL_3_2, GL_4_4 = self._functions()
+        for i, fence in enumerate(self.fences):
+            if fence is not None:
+                self.fences[i] = None
+                try:
+                    GL_3_2.glDeleteSync(fence)
+                except (AttributeError, error.NullFunctionError) as err:
+                    pass
+        self.views = []
+        self._mapping = None
+        while self.buffers:
+            try:
+                GL_1_5.glDeleteBuffers(1, _types.GLuint(self.buffers.pop(0)))
+            except (AttributeError, error.NullFunctionError) as err:
+                pass
+
+
+class StreamingVBOHandler(FormatHandler):
+    """Handles StreamingVBO instances passed in as array data
+
+    The data pointer is the byte offset of the instance's current segment
+    within the (bound) buffer.
+    """
+
+    def dataPointer(self, instance):
+        """Retrieve the current segment's offset"""
+        return instance.offset
+
+    def from_param(self, instance, typeCode=None):
+        """Returns a c_void_p( instance.offset )"""
+        return ctypes.c_void_p(instance.offset)
+
+    def zeros(self, dims, typeCode):
+        """Not implemented"""
+        raise NotImplementedError("""Don't have VBO output support yet""")
+
+    ones = zeros
+
+    def asArray(self, value, typeCode=None):
+        """Given a value, convert to array representation"""
+        return value
+
+    def arrayToGLType(self, value):
+        """Given a value, guess OpenGL type of the corresponding pointer"""
+        return ArrayDatatype.arrayToGLType(value.data)
+
+    def arrayByteCount(self, value):
+        return value.nbytes
+
+    def arraySize(self, value, typeCode=None):
+        """Given a data-value, calculate dimensions for the array"""
+        return ArrayDatatype.arraySize(value.data)
+
+    def unitSize(self, value, typeCode=None):
+        """Determine unit size of an array (if possible)"""
+        return ArrayDatatype.unitSize(value.data)
+
+    def dimensions(self, value, typeCode=None):
+        """Determine dimensions of the passed array value (if possible)"""
+        return ArrayDatatype.dimensions(value.data)
+
+
 _cleaners = {}
 
 
@@ -0,0 +1,185 @@
+"""Batched submission of raw GL calls with a single error check
+
+Every call through a raw entry point pays ctypes argument conversion
+and (with OpenGL.ERROR_CHECKING) a glGetError round trip.  Renderers
+that issue hundreds or thousands of small state-setting calls per frame
+can instead record those calls into a Batch:
+
+    from OpenGL import batch
+    from OpenGL.raw.GL.VERSION.GL_2_0 import glUniform1f
+    frame = batch.Batch()
+    frame.add(glBindTexture, GL_TEXTURE_2D, texture)
+    frame.add(glUniform1f, location, 0.5)
+    frame.add(glDrawElements, GL_TRIANGLES, count, GL_UNSIGNED_INT, None)
+    frame()  # replay, calling glGetError once at the end
+
+Arguments are converted to ctypes values when the call is recorded
+(the "packed" form), and replay calls function pointers which have no
+per-argument conversion and no errcheck hook.  A recorded batch can be
+replayed any number of times (it holds references to the recorded
+argument objects, so arrays passed in stay alive and are *not* copied).
+
+Higher-level wrappers (e.g. OpenGL.GL.glGetIntegerv) are unwrapped to
+their underlying raw entry point, so output-array creation, size
+inference and similar conveniences do *not* apply to recorded calls;
+pass the same values you would pass to the OpenGL.raw.* function.
+
+Function pointers are resolved on first use and cached per raw entry
+point, so (as with extension entry points generally) recorded batches
+should be used with the context current when the entry point was
+first recorded.
+"""
+
+import ctypes, logging
+from OpenGL import platform, error
+from OpenGL.platform.baseplatform import _NullFunctionPointer
+
+_log = logging.getLogger('OpenGL.batch')
+
+_POINTER_CODES = ('P', 'z', 'Z')
+_UNCHECKED = {}
+
+
+def rawFunction(function):
+    """Find the raw (null-function-pointer) entry point underlying function
+
+    Unwraps OpenGL.wrapper.Wrapper and OpenGL.lazywrapper instances,
+    raises TypeError if function is not (ultimately) a raw entry point.
+    """
+    seen = function
+    while not isinstance(function, _NullFunctionPointer):
+        base = getattr(function, 'wrappedOperation', None)
+        if base is None or base is function:
+            raise TypeError("""Can only batch raw GL entry points, got %r""" % (seen,))
+        function = base
+    return function
+
+
+def _cFunction(loaded):
+    """Strip context-checking/logging proxies from a loaded ctypes function"""
+    while not isinstance(loaded, ctypes._CFuncPtr):
+        if 'func' in getattr(loaded, '__dict__', {}):
+            loaded = loaded.__dict__['func']
+        elif '' in getattr(loaded, '__dict__', {}):
+            loaded = loaded.__dict__['']
+        else:
+            raise TypeError("""Unable to find ctypes function in %r""" % (loaded,))
+    return loaded
+
+
+def uncheckedFunction(function):
+    """Retrieve (cached) unchecked function pointer and argtypes for function
+
+    returns (pointer, argtypes) where pointer is a ctypes function object
+    with the entry point's restype, no argtypes (arguments must already
+    be ctypes values) and no errcheck.
+    """
+    raw = rawFunction(function)
+    current = _UNCHECKED.get(raw)
+    if current is None:
+        loaded = raw.load()
+        if not loaded:
+            raise error.NullFunctionError(
+                """Attempt to batch an undefined function %s""" % (raw.__name__,)
+            )
+        loaded = _cFunction(loaded)
+        address = ctypes.cast(loaded, ctypes.c_void_p).value
+        prototype = platform.PLATFORM.functionTypeFor(raw.DLL)(loaded.restype)
+        pointer = prototype(address)
+        pointer.argtypes = None
+        current = _UNCHECKED[raw] = (pointer, tuple(loaded.argtypes or ()))
+    return current
+
+
+def packArgument(argtype, value):
+    """Convert value to a ctypes value compatible with argtype"""
+    if isinstance(argtype, type):
+        if isinstance(value, argtype):
+            return value
+        if (
+            issubclass(argtype, ctypes._SimpleCData)
+            and argtype._type_ not in _POINTER_CODES
+        ):
+            return argtype(value)
+    converted = argtype.from_param(value)
+    if isinstance(converted, int):
+        # raw addresses must not be passed as C ints...
+        converted = ctypes.c_void_p(converted)
+    return converted
+
+
+class Batch(object):
+    """Recorder/replayer for a sequence of raw GL calls
+
+    Attributes:
+
+        calls -- list of (pointer, packedArguments, name) tuples
+        sources -- list of original argument tuples, retained to keep
+            arrays and the like alive while the batch is in use
+        errorChecker -- the OpenGL.error._ErrorChecker used after replay,
+            defaults to the checker for the first recorded entry point
+    """
+
+    def __init__(self, errorChecker=None):
+        """Initialise the (empty) batch"""
+        self.calls = []
+        self.sources = []
+        self.errorChecker = errorChecker
+
+    def __len__(self):
+        return len(self.calls)
+
+    def __repr__(self):
+        return '%s( %s calls )' % (self.__class__.__name__, len(self.calls))
+
+    def add(self, function, *args):
+        """Record a call to function with args, return the call index
+
+        Arguments are converted immediately, so conversion errors
+        (e.g. ctypes.ArgumentError) are raised here rather than on replay.
+        """
+        pointer, argtypes = uncheckedFunction(function)
+        if len(args) != len(argtypes):
+            raise TypeError(
+                """%s requires %s arguments, received %s: %r"""
+                % (
+                    getattr(function, '__name__', function),
+                    len(argtypes),
+                    len(args),
+                    args,
+                )
+            )
+        try:
+            packed = tuple(
+                [packArgument(argtype, value) for argtype, value in zip(argtypes, args)]
+            )
+        except (TypeError, ValueError) as err:
+            raise ctypes.ArgumentError(
+                """Unable to pack arguments for %s: %s"""
+                % (getattr(function, '__name__', function), err)
+            )
+        if self.errorChecker is None:
+            self.errorChecker = rawFunction(function).error_checker
+        self.calls.append((pointer, packed, getattr(function, '__name__', None)))
+        self.sources.append(args)
+        return len(self.calls) - 1
+
+    def clear(self):
+        """Remove all recorded calls"""
+        del self.calls[:]
+        del self.sources[:]
+
+    def replay(self):
+        """Issue every recorded call, then check for GL errors once
+
+        Raises the error checker's error class (normally GLError) with
+        baseOperation set to this batch if an error was flagged by any
+        call in the batch.
+        """
+        for pointer, packed, name in self.calls:
+            pointer(*packed)
+        if self.errorChecker:
+            self.errorChecker.checkpoint(None, self, None)
+        return len(self.calls)
+
+    __call__ = replay
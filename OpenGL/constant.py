@@ -1,7 +1,19 @@
-"""Implementation of OpenGL constant objects"""
-import sys
+"""Implementation of OpenGL constant objects
+
+Constants are interned, the raw modules for the core and for every
+extension which mentions e.g. GL_TEXTURE_2D all share a single
+Constant object.  Constant instances carry no __dict__, their names
+are held in a module-level table (keyed by the identity of the
+interned constant), which also provides a value to names reverse
+index (see namesFor) for error reporting.
+"""
+import threading
 from OpenGL._bytes import bytes,unicode,as_8_bit, long, integer_types, maxsize
-from OpenGL import _configflags
+
+_INTERNED = {} # name (or (cls, name, value) on collision): constant
+_NAMES = {} # id(constant): name
+_BY_VALUE = {} # value: (name,...), rebuilt on demand
+_lock = threading.Lock()
 
 class Constant( object ):
     """OpenGL constant that displays itself as a name rather than a value
@@ -10,7 +22,11 @@ class Constant( object ):
     as you recieve messages that say what value you passed in in a
     human-readable form, rather than as a bald number that requires
     lookup and disambiguation in the header file.
+
+    Constructing a constant with a name and value which has already
+    been registered returns the existing (interned) constant.
     """
+    __slots__ = ()
     def __new__( cls, name, value=None ):
         """Initialise the constant with the given name and value"""
         if not isinstance( value, Constant ):
@@ -25,13 +41,27 @@ class Constant( object ):
         if isinstance( value, integer_types ):
             if value > maxsize: # TODO: I'm guessing this should really by sizeof GLint, not 
                 value = - (value & maxsize)
-        base = super(Constant,cls).__new__( cls, value )
-        base.name = name
-        if _configflags.MODULE_ANNOTATIONS:
-            frame = sys._getframe().f_back
-            if frame and frame.f_back and '__name__' in frame.f_back.f_globals:
-                base.__module__ = frame.f_back.f_globals['__name__']
-        return base
+        current = _INTERNED.get( name )
+        if current is not None and current.__class__ is cls and current == value:
+            return current
+        with _lock:
+            if current is None:
+                key = name
+            else:
+                # same name with a different value/type, rare enough not to optimise
+                key = (cls, name, value)
+                current = _INTERNED.get( key )
+                if current is not None:
+                    return current
+            current = super(Constant,cls).__new__( cls, value )
+            _NAMES[id(current)] = name
+            _INTERNED[key] = current
+            _BY_VALUE.clear()
+        return current
+    @property
+    def name( self ):
+        """The (GL header) name of the constant"""
+        return _NAMES[id(self)]
     def __repr__( self ):
         """Return the name, rather than the bald value"""
         return self.name
@@ -39,8 +69,41 @@ class Constant( object ):
         """Produce the new arguments for recreating the instance"""
         return (self.name,) + super( Constant, self ).__getnewargs__()
 
+def namesFor( value ):
+    """Retrieve the names of all registered constants with the given value
+
+    Only constants which have been created (i.e. whose raw modules have
+    been imported) are known, returns () for unknown values.  The
+    reverse index is built on first use (and after new registrations),
+    it is intended for error reporting rather than inner loops.
+    """
+    index = _BY_VALUE
+    if not index:
+        with _lock:
+            for constant in _INTERNED.values():
+                name = _NAMES[id(constant)]
+                try:
+                    names = index.get( constant, () )
+                except TypeError:
+                    continue
+                if name not in names:
+                    index[constant] = names + (name,)
+    try:
+        return index.get( value, () )
+    except TypeError:
+        # unhashable values are never constants
+        return ()
+
+def nameFor( value, prefix=None ):
+    """Retrieve the first registered name for value (optionally with prefix) or None"""
+    for name in namesFor( value ):
+        if prefix is None or name.startswith( prefix ):
+            return name
+    return None
+
 class NumericConstant( Constant ):
     """Base class for numeric-value constants"""
+    __slots__ = ()
     def __str__( self ):
         """Return the value as a human-friendly string"""
         return '%s (%s)'%(self.name,super(Constant,self).__str__())
@@ -48,20 +111,24 @@ class NumericConstant( Constant ):
         """Retrieve state for pickle and the like"""
         return self.name
     def __setstate__( self, state ):
-        self.name = state
+        """Name is registered by __new__ (via __getnewargs__)"""
 
 class IntConstant( NumericConstant, int ):
     """Integer constant"""
+    __slots__ = ()
 if int is not long:
     class LongConstant( NumericConstant, long ):
         """Long integer constant"""
+        __slots__ = ()
 else:
     LongConstant = IntConstant
 class FloatConstant( NumericConstant, float ):
     """Float constant"""
+    __slots__ = ()
 
 class StringConstant( Constant, bytes ):
     """String constants"""
+    __slots__ = ()
     def __repr__( self ):
         """Return the value as a human-friendly string"""
         return '%s (%s)'%(self.name,super(Constant,self).__str__())
@@ -17,16 +17,44 @@ setting:
     OpenGL.STORE_POINTERS = False 
         
 before importing OpenGL functionality.
+
+Current-context caching:
+
+If OpenGL.CACHE_CURRENT_CONTEXT is True, the current context 
+handle is cached per-thread rather than being queried from 
+the platform (a ctypes call) on every lookup.  The cache is 
+invalidated by PyOpenGL's own make-current entry points 
+(eglMakeCurrent, glXMakeCurrent, glXMakeContextCurrent, 
+wglMakeCurrent, OSMesaMakeCurrent, glutSetWindow), code which 
+changes the current context by other means (e.g. a GUI 
+toolkit) must call invalidateContext() after doing so.
+
+Slots:
+
+Frequently-used keys (e.g. the array-pointer constants used 
+by glVertexPointer and friends) can be assigned a slot with 
+slotFor( key ), after which getSlot/setSlot store the value 
+in a per-context list rather than a dictionary.  getValue and 
+setValue transparently use the slot for such keys.  Slot 
+values are always held with strong references.
 """
 from OpenGL import platform
-import weakref
+from OpenGL._configflags import CACHE_CURRENT_CONTEXT
+import threading, weakref
 storedPointers = {
     # map from contextID: { constant: value }
 }
 storedWeakPointers = {
     # map from contextID: WeakValueDictionary({ constant: value })
 }
+storedSlots = {
+    # map from contextID: [ value, ... ] indexed by slotFor( constant )
+}
 STORAGES = [ storedPointers, storedWeakPointers ]
+SLOTS = {
+    # map from constant: slot index
+}
+_current = threading.local()
 
 def getContext( context = None ):
     """Get the context (if passed, just return)
@@ -34,13 +62,67 @@ def getContext( context = None ):
     context -- the context ID, if None, the current context
     """
     if context is None:
-        context = platform.GetCurrentContext()
+        if CACHE_CURRENT_CONTEXT:
+            context = getattr( _current, 'context', None )
+            if context is None:
+                context = platform.GetCurrentContext()
+                if context:
+                    _current.context = context
+        else:
+            context = platform.GetCurrentContext()
         if context == 0:
             from OpenGL import error
             raise error.Error(
                 """Attempt to retrieve context when no valid context"""
             )
     return context
+def invalidateContext( context=None ):
+    """Notify us that the current context for this thread has changed
+    
+    context -- if provided, the new current context's ID, otherwise 
+        the next lookup will query the platform 
+    
+    Only has an effect if OpenGL.CACHE_CURRENT_CONTEXT is True
+    """
+    _current.context = context or None
+def slotFor( constant ):
+    """Retrieve (allocating if necessary) the slot index for constant"""
+    slot = SLOTS.get( constant )
+    if slot is None:
+        slot = SLOTS[constant] = len( SLOTS )
+        # migrate any values already stored under the key
+        for context, storage in list( storedPointers.items() ):
+            if constant in storage:
+                _slotStorage( context )[slot] = storage.pop( constant )
+    return slot
+def _slotStorage( context ):
+    """Retrieve the (growing as required) slot list for context"""
+    current = storedSlots.get( context )
+    if current is None:
+        current = storedSlots[context] = [None] * len( SLOTS )
+    elif len( current ) < len( SLOTS ):
+        current.extend( [None] * (len( SLOTS ) - len( current )) )
+    return current
+def setSlot( slot, value, context=None ):
+    """Set value in the given slot (see slotFor) for the given context 
+    
+    returns the previous value
+    """
+    if getattr( value, '_no_cache_', False ):
+        return 
+    context = getContext( context )
+    current = storedSlots.get( context )
+    if current is None or len( current ) <= slot:
+        current = _slotStorage( context )
+    previous = current[slot]
+    current[slot] = value
+    return previous
+def getSlot( slot, context=None ):
+    """Get value stored in the given slot (see slotFor) for the given context"""
+    current = storedSlots.get( getContext( context ) )
+    if current is None or len( current ) <= slot:
+        return None
+    return current[slot]
 def setValue( constant, value, context=None, weak=False ):
     """Set a stored value for the given context
     
@@ -53,6 +135,9 @@ def setValue( constant, value, context=None, weak=False ):
         Note: you should always pass the same value for "weak" for a given 
         constant, otherwise you will create two storages for the constant.
     """
+    slot = SLOTS.get( constant )
+    if slot is not None:
+        return setSlot( slot, value, context )
     if getattr( value, '_no_cache_', False ):
         return 
     context = getContext( context )
@@ -82,6 +167,9 @@ def delValue( constant, context=None ):
     constant -- Normally a GL constant value, but can be any hashable value 
     context -- the context identifier for which we're storing the value
     """
+    slot = SLOTS.get( constant )
+    if slot is not None:
+        return setSlot( slot, None, context ) is not None
     context = getContext( context )
     found = False
     for storage in STORAGES:
@@ -100,6 +188,9 @@ def getValue( constant, context = None ):
     constant -- unique ID for the type of data being retrieved
     context -- the context ID, if None, the current context
     """
+    slot = SLOTS.get( constant )
+    if slot is not None:
+        return getSlot( slot, context )
     context = getContext( context )
     for storage in STORAGES:
         contextStorage = storage.get( context  )
@@ -122,6 +213,9 @@ def cleanupContext( context=None ):
     """
     if context is None:
         context = platform.GetCurrentContext()
+    storedSlots.pop( context, None )
+    if getattr( _current, 'context', None ) == context:
+        _current.context = None
     for storage in STORAGES:
         try:
             del storedPointers[ context ]
@@ -129,3 +223,6 @@ def cleanupContext( context=None ):
             return False
         else:
             return True
+
+# well-known keys used on every extension/pointer lookup
+slotFor( 'extensions' )
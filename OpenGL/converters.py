@@ -227,6 +227,8 @@ if CallFuncPyConverter is None:
 
         def __call__(self, pyArgs, index, baseOperation):
             """Return pyArgs[ self.index ]"""
+            if outputpool.ACTIVE:
+                return outputpool.zeros(self.arrayType, self.getSize(pyArgs))
             return self.arrayType.zeros(self.getSize(pyArgs))
 
         def getSize(self, pyArgs):
@@ -381,3 +383,7 @@ class StringLengths(CConverter):
                 ctypes.c_char_p,
             )
         return result
+
+
+# imported last, OpenGL.arrays (whose package imports this module) may be mid-import
+from OpenGL.arrays import outputpool
@@ -6,10 +6,18 @@ such as TypeError or ValueError when appropriate.
 ErrorChecker is an _ErrorChecker instance that allows you
 to register a new error-checking function for use 
 throughout the system.
+
+Error checking frequency can be changed at run-time (as long 
+as ERROR_CHECKING was True at import time) with 
+setCheckInterval, which allows for checking only every Nth 
+call, or only at explicit checkpoint() calls, e.g. at frame 
+boundaries.  Errors found by a deferred check are annotated 
+with the pendingOperations which were called since the last 
+check.
 """
-import logging
+import logging, collections
 _log = logging.getLogger( 'OpenGL.error' )
-from OpenGL import platform, _configflags
+from OpenGL import platform, _configflags, constant
 from ctypes import ArgumentError
 __all__ = (
     "Error",'GLError','GLUError','GLUTError',
@@ -86,7 +94,9 @@ class GLError( Error ):
         'cArgs',
         'cArguments',
         'result', 
+        'pendingOperations',
     )
+    pendingOperations = None
     def __str__( self ):
         """Create a fully formatted representation of the error"""
         args = []
@@ -109,11 +119,28 @@ class GLError( Error ):
         return '%s( %s )'%(
             self.__class__.__name__,
             ", ".join([x for x in [
-                'err=%s'%(self.err),
+                self.format_err( 'err', self.err ).replace( ' = ', '=', 1 ),
                 self.format_description( 'description', self.description ) or '',
                 self.format_baseOperation( 'baseOperation', self.baseOperation ) or '',
             ] if x])
         )
+    def format_err( self, property, value ):
+        """Format the error code, adding the constant's name for bald integers"""
+        if isinstance( value, int ) and not isinstance( value, constant.Constant ):
+            # prefer names from the API which raised, e.g. EGL_ for egl* calls
+            operation = getattr( self.baseOperation, '__name__', '' )
+            prefix = ''
+            for character in operation:
+                if not character.islower():
+                    break
+                prefix += character
+            name = None
+            if prefix:
+                name = constant.nameFor( value, prefix.upper()+'_' )
+            name = name or constant.nameFor( value )
+            if name:
+                return '%s = %s (%s)'%( property, value, name )
+        return '%s = %s'%( property, self.shortRepr( value ) )
     def format_description( self, property, value ):
         """Format description using GLU's gluErrorString"""
         if value is None and self.err is not None:
@@ -152,6 +179,18 @@ class GLError( Error ):
         else:
             return '%s = %r'%( property, value )
 
+    def format_pendingOperations( self, property, value ):
+        """Format the set of operations since the last error check"""
+        if not value:
+            return None
+        return '%s = %s'%(
+            property,
+            self.shortRepr( [
+                getattr( operation, '__name__', operation )
+                for operation in value
+            ] ),
+        )
+
 class GLUError( Error ):
     """GLU error implementation class"""
 
@@ -176,8 +215,17 @@ if _configflags.ERROR_CHECKING:
                 _registeredChecker -- the checking function enabled when 
                     not doing onBegin/onEnd processing
                 _currentChecker -- currently active checking function
+                _checkInterval -- 1 to check after every call, N to 
+                    check after every Nth call, 0 to check only at 
+                    explicit checkpoint() calls
+                _pending -- operations called since the last check 
+                    (bounded to PENDING_LIMIT entries) when not 
+                    checking every call
             """
             _getErrors = None
+            _checkInterval = 1
+            _pending = None
+            PENDING_LIMIT = 256
             def __init__( self, platform, baseOperation=None, noErrorResult=0, errorClass=GLError ):
                 """Initialize from a platform module/reference"""
                 self._isValid = platform.CurrentContextIsValid
@@ -192,6 +240,7 @@ if _configflags.ERROR_CHECKING:
                 else:
                     self._registeredChecker = self.nullGetError
                 self._currentChecker = self._registeredChecker
+                self._callCount = 0
             def __bool__( self ):
                 """We are "true" if we actually do anything"""
                 if self._registeredChecker is self.nullGetError:
@@ -225,6 +274,13 @@ if _configflags.ERROR_CHECKING:
                     sequence.  If you are calling glBegin/glEnd in C you 
                     should call onBegin and onEnd appropriately.
                 """
+                if self._checkInterval != 1:
+                    pending = self._pending
+                    pending.append( baseOperation )
+                    self._callCount += 1
+                    if (not self._checkInterval) or self._callCount < self._checkInterval:
+                        return result
+                    return self.checkpoint( result, baseOperation, cArguments )
                 err = self._currentChecker()
                 if err != self._noErrorResult:
                     raise self._errorClass(
@@ -234,6 +290,59 @@ if _configflags.ERROR_CHECKING:
                         baseOperation = baseOperation,
                     )
                 return result
+            def setCheckInterval( self, interval=1 ):
+                """Set how often glGetError is queried (at run-time)
+                
+                interval -- 1 to check after every call (the default),
+                    N to check after every Nth call, 0 to check only 
+                    when checkpoint() is called
+                
+                Switching modes does a checkpoint() first, so errors 
+                from calls made under the previous mode are reported.
+                """
+                interval = int( interval )
+                if interval < 0:
+                    raise ValueError( """Check interval must be >= 0, got %r"""%( interval, ))
+                if self._pending:
+                    self.checkpoint()
+                self._checkInterval = interval
+                self._callCount = 0
+                if interval == 1:
+                    self._pending = None
+                else:
+                    self._pending = collections.deque( maxlen=self.PENDING_LIMIT )
+                return interval
+            def getCheckInterval( self ):
+                """Retrieve the current check interval (see setCheckInterval)"""
+                return self._checkInterval
+            def checkpoint( self, result=None, baseOperation=None, cArguments=None ):
+                """Check for errors now, attributing them to calls since the last check
+                
+                Raises our errorClass with pendingOperations set to the 
+                operations called since the last check.  Inside a 
+                glBegin/glEnd pair the check is postponed until the 
+                next checkpoint after glEnd.
+                """
+                if self._currentChecker is self.nullGetError and self._registeredChecker is not self.nullGetError:
+                    return result
+                err = self._currentChecker()
+                pending = self._pending
+                if pending is not None:
+                    operations = tuple( pending )
+                    pending.clear()
+                    self._callCount = 0
+                else:
+                    operations = ()
+                if err != self._noErrorResult:
+                    exception = self._errorClass(
+                        err,
+                        result,
+                        cArguments = cArguments,
+                        baseOperation = baseOperation,
+                    )
+                    exception.pendingOperations = operations
+                    raise exception
+                return result
             def onBegin( self ):
                 """Called by glBegin to record the fact that glGetError won't work"""
                 self._currentChecker = self.nullGetError
@@ -242,6 +351,40 @@ if _configflags.ERROR_CHECKING:
                 self._currentChecker = self._registeredChecker
 else:
     _ErrorChecker = None
+
+def _defaultChecker( checker ):
+    """Retrieve the given checker or the core GL error checker"""
+    if checker is None:
+        from OpenGL.raw.GL import _errors
+        checker = _errors._error_checker
+    return checker
+
+def setCheckInterval( interval, checker=None ):
+    """Set run-time error-checking frequency for checker (default GL)
+    
+    interval -- 1 to check after every call, N to check after 
+        every Nth call, 0 to check only at checkpoint() calls
+    
+    returns the previous interval, or None if error checking 
+    was disabled at import time (OpenGL.ERROR_CHECKING)
+    """
+    checker = _defaultChecker( checker )
+    if not checker:
+        return None
+    previous = checker.getCheckInterval()
+    checker.setCheckInterval( interval )
+    return previous
+
+def checkpoint( checker=None ):
+    """Check for errors since the last check on checker (default GL)
+    
+    Intended for use at frame boundaries when using 
+    setCheckInterval( 0 ) or sampled checking.
+    """
+    checker = _defaultChecker( checker )
+    if checker:
+        checker.checkpoint()
+
 # Compatibility with PyOpenGL 2.x series
 GLUerror = GLUError
 GLerror = GLError 
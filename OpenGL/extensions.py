@@ -2,11 +2,28 @@
 
 This module provides the tools required to check whether
 an extension is available
+
+Capability snapshots:
+
+    Querying the extension list of a modern driver requires one
+    glGetStringi call per extension (hundreds of calls).  A
+    CapabilitySnapshot records the version, extension set and a
+    set of glGet limits for a GL implementation (identified by its
+    GL_VENDOR, GL_RENDERER and GL_VERSION strings).  CapabilityCache
+    stores snapshots on disk so that short-lived processes can
+    skip the queries:
+
+        from OpenGL import extensions
+        # with the context current...
+        snapshot = extensions.CapabilityCache().install()
+        snapshot.limits.get( 'GL_MAX_TEXTURE_SIZE' )
+
+    Once installed, GL extension checks use the snapshot's bitset.
 """
 from OpenGL.latebind import LateBind
 from OpenGL._bytes import bytes,unicode,as_8_bit
 import OpenGL as root
-import sys
+import hashlib, json, os, sys, tempfile
 import logging
 _log = logging.getLogger( 'OpenGL.extensions' )
 VERSION_PREFIX = as_8_bit('GL_VERSION_GL_')
@@ -87,6 +104,7 @@ class ExtensionQuerier( object ):
     
     version = extensions = None
     version_string = extensions_string = None
+    snapshot = None
     
     registered = []
     def __init__( self ):
@@ -117,6 +135,9 @@ class ExtensionQuerier( object ):
                 return version
             return specifier <= version
         else:
+            snapshot = self.snapshot
+            if snapshot is not None:
+                return snapshot.hasExtension( specifier )
             extensions = self.getExtensions()
             return extensions and specifier in extensions
     def getVersion( self ):
@@ -127,6 +148,19 @@ class ExtensionQuerier( object ):
         if not self.extensions:
             self.extensions = self.pullExtensions()
         return self.extensions
+    def install( self, snapshot ):
+        """Use snapshot (a CapabilitySnapshot) rather than querying
+
+        Pass None to discard the snapshot and query on next use.
+        """
+        self.snapshot = snapshot
+        if snapshot is None:
+            self.version = self.version_string = self.extensions = None
+        else:
+            self.version = list( snapshot.version )
+            self.version_string = snapshot.versionString
+            self.extensions = list( snapshot.extensions )
+        return snapshot
 
 class _GLQuerier( ExtensionQuerier ):
     prefix = as_8_bit('GL_')
@@ -212,6 +246,207 @@ def hasExtension( specifier ):
     return ExtensionQuerier.hasExtension( specifier )
 hasGLExtension = hasGLUExtension = hasExtension
 
+EXTENSION_BITS = {
+    # extension name: bit index in CapabilitySnapshot.mask, shared
+    # by all snapshots in the process
+}
+def extensionBit( name ):
+    """Retrieve (allocating if necessary) the bitset index for name"""
+    bit = EXTENSION_BITS.get( name )
+    if bit is None:
+        bit = EXTENSION_BITS[name] = len( EXTENSION_BITS )
+    return bit
+
+class CapabilitySnapshot( object ):
+    """Version, extensions and limits of a GL implementation
+
+    vendor, renderer, versionString -- the GL_VENDOR, GL_RENDERER
+        and GL_VERSION strings identifying the implementation
+    version -- [major, minor] as from GLQuerier.getVersion()
+    extensions -- extension names (bytes), including those implied
+        by the version
+    limits -- {constant name: integer} for the LIMITS queried
+    mask -- integer bitset of extensions (see EXTENSION_BITS)
+    """
+    FORMAT = 1
+    LIMITS = (
+        'GL_MAX_TEXTURE_SIZE',
+        'GL_MAX_3D_TEXTURE_SIZE',
+        'GL_MAX_CUBE_MAP_TEXTURE_SIZE',
+        'GL_MAX_ARRAY_TEXTURE_LAYERS',
+        'GL_MAX_RENDERBUFFER_SIZE',
+        'GL_MAX_TEXTURE_IMAGE_UNITS',
+        'GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS',
+        'GL_MAX_VERTEX_ATTRIBS',
+        'GL_MAX_VERTEX_UNIFORM_COMPONENTS',
+        'GL_MAX_FRAGMENT_UNIFORM_COMPONENTS',
+        'GL_MAX_UNIFORM_BLOCK_SIZE',
+        'GL_MAX_DRAW_BUFFERS',
+        'GL_MAX_COLOR_ATTACHMENTS',
+        'GL_MAX_SAMPLES',
+        'GL_MAX_ELEMENTS_VERTICES',
+        'GL_MAX_ELEMENTS_INDICES',
+    )
+    def __init__( self, vendor, renderer, versionString, version, extensions, limits=None ):
+        self.vendor = as_8_bit( vendor or b'' )
+        self.renderer = as_8_bit( renderer or b'' )
+        self.versionString = as_8_bit( versionString or b'' )
+        self.version = list( version or [] )
+        self.extensions = [ as_8_bit( x ) for x in extensions or () ]
+        self.limits = dict( limits or {} )
+        mask = 0
+        for extension in self.extensions:
+            mask |= 1 << extensionBit( extension )
+        self.mask = mask
+    def __repr__( self ):
+        return '%s( %r, %r, %s extensions )'%(
+            self.__class__.__name__, self.renderer, self.versionString, len(self.extensions),
+        )
+    @property
+    def key( self ):
+        """The (vendor, renderer, versionString) identifying the implementation"""
+        return (self.vendor, self.renderer, self.versionString)
+    def hasExtension( self, name ):
+        """Check for extension name (bytes or str) using the bitset"""
+        bit = EXTENSION_BITS.get( name )
+        if bit is None:
+            name = as_8_bit( name ).replace( b'.', b'_' )
+            bit = EXTENSION_BITS.get( name )
+            if bit is None:
+                return False
+        return bool( (self.mask >> bit) & 1 )
+    @staticmethod
+    def currentKey( ):
+        """Retrieve (vendor, renderer, versionString) for the current context"""
+        from OpenGL.raw.GL.VERSION.GL_1_1 import glGetString, GL_VENDOR, GL_RENDERER, GL_VERSION
+        return tuple([
+            as_8_bit( glGetString( constant ) or b'' )
+            for constant in (GL_VENDOR, GL_RENDERER, GL_VERSION)
+        ])
+    @classmethod
+    def capture( cls, key=None ):
+        """Query the current context to produce a snapshot"""
+        from OpenGL import platform, error
+        if not platform.PLATFORM.CurrentContextIsValid():
+            raise error.Error( """Attempt to capture capabilities without a valid context""" )
+        if key is None:
+            key = cls.currentKey()
+        # an unregistered querier, so that no cached (or installed) values are used
+        querier = _GLQuerier.__new__( _GLQuerier )
+        version = querier.getVersion()
+        extensions = querier.getExtensions() or []
+        return cls( key[0], key[1], key[2], version, extensions, cls.pullLimits() )
+    @classmethod
+    def pullLimits( cls ):
+        """Query the integer LIMITS, skipping those unsupported by the context"""
+        from OpenGL import error
+        from OpenGL.raw.GL._types import GLint
+        from OpenGL.raw.GL.VERSION.GL_1_1 import glGetIntegerv, glGetError
+        from OpenGL.raw.GL.VERSION import GL_1_1, GL_1_2, GL_1_3, GL_2_0, GL_3_0, GL_3_1
+        limits = {}
+        value = GLint()
+        for name in cls.LIMITS:
+            constant = None
+            for module in (GL_1_1, GL_1_2, GL_1_3, GL_2_0, GL_3_0, GL_3_1):
+                constant = getattr( module, name, None )
+                if constant is not None:
+                    break
+            if constant is None:
+                continue
+            try:
+                glGetIntegerv( constant, value )
+                if glGetError():
+                    continue
+            except error.GLError:
+                continue
+            limits[name] = value.value
+        return limits
+    def toJSON( self ):
+        """Produce a json-compatible dictionary for the snapshot"""
+        return {
+            'format': self.FORMAT,
+            'vendor': self.vendor.decode( 'latin-1' ),
+            'renderer': self.renderer.decode( 'latin-1' ),
+            'versionString': self.versionString.decode( 'latin-1' ),
+            'version': self.version,
+            'extensions': [ x.decode( 'latin-1' ) for x in self.extensions ],
+            'limits': self.limits,
+        }
+    @classmethod
+    def fromJSON( cls, data ):
+        """Reconstruct from the result of toJSON, raises ValueError on mismatch"""
+        if not isinstance( data, dict ) or data.get( 'format' ) != cls.FORMAT:
+            raise ValueError( """Unrecognised capability snapshot format""" )
+        return cls(
+            data['vendor'].encode( 'latin-1' ),
+            data['renderer'].encode( 'latin-1' ),
+            data['versionString'].encode( 'latin-1' ),
+            data['version'],
+            [ x.encode( 'latin-1' ) for x in data['extensions'] ],
+            data.get( 'limits' ),
+        )
+
+class CapabilityCache( object ):
+    """On-disk store of CapabilitySnapshots keyed by vendor/renderer/version
+
+    Snapshots are only reused for an identical GL_VENDOR, GL_RENDERER
+    and GL_VERSION, so driver upgrades simply miss the cache.
+    """
+    def __init__( self, directory=None ):
+        """Initialise the cache
+
+        directory -- directory in which to store snapshots, defaults to
+            $PYOPENGL_CAPABILITY_CACHE_DIR or ~/.cache/pyopengl/capabilities
+        """
+        if directory is None:
+            directory = self.defaultDirectory()
+        self.directory = directory
+    @staticmethod
+    def defaultDirectory( ):
+        """Retrieve the default capability cache directory"""
+        return os.environ.get( 'PYOPENGL_CAPABILITY_CACHE_DIR' ) or os.path.join(
+            os.path.expanduser( '~' ), '.cache', 'pyopengl', 'capabilities',
+        )
+    def filename( self, key ):
+        """Retrieve the filename in which the snapshot for key is stored"""
+        digest = hashlib.sha256( b'\0'.join( key ) ).hexdigest()
+        return os.path.join( self.directory, '%s.json'%( digest, ) )
+    def get( self, key ):
+        """Retrieve the CapabilitySnapshot for key or None if not cached"""
+        try:
+            with open( self.filename( key ), 'r' ) as fh:
+                snapshot = CapabilitySnapshot.fromJSON( json.load( fh ) )
+        except (IOError, OSError, ValueError, KeyError, TypeError, AttributeError) as err:
+            return None
+        if snapshot.key != tuple( key ):
+            return None
+        return snapshot
+    def set( self, snapshot ):
+        """Store snapshot, returns success"""
+        try:
+            if not os.path.isdir( self.directory ):
+                os.makedirs( self.directory )
+            # write-then-rename so concurrent processes never see partial files
+            handle, temporary = tempfile.mkstemp( dir=self.directory, suffix='.tmp' )
+            with os.fdopen( handle, 'w' ) as fh:
+                json.dump( snapshot.toJSON(), fh )
+            os.replace( temporary, self.filename( snapshot.key ) )
+        except (IOError, OSError) as err:
+            _log.info( 'Unable to store capability snapshot for %r: %s', snapshot.renderer, err )
+            return False
+        return True
+    def snapshot( self ):
+        """Retrieve the snapshot for the current context, capturing and storing if needed"""
+        key = CapabilitySnapshot.currentKey()
+        snapshot = self.get( key )
+        if snapshot is None:
+            snapshot = CapabilitySnapshot.capture( key )
+            self.set( snapshot )
+        return snapshot
+    def install( self ):
+        """Retrieve the current context's snapshot and install it in GLQuerier"""
+        return GLQuerier.install( self.snapshot() )
+
 class _Alternate( LateBind ):
     def __init__( self, name, *alternates ):
         """Initialize set of alternative implementations of the same function"""
@@ -19,6 +19,11 @@ an image is processed in the system:
     OpenGL.UNSIGNED_BYTE_IMAGES_AS_STRING -- if this global value is set,
         then read of unsigned byte images using glReadPixels and 
         glGetTexImage produces a string instead of the default array format.
+    
+    OpenGL.UNSIGNED_BYTE_IMAGES_AS_MEMORYVIEW -- if this global value is 
+        set (along with UNSIGNED_BYTE_IMAGES_AS_STRING), the "string" is a 
+        read-only memoryview onto the result array rather than a copy, as 
+        is always the case when outputType=memoryview is passed.
 
 Attributes of Note:
 
@@ -33,6 +38,15 @@ Attributes of Note:
     RANK_PACKINGS -- commands required to set up default array-transfer 
         operations for an array of the specified rank.
 
+Pixel-store shadowing:
+
+    If OpenGL.SHADOW_PIXEL_STORE is True, the glPixelStorei calls made by 
+    setupDefaultTransferMode and rankPacking go through setPixelStore, 
+    which records the values set for each context and skips calls which 
+    would not change anything.  Code which alters pixel-store state 
+    without going through OpenGL.GL.glPixelStorei/glPixelStoref/
+    glPopClientAttrib must call invalidatePixelStore() afterward.
+
 New image formats and types will need to be registered here to be supported,
 this means that extension modules which add image types/formats need to alter 
 the tables described above!
@@ -44,8 +58,12 @@ from OpenGL.raw.GL.VERSION import GL_1_1 as _simple
 from OpenGL import arrays
 from OpenGL import error
 from OpenGL import _configflags
+from OpenGL import contextdata
+from OpenGL.arrays import outputpool
 import ctypes
 
+PIXEL_STORE_SLOT = contextdata.slotFor( 'OpenGL.images.pixelStore' )
+
 def SetupPixelRead( format, dims, type):
     """Setup transfer mode for a read into a numpy array return the array
     
@@ -67,6 +85,11 @@ def setupDefaultTransferMode( ):
     seldom matters in image data).  These assumptions are normally correct 
     when dealing with Python libraries which expose byte-arrays.
     """
+    if _configflags.SHADOW_PIXEL_STORE:
+        shadow = pixelStoreShadow()
+        setPixelStore( _simple.GL_PACK_SWAP_BYTES, 0, shadow )
+        setPixelStore( _simple.GL_PACK_LSB_FIRST, 0, shadow )
+        return
     try:
         _simple.glPixelStorei(_simple.GL_PACK_SWAP_BYTES, 0)
         _simple.glPixelStorei(_simple.GL_PACK_LSB_FIRST, 0)
@@ -79,12 +102,61 @@ def rankPacking( rank ):
     
     Uses RANK_PACKINGS table to issue calls to glPixelStorei
     """
+    shadow = None
+    if _configflags.SHADOW_PIXEL_STORE:
+        shadow = pixelStoreShadow()
     for func,which,arg in RANK_PACKINGS[rank]:
+        if shadow is not None and func is _simple.glPixelStorei:
+            setPixelStore( which, arg, shadow )
+            continue
         try:
             func(which,arg)
         except error.GLError:
             pass
 
+def pixelStoreShadow( context=None ):
+    """Retrieve the {parameter: value} pixel-store shadow for the context"""
+    shadow = contextdata.getSlot( PIXEL_STORE_SLOT, context )
+    if shadow is None:
+        shadow = {}
+        contextdata.setSlot( PIXEL_STORE_SLOT, shadow, context )
+    return shadow
+
+def setPixelStore( which, value, shadow=None ):
+    """Set pixel-store parameter which to value unless already set
+    
+    shadow -- the pixelStoreShadow() for the current context, looked 
+        up if not provided
+    
+    GLErrors are ignored (GLES lacks some of the parameters), the value 
+    is recorded regardless so that unsupported parameters are not 
+    retried on every call.
+    
+    returns True if glPixelStorei was called
+    """
+    if shadow is None:
+        shadow = pixelStoreShadow()
+    if shadow.get( which ) == value:
+        return False
+    shadow[which] = value
+    try:
+        _simple.glPixelStorei( which, value )
+    except error.GLError:
+        pass
+    return True
+
+def invalidatePixelStore( which=None, context=None ):
+    """Forget shadowed pixel-store state for the context
+    
+    which -- a single parameter to forget, if None, all parameters
+    """
+    shadow = contextdata.getSlot( PIXEL_STORE_SLOT, context )
+    if shadow:
+        if which is None:
+            shadow.clear()
+        else:
+            shadow.pop( which, None )
+
 def createTargetArray( format, dims, type ):
     """Create storage array for given parameters
     
@@ -102,6 +174,9 @@ def createTargetArray( format, dims, type ):
     method relies on their being a registered default array-implementation for 
     the storage type.  The default installation of OpenGL-ctypes will use 
     Numpy arrays for returning the result.
+    
+    If an OpenGL.arrays.outputpool.OutputPool is active the array may be 
+    an array previously released to the pool (cleared before reuse).
     """
     # calculate the number of storage elements required to store 
     # a single pixel of format, that's the dimension of the resulting array
@@ -121,6 +196,8 @@ def createTargetArray( format, dims, type ):
                 )
             )
     arrayType = arrays.GL_CONSTANT_TO_ARRAY_TYPE[ TYPE_TO_ARRAYTYPE.get(type,type) ]
+    if outputpool.ACTIVE:
+        return outputpool.zeros( arrayType, dims )
     return arrayType.zeros( dims )
 
 def formatToComponentCount( format ):
@@ -130,24 +207,73 @@ def formatToComponentCount( format ):
         raise ValueError( """Unrecognised image format: %r"""%(format,))
     return size
 
-def returnFormat( data, type ):
+def readOnlyView( data ):
+    """Produce a read-only, flat (unsigned byte) memoryview onto data's buffer
+    
+    The view references (and keeps alive) data, nothing is copied.
+    Before Python 3.8 (no memoryview.toreadonly) see _readOnlyFallback.
+    """
+    view = memoryview( data )
+    try:
+        view = view.cast( 'B' )
+    except (TypeError, AttributeError):
+        # non-native format codes (ctypes) on older Pythons, no cast on Python 2
+        pass
+    if hasattr( view, 'toreadonly' ):
+        return view.toreadonly()
+    return _readOnlyFallback( view )
+
+def _readOnlyFallback( view ):
+    """readOnlyView for memoryviews without toreadonly
+    
+    Uses a non-writeable numpy array onto the buffer where possible,
+    otherwise (no numpy, non-contiguous data) copies into bytes.
+    """
+    if view.readonly:
+        return view
+    try:
+        import numpy
+        array = numpy.frombuffer( view, dtype='B' )
+    except (ImportError, ValueError, TypeError, BufferError) as err:
+        return memoryview( view.tobytes() )
+    array.flags.writeable = False
+    return memoryview( array )
+
+def returnFormat( data, type, outputType=bytes, owned=False ):
     """Perform compatibility conversion for PyOpenGL 2.x image-as string results
     
     Uses OpenGL.UNSIGNED_BYTE_IMAGES_AS_STRING to control whether to perform the 
-    conversions.
+    conversions, OpenGL.UNSIGNED_BYTE_IMAGES_AS_MEMORYVIEW (or an outputType of 
+    memoryview) to produce a zero-copy readOnlyView instead of a copy.
+    
+    owned -- True if data was allocated by the read operation itself 
+        (rather than passed in by the caller), only then is a readOnlyView 
+        produced or the copied array handed back to an active OutputPool; 
+        caller arrays (and pixel-buffer offsets) get the bytes conversion
     """
-    if _configflags.UNSIGNED_BYTE_IMAGES_AS_STRING:
+    if owned and type == _simple.GL_UNSIGNED_BYTE and (
+        outputType is memoryview or (
+            _configflags.UNSIGNED_BYTE_IMAGES_AS_MEMORYVIEW and 
+            _configflags.UNSIGNED_BYTE_IMAGES_AS_STRING
+        )
+    ):
+        return readOnlyView( data )
+    if _configflags.UNSIGNED_BYTE_IMAGES_AS_STRING and outputType is bytes:
         if type == _simple.GL_UNSIGNED_BYTE:
+            result = data
             if hasattr( data, 'tobytes' ):
-                return data.tobytes()
+                result = data.tobytes()
             elif hasattr( data, 'tostring' ):
-                return data.tostring()
+                result = data.tostring()
             elif hasattr( data, 'raw' ):
-                return data.raw 
+                result = data.raw 
             elif hasattr( data, '_type_' ):
                 s = ctypes.string_at( ctypes.cast( data, ctypes.c_voidp ), ctypes.sizeof( data ))
                 result = s[:] # copy into a new string
-                return result
+            if owned and outputpool.ACTIVE and result is not data:
+                # the array was only an intermediate, hand it back
+                outputpool.release( data )
+            return result
     return data
 
 
@@ -162,6 +288,10 @@ TYPE_TO_ARRAYTYPE = {
 }
 TIGHT_PACK_FORMATS = {
 }
+IMAGE_OUTPUT_TYPES = (
+    # outputType values for which read operations call returnFormat
+    bytes, memoryview,
+)
 RANK_PACKINGS = {
     # rank (integer): list of (function,**arg) to setup for that rank
 }
@@ -13,6 +13,7 @@ if LateBind is None:
         When called without self._finalCall() makes a call to
         self.finalise() and then calls self._finalCall()
         """
+        __slots__ = ()
         _finalCall = None
         def setFinalCall( self, finalCall ):
             """Set our finalCall to the callable object given"""
@@ -1,2 +1,13 @@
 from OpenGL.raw.osmesa._types import *
 from OpenGL.raw.osmesa.mesa import *
+
+from OpenGL.lazywrapper import lazy as _lazy
+from OpenGL import contextdata as _contextdata
+
+@_lazy( OSMesaMakeCurrent )
+def OSMesaMakeCurrent( baseFunction, ctx, buffer, type, width, height ):
+    """Make the context current, invalidating the cached current context"""
+    try:
+        return baseFunction( ctx, buffer, type, width, height )
+    finally:
+        _contextdata.invalidateContext()
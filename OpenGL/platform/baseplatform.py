@@ -21,6 +21,25 @@ class lazy_property(object):
         return value
 
 
+class instanceAttribute(property):
+    """Property providing a per-instance __doc__ or __module__
+
+    Objects which share a single class (rather than having a class per
+    GL function) carry their name, docstring and module on the
+    instance.  Accessed on the class itself this returns classValue,
+    so help(), repr() and pickle of the class are unaffected.
+    """
+
+    def __init__(self, classValue, fget, fset=None):
+        super(instanceAttribute, self).__init__(fget, fset)
+        self.classValue = classValue
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.classValue
+        return super(instanceAttribute, self).__get__(instance, owner)
+
+
 class _CheckContext(object):
     def __init__(self, func, ccisvalid):
         self.func = func
@@ -363,23 +382,10 @@ class BasePlatform(object):
     ):
         """Construct a "null" function pointer"""
         if deprecated:
-            base = _DeprecatedFunctionPointer
+            cls = _DeprecatedFunctionPointer
         else:
-            base = _NullFunctionPointer
-        cls = type(
-            functionName,
-            (base,),
-            {
-                '__doc__': doc,
-                'deprecated': deprecated,
-            },
-        )
-        if MODULE_ANNOTATIONS:
-            if not module:
-                module = _find_module()
-            if module:
-                cls.__module__ = module
-        return cls(
+            cls = _NullFunctionPointer
+        result = cls(
             functionName,
             dll,
             resultType,
@@ -387,9 +393,16 @@ class BasePlatform(object):
             argNames,
             extension=extension,
             doc=doc,
+            deprecated=deprecated,
             error_checker=error_checker,
             force_extension=force_extension,
         )
+        if MODULE_ANNOTATIONS:
+            if not module:
+                module = _find_module()
+            if module:
+                result.__module__ = module
+        return result
 
     def GetCurrentContext(self):
         """Retrieve opaque pointer for the current context"""
@@ -414,7 +427,34 @@ class BasePlatform(object):
 
 
 class _NullFunctionPointer(object):
-    """Function-pointer-like object for undefined functions"""
+    """Function-pointer-like object for undefined functions
+
+    All entry points share this class (creating a class for each of
+    the thousands of GL functions was a large part of import time and
+    memory), the name, docstring and module are per-instance.  Once
+    an entry point has been successfully loaded the instance is moved
+    to a per-function subclass whose __call__ is the loaded function,
+    so only functions which are actually used pay for a class.
+    """
+
+    __slots__ = (
+        '__name__',
+        '_module',
+        'DLL',
+        'argNames',
+        'argtypes',
+        'errcheck',
+        'restype',
+        'extension',
+        'doc',
+        'deprecated',
+        'error_checker',
+        'force_extension',
+        'resolved',
+        # created on demand for wrapper annotations (e.g. size lookups)
+        '__dict__',
+        '__weakref__',
+    )
 
     def __init__(
         self,
@@ -429,8 +469,6 @@ class _NullFunctionPointer(object):
         error_checker=None,
         force_extension=None,
     ):
-        from OpenGL import error
-
         self.__name__ = name
         self.DLL = dll
         self.argNames = argNames
@@ -442,8 +480,27 @@ class _NullFunctionPointer(object):
         self.deprecated = deprecated
         self.error_checker = error_checker
         self.force_extension = force_extension
+        self.resolved = False
+        self._module = __name__
+
+    def _getDoc(self):
+        return self.doc
+
+    def _setDoc(self, doc):
+        self.doc = doc
+
+    __doc__ = instanceAttribute(__doc__, _getDoc, _setDoc)
+
+    def _getModule(self):
+        return self._module
+
+    def _setModule(self, module):
+        self._module = module
 
-    resolved = False
+    __module__ = instanceAttribute(__module__, _getModule, _setModule)
+
+    def __repr__(self):
+        return '<%s.%s object at %#x>' % (self.__module__, self.__name__, id(self))
 
     def __nonzero__(self):
         """Make this object appear to be NULL"""
@@ -477,7 +534,20 @@ class _NullFunctionPointer(object):
             return None
         else:
             # now short-circuit so that we don't need to check again...
-            self.__class__.__call__ = staticmethod(func.__call__)
+            base = self.__class__
+            if self.resolved:
+                base = base.__bases__[0]
+            self.__class__ = type(
+                self.__name__,
+                (base,),
+                {
+                    '__slots__': (),
+                    '__call__': staticmethod(func.__call__),
+                    # type() would otherwise hide the per-instance values
+                    '__doc__': _NullFunctionPointer.__dict__['__doc__'],
+                    '__module__': _NullFunctionPointer.__dict__['__module__'],
+                },
+            )
             self.resolved = True
             return func
         return None
@@ -502,7 +572,7 @@ class _NullFunctionPointer(object):
 
 
 class _DeprecatedFunctionPointer(_NullFunctionPointer):
-    deprecated = True
+    __slots__ = ()
 
     def __call__(self, *args, **named):
         from OpenGL import error
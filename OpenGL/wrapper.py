@@ -3,10 +3,12 @@
 import ctypes, logging
 from OpenGL import platform, error
 from OpenGL._configflags import STORE_POINTERS, ERROR_ON_COPY, SIZE_1_ARRAY_UNPACK
+from OpenGL._configflags import WRAPPER_CODEGEN
 from OpenGL import converters
 from OpenGL.converters import DefaultCConverter
 from OpenGL.converters import returnCArgument, returnPyArgument
 from OpenGL.latebind import LateBind
+from OpenGL.platform.baseplatform import instanceAttribute
 from OpenGL.arrays import arrayhelpers, arraydatatype
 from OpenGL._null import NULL
 
@@ -30,6 +32,11 @@ if acceleratesupport.ACCELERATE_AVAILABLE:
             """OpenGL_accelerate seems to be installed, but unable to import expected wrapper entry points!"""
         )
 
+if WRAPPER_CODEGEN and not cWrapper:
+    from OpenGL import wrappergen
+else:
+    wrappergen = None
+
 if not STORE_POINTERS:
     if not ERROR_ON_COPY:
         _log.error(
@@ -94,12 +101,27 @@ class Wrapper(LateBind):
         'returnValues',
         '_finalCall',
     )
+    __slots__ = localProperties + ('__weakref__',)
 
     def __init__(self, wrappedOperation):
         """Initialise the wrapper, storing wrappedOperation"""
         if isinstance(wrappedOperation, Wrapper):
             wrappedOperation = wrappedOperation.wrappedOperation
         self.wrappedOperation = wrappedOperation
+        self._finalCall = None
+
+    def _getDoc(self):
+        return self.wrappedOperation.__doc__
+
+    __doc__ = instanceAttribute(__doc__, _getDoc)
+
+    def _getModule(self):
+        return getattr(self.wrappedOperation, '__module__', __name__)
+
+    __module__ = instanceAttribute(__module__, _getModule)
+
+    def __repr__(self):
+        return '<%s.%s object at %#x>' % (self.__module__, self.__name__, id(self))
 
     def __getattr__(self, key):
         """Delegate attribute lookup to our wrappedOperation"""
@@ -481,7 +503,13 @@ class Wrapper(LateBind):
 
         This is essentially a huge set of expanded nested functions, very
         inelegant...
+
+        If OpenGL.WRAPPER_CODEGEN is set (and OpenGL_accelerate is not
+        available) we instead return a generated straight-line function
+        from OpenGL.wrappergen.
         """
+        if wrappergen is not None:
+            return wrappergen.generateCall(self)
         pyConverters = getattr(self, 'pyConverters', None)
         cConverters = getattr(self, 'cConverters', None)
         cResolvers = getattr(self, 'cResolvers', None)
@@ -1646,21 +1674,13 @@ class MultiReturn(object):
 
 
 def wrapper(wrappedOperation):
-    """Create a Wrapper sub-class instance for the given wrappedOperation
+    """Create a Wrapper instance for the given wrappedOperation
 
-    The purpose of this function is to create a subclass of Wrapper which
-    has the __doc__ and __name__ of the wrappedOperation so that the instance of
-    the wrapper will show up as <functionname instance @ address> by default,
+    All wrappers share the Wrapper class, the __doc__, __name__ and
+    __module__ of the wrappedOperation are reported by the instance, so
+    that the wrapper will show up as <module.functionname object @ address>
     and will have the docstring available naturally in pydoc and the like.
     """
     if isinstance(wrappedOperation, Wrapper):
         return wrappedOperation
-    dict = {
-        '__doc__': wrappedOperation.__doc__,
-        '__slots__': ('wrappedOperation',),
-    }
-    cls = type(wrappedOperation.__name__, (Wrapper,), dict)
-    if hasattr(wrappedOperation, '__module__'):
-        cls.__module__ = wrappedOperation.__module__
-    instance = cls(wrappedOperation)
-    return instance
+    return Wrapper(wrappedOperation)
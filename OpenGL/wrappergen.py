@@ -0,0 +1,342 @@
+"""Ahead-of-time generation of specialised wrapper call functions
+
+When OpenGL.WRAPPER_CODEGEN is True (and OpenGL_accelerate is not in
+use) Wrapper.finaliseCall asks this module for its call function.
+Rather than choosing among the hand-expanded wrapperCall closures
+(which still run generators and rebuild tuples on every call) we emit
+the source of a straight-line Python function for the wrapper's exact
+"shape": which Python converters are present, which of them are
+optional, which C converters are simple index lookups or constants,
+which resolvers exist and whether store/return handlers are set.
+
+The source for a shape is independent of the particular converter
+objects (those are bound as closure variables by a factory function),
+so a few dozen shapes cover all of the wrapped entry points.  The
+compiled factory code is cached on disk, keyed by the PyOpenGL version,
+the interpreter's bytecode tag, CACHE_FORMAT and a digest of this
+module's source (so edits to the generator in a development checkout
+never reuse stale code), so later processes do not pay for compile()
+at finalise time.
+
+Environment variables:
+
+    PYOPENGL_WRAPPER_CACHE_DIR -- directory in which to store the
+        generated-code cache, set to an empty string to disable the
+        on-disk cache entirely.  Default: ~/.cache/pyopengl
+"""
+
+import atexit, ctypes, hashlib, logging, marshal, os, sys, tempfile
+from OpenGL import error
+from OpenGL.version import __version__
+from OpenGL.converters import DefaultCConverter
+from OpenGL._null import NULL
+
+_log = logging.getLogger('OpenGL.wrappergen')
+
+PY_NONE = 'none'
+PY_CONVERT = 'convert'
+PY_OPTIONAL = 'optional'
+C_CALL = 'call'
+C_CONSTANT = 'constant'
+# increment when the shape or factory conventions change
+CACHE_FORMAT = 1
+
+_factories = {}
+_disk_cache = None
+_dirty = False
+_digest = None
+
+
+def cacheDirectory():
+    """Retrieve the configured cache directory (or None if disabled)"""
+    directory = os.environ.get('PYOPENGL_WRAPPER_CACHE_DIR')
+    if directory is None:
+        directory = os.path.join(os.path.expanduser('~'), '.cache', 'pyopengl')
+    return directory or None
+
+
+def generatorDigest():
+    """Retrieve (once) a short digest of the generator's source code
+
+    Falls back to the compiled module (or an empty digest) when the
+    source is not installed.
+    """
+    global _digest
+    if _digest is None:
+        filename = __file__
+        if filename.endswith(('.pyc', '.pyo')) and os.path.exists(filename[:-1]):
+            filename = filename[:-1]
+        try:
+            with open(filename, 'rb') as fh:
+                _digest = hashlib.sha1(fh.read()).hexdigest()[:12]
+        except (IOError, OSError) as err:
+            _digest = ''
+    return _digest
+
+
+def cacheFile():
+    """Retrieve the filename of the on-disk cache for this version/interpreter/generator"""
+    directory = cacheDirectory()
+    if not directory:
+        return None
+    tag = (
+        getattr(sys.implementation, 'cache_tag', None)
+        or 'py%s%s' % sys.version_info[:2]
+    )
+    return os.path.join(
+        directory,
+        'wrappers-%s-%s-%s-%s.marshal'
+        % (__version__, tag, CACHE_FORMAT, generatorDigest() or 'nosource'),
+    )
+
+
+def loadCache():
+    """Load (once) the on-disk cache of shape -> code objects"""
+    global _disk_cache
+    if _disk_cache is None:
+        _disk_cache = {}
+        filename = cacheFile()
+        if filename and os.path.exists(filename):
+            try:
+                with open(filename, 'rb') as fh:
+                    loaded = marshal.load(fh)
+            except Exception as err:
+                _log.info('Unable to load wrapper code cache %s: %s', filename, err)
+            else:
+                if isinstance(loaded, dict):
+                    _disk_cache = loaded
+    return _disk_cache
+
+
+def saveCache():
+    """Write newly generated shapes back to the on-disk cache"""
+    global _dirty
+    filename = cacheFile()
+    if not (_dirty and filename):
+        return False
+    try:
+        directory = os.path.dirname(filename)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        # write-then-rename so concurrent processes never see partial files
+        handle, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(handle, 'wb') as fh:
+            marshal.dump(_disk_cache, fh)
+        os.replace(temporary, filename)
+    except Exception as err:
+        _log.info('Unable to save wrapper code cache %s: %s', filename, err)
+        return False
+    _dirty = False
+    return True
+
+
+atexit.register(saveCache)
+
+
+def shapeOf(wrapper):
+    """Calculate the hashable code-shape for the given (finalised) wrapper
+
+    returns (pyShape, cShape, resolverShape, hasStore, hasReturn) where
+    pyShape/cShape/resolverShape are None when the wrapper does not
+    define that stage.
+    """
+    pyConverters = getattr(wrapper, 'pyConverters', None)
+    cConverters = getattr(wrapper, 'cConverters', None)
+    cResolvers = getattr(wrapper, 'cResolvers', None)
+    pyShape = cShape = resolverShape = None
+    if pyConverters:
+        pyShape = tuple(
+            [
+                (
+                    PY_NONE
+                    if converter is None
+                    else (
+                        PY_OPTIONAL
+                        if getattr(converter, 'optional', False)
+                        else PY_CONVERT
+                    )
+                )
+                for converter in pyConverters
+            ]
+        )
+    if cConverters:
+        shape = []
+        for converter in cConverters:
+            index = None
+            if pyShape and isinstance(converter, DefaultCConverter):
+                index = getattr(converter, 'index', None)
+            if index is not None and 0 <= index < len(pyShape):
+                # inlined as a direct reference to the converted py argument
+                shape.append(index)
+            elif hasattr(converter, '__call__'):
+                shape.append(C_CALL)
+            else:
+                shape.append(C_CONSTANT)
+        cShape = tuple(shape)
+    if cResolvers:
+        resolverShape = tuple([converter is not None for converter in cResolvers])
+    return (
+        pyShape,
+        cShape,
+        resolverShape,
+        bool(getattr(wrapper, 'storeValues', None)),
+        bool(getattr(wrapper, 'returnValues', None)),
+    )
+
+
+def generateSource(shape):
+    """Produce the source code for a wrapperCall factory for the given shape
+
+    The factory has the signature:
+
+        factory(self, wrappedOperation, pyConverters, cConverters,
+                cResolvers, storeValues, returnValues, NULL, error, ctypes)
+
+    and returns the specialised wrapperCall(*args) function.
+    """
+    pyShape, cShape, resolverShape, hasStore, hasReturn = shape
+    lines = [
+        'def factory(self, wrappedOperation, pyConverters, cConverters, cResolvers, storeValues, returnValues, NULL, error, ctypes):',
+    ]
+    add = lines.append
+    for i, kind in enumerate(pyShape or ()):
+        if kind != PY_NONE:
+            add('    pc%d = pyConverters[%d]' % (i, i))
+    for i, kind in enumerate(cShape or ()):
+        if kind in (C_CALL, C_CONSTANT):
+            add('    cc%d = cConverters[%d]' % (i, i))
+    for i, present in enumerate(resolverShape or ()):
+        if present:
+            add('    cr%d = cResolvers[%d]' % (i, i))
+    add('    def wrapperCall(*args):')
+    add('        """Generated wrapper specialised for %s"""' % (shape,))
+    if pyShape:
+        required = len([kind for kind in pyShape if kind != PY_OPTIONAL])
+        add('        if %d > len(args):' % (required,))
+        add('            raise ValueError(')
+        add(
+            '                """%%s requires %%r arguments (%%s), received %%s: %%r""" %% (wrappedOperation.__name__, %d, ", ".join(self.pyConverterNames), len(args), args)'
+            % (required,)
+        )
+        add('            )')
+        for i, kind in enumerate(pyShape):
+            if kind == PY_NONE:
+                add('        p%d = args[%d]' % (i, i))
+                continue
+            add('        try:')
+            add('            p%d = pc%d(args[%d], self, args)' % (i, i, i))
+            add('        except IndexError as err:')
+            add('            p%d = NULL' % (i,))
+            add('        except Exception as err:')
+            add("            if hasattr(err, 'args'):")
+            add('                err.args += (pc%d,)' % (i,))
+            add('            raise')
+        pyNames = ['p%d' % i for i in range(len(pyShape))]
+        add('        pyArgs = (%s)' % (''.join([n + ', ' for n in pyNames]),))
+    else:
+        pyNames = None
+        add('        pyArgs = args')
+    if cShape:
+        cNames = []
+        for i, kind in enumerate(cShape):
+            if kind == C_CONSTANT:
+                cNames.append('cc%d' % (i,))
+            elif kind == C_CALL:
+                add('        try:')
+                add('            c%d = cc%d(pyArgs, %d, self)' % (i, i, i))
+                add('        except Exception as err:')
+                add("            if hasattr(err, 'args'):")
+                add(
+                    '                err.args += ("""Failure in cConverter %%r""" %% (cc%d), pyArgs, %d, self)'
+                    % (i, i)
+                )
+                add('            raise')
+                cNames.append('c%d' % (i,))
+            else:
+                cNames.append(pyNames[kind])
+        cArgs = '(%s)' % (''.join([n + ', ' for n in cNames]),)
+    elif pyNames is not None:
+        cNames = pyNames
+        cArgs = 'pyArgs'
+    else:
+        cNames = None
+        cArgs = 'args'
+    if resolverShape:
+        if cNames is None:
+            # only have the (variable-length) incoming args to resolve
+            cNames = ['args[%d]' % i for i in range(len(resolverShape))]
+        callNames = []
+        for i, present in enumerate(resolverShape):
+            if not present:
+                callNames.append(cNames[i])
+                continue
+            add('        try:')
+            add('            r%d = cr%d(%s)' % (i, i, cNames[i]))
+            add('        except Exception as err:')
+            add('            err.args += (cr%d,)' % (i,))
+            add('            raise')
+            callNames.append('r%d' % (i,))
+        callArgs = ', '.join(callNames)
+        cArguments = '(%s)' % (''.join([n + ', ' for n in callNames]),)
+    elif cNames is not None:
+        callArgs = ', '.join(cNames)
+        cArguments = cArgs
+    else:
+        callArgs = '*args'
+        cArguments = 'args'
+    if hasStore or hasReturn:
+        if cArgs not in ('args', 'pyArgs'):
+            add('        cArgs = %s' % (cArgs,))
+            cArgs = 'cArgs'
+    add('        try:')
+    add('            result = wrappedOperation(%s)' % (callArgs,))
+    add('        except ctypes.ArgumentError as err:')
+    add('            err.args = err.args + (%s,)' % (cArguments,))
+    add('            raise err')
+    add('        except error.GLError as err:')
+    add('            err.cArgs = %s' % (cArgs,))
+    add('            err.pyArgs = pyArgs')
+    add('            raise err')
+    if hasStore:
+        add('        storeValues(result, self, pyArgs, %s)' % (cArgs,))
+    if hasReturn:
+        add('        return returnValues(result, self, pyArgs, %s)' % (cArgs,))
+    else:
+        add('        return result')
+    add('    return wrapperCall')
+    return '\n'.join(lines) + '\n'
+
+
+def factoryFor(shape):
+    """Retrieve (generating and caching if necessary) the factory for shape"""
+    global _dirty
+    factory = _factories.get(shape)
+    if factory is None:
+        cache = loadCache()
+        code = cache.get(shape)
+        if code is None:
+            source = generateSource(shape)
+            code = compile(source, '<OpenGL.wrappergen>', 'exec')
+            cache[shape] = code
+            _dirty = True
+        namespace = {}
+        exec(code, namespace)
+        factory = _factories[shape] = namespace['factory']
+    return factory
+
+
+def generateCall(wrapper):
+    """Produce the specialised straight-line call for the (finalised) wrapper"""
+    factory = factoryFor(shapeOf(wrapper))
+    return factory(
+        wrapper,
+        wrapper.wrappedOperation,
+        getattr(wrapper, 'pyConverters', None),
+        getattr(wrapper, 'cConverters', None),
+        getattr(wrapper, 'cResolvers', None),
+        getattr(wrapper, 'storeValues', None),
+        getattr(wrapper, 'returnValues', None),
+        NULL,
+        error,
+        ctypes,
+    )
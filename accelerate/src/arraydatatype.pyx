@@ -5,6 +5,7 @@ import ctypes
 import OpenGL
 from OpenGL._null import NULL as _NULL
 from OpenGL import plugins
+from OpenGL.arrays import outputpool, copyprofile
 from OpenGL_accelerate.wrapper cimport cArgConverter, pyArgConverter, returnConverter
 from OpenGL_accelerate.formathandler cimport FormatHandler
 
@@ -13,19 +14,33 @@ cdef extern from "Python.h":
     cdef object PyDict_GetItem( object, object )
 
 cdef class HandlerRegistry:
-    """C-coded registry of format handlers for array data-formats"""
+    """C-coded registry of format handlers for array data-formats
+    
+    Derived (via __mro__/plugin walk) and negative lookup results are 
+    cached, bounded by CACHE_SIZE and discarded on register/registerReturn
+    """
     cdef dict registry
     cdef object match
     cdef object output_handler
     cdef object preferredOutput
     GENERIC_OUTPUT_PREFERENCES = ['numpy','ctypesarrays']
+    CACHE_SIZE = 256
     cdef object all_output_handlers
+    cdef public set derived
+    cdef public set negative
+    cdef public long hits
+    cdef public long misses
+    cdef public long negativeHits
+    cdef public long failures
     def __init__( self, plugin_match ):
         self.registry = {}
         self.match = plugin_match
         self.output_handler = None 
         self.preferredOutput = None
         self.all_output_handlers = []
+        self.derived = set()
+        self.negative = set()
+        self.resetStatistics()
     def __setitem__( self,key,value ):
         self.registry[key] = value
     def __call__( self, value ):
@@ -39,27 +54,70 @@ cdef class HandlerRegistry:
         except AttributeError as err:
             typ = PyObject_Type(value)
         handler = self.registry.get( typ )
-        if not handler:
-            if hasattr( typ, '__mro__' ):
-                for base in typ.__mro__:
-                    handler = self.registry.get( base )
-                    if not handler:
-                        plugin = self.match( base )
-                        if plugin:
-                            cls = plugin.load()
-                            if cls:
-                                handler=cls()
-                    if handler:
-                        self.registry[ typ ] = handler
-                        if hasattr( handler, 'registerEquivalent' ):
-                            handler.registerEquivalent( typ, base )
-                        return handler
+        if handler:
+            self.hits += 1
+            return handler
+        if typ in self.negative:
+            self.negativeHits += 1
             raise TypeError(
                 """No array-type handler for type %r (value: %s) registered"""%(
                     typ, repr(value)[:50]
                 )
             )
-        return handler
+        self.misses += 1
+        if hasattr( typ, '__mro__' ):
+            for base in typ.__mro__:
+                handler = self.registry.get( base )
+                if not handler:
+                    plugin = self.match( base )
+                    if plugin:
+                        cls = plugin.load()
+                        if cls:
+                            handler=cls()
+                if handler:
+                    self.cacheResult( typ, handler )
+                    if hasattr( handler, 'registerEquivalent' ):
+                        handler.registerEquivalent( typ, base )
+                    return handler
+        self.failures += 1
+        self.cacheResult( typ, None )
+        raise TypeError(
+            """No array-type handler for type %r (value: %s) registered"""%(
+                typ, repr(value)[:50]
+            )
+        )
+    def cacheResult( self, typ, handler ):
+        """Record result of a full lookup for typ (None for failure)"""
+        if len(self.derived) + len(self.negative) >= self.CACHE_SIZE:
+            self.invalidateCache()
+        if handler is None:
+            self.negative.add( typ )
+        else:
+            self.registry[ typ ] = handler
+            self.derived.add( typ )
+    def invalidateCache( self ):
+        """Discard all derived and negative lookup results"""
+        for typ in self.derived:
+            self.registry.pop( typ, None )
+        self.derived.clear()
+        self.negative.clear()
+    def resetStatistics( self ):
+        """Reset the lookup counters"""
+        self.hits = self.misses = self.negativeHits = self.failures = 0
+    def statistics( self ):
+        """Report lookup counters and hit rate as a dictionary"""
+        total = self.hits + self.misses + self.negativeHits
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'negativeHits': self.negativeHits,
+            'failures': self.failures,
+            'derived': len(self.derived),
+            'negative': len(self.negative),
+            'hitRate': (
+                float(self.hits + self.negativeHits) / total if total else 0.0
+            ),
+        }
     
     cdef object c_get_output_handler( self ):
         """Fast-path lookup for output handler object"""
@@ -89,6 +147,7 @@ cdef class HandlerRegistry:
         """Register this class as handler for given set of types"""
         if not isinstance( types, (list,tuple)):
             types = [ types ]
+        self.invalidateCache()
         for type in types:
             self.registry[ type ] = handler
         if handler.isOutput:
@@ -96,6 +155,7 @@ cdef class HandlerRegistry:
         
     def registerReturn( self, handler ):
         """Register this handler as the default return-type handler"""
+        self.invalidateCache()
         if isinstance( handler, (str,unicode)):
             self.preferredOutput = handler 
             self.output_handler = None
@@ -291,6 +351,8 @@ cdef class Output(cArgConverter):
     
     cdef object c_call( self, tuple pyArgs, int index, object baseOperation ):
         """Return pyArgs[ self.index ]"""
+        if outputpool.ACTIVE:
+            return outputpool.zeros( self.arrayType, self.c_getSize(pyArgs) )
         return self.arrayType.c_zeros( self.c_getSize(pyArgs), self.arrayType.typeConstant )
     
     def oldStyleReturn( self, object result, object baseOperation, tuple pyArgs, tuple cArgs ):
@@ -313,7 +375,13 @@ cdef class OutputOrInput( Output ):
     cdef object c_call( self, tuple pyArgs, int index, object baseOperation ):
         """Return pyArgs[ self.index ]"""
         if pyArgs[index] is not DO_OUTPUT[0] and pyArgs[index] is not DO_OUTPUT[1]:
+            if copyprofile.ACTIVE is not None:
+                return copyprofile.converting(
+                    baseOperation, self.arrayType.asArray, pyArgs[index]
+                )
             return self.arrayType.asArray( pyArgs[index] )
+        if outputpool.ACTIVE:
+            return outputpool.zeros( self.arrayType, self.c_getSize(pyArgs) )
         return self.arrayType.c_zeros( self.c_getSize(pyArgs), self.arrayType.typeConstant )
 
 cdef class SizedOutput( Output ):
@@ -353,7 +421,13 @@ cdef class SizedOutputOrInput( SizedOutput ):
     cdef object c_call( self, tuple pyArgs, int index, object baseOperation ):
         """Return pyArgs[ self.index ]"""
         if pyArgs[index] is not DO_OUTPUT[0] and pyArgs[index] is not DO_OUTPUT[1]:
+            if copyprofile.ACTIVE is not None:
+                return copyprofile.converting(
+                    baseOperation, self.arrayType.asArray, pyArgs[index]
+                )
             return self.arrayType.asArray( pyArgs[index] )
+        if outputpool.ACTIVE:
+            return outputpool.zeros( self.arrayType, self.c_getSize(pyArgs) )
         return self.arrayType.c_zeros( self.c_getSize(pyArgs), self.arrayType.typeConstant )
     
 
@@ -381,6 +455,10 @@ cdef class AsArrayOfType(pyArgConverter):
         self.typeIndex = wrapper.pyArgIndex( self.typeName )
     cdef object c_call( self, object incoming, object function, tuple arguments ):
         """Get the arg as an array of the appropriate type"""
+        if copyprofile.ACTIVE is not None:
+            return copyprofile.converting(
+                function, self.arrayType.asArray, incoming, arguments[ self.typeIndex ]
+            )
         return self.arrayType.asArray( incoming, arguments[ self.typeIndex ] )
 
 cdef class AsArrayTyped(pyArgConverter):
@@ -403,6 +481,8 @@ cdef class AsArrayTyped(pyArgConverter):
         """Finalize the wrapper (nothing to do here)"""
     cdef object c_call( self, object incoming, object function, tuple arguments ):
         """Get the arg as an array of the appropriate type"""
+        if copyprofile.ACTIVE is not None:
+            return copyprofile.converting( function, self.arrayType.asArray, incoming )
         return self.arrayType.asArray( incoming )
 
 cdef class AsArrayTypedSizeChecked( AsArrayTyped ):
@@ -415,7 +495,10 @@ cdef class AsArrayTypedSizeChecked( AsArrayTyped ):
     cdef object c_call( self, object incoming, object function, tuple arguments ):
         """Get the arg as an array of the appropriate type"""
         cdef int actualSize
-        result = self.arrayType.asArray( incoming )
+        if copyprofile.ACTIVE is not None:
+            result = copyprofile.converting( function, self.arrayType.asArray, incoming )
+        else:
+            result = self.arrayType.asArray( incoming )
         actualSize = self.arrayType.arrayByteCount( result )
         if actualSize != self.size:
             raise ValueError(
@@ -1,5 +1,6 @@
 """Cython-coded GL-error-check module"""
 #cython: language_level=3
+import collections
 from OpenGL import _configflags
 
 cdef class _ErrorChecker:
@@ -15,6 +16,10 @@ cdef class _ErrorChecker:
     cdef public object _getErrors
     cdef public object _errorClass
     cdef public int _noErrorResult 
+    cdef public int _checkInterval
+    cdef public int _callCount
+    cdef public object _pending
+    PENDING_LIMIT = 256
     
     def __init__( self, platform, baseOperation, noErrorResult=0, errorClass=None ):
         """Initialize from a platform module/reference"""
@@ -25,6 +30,9 @@ cdef class _ErrorChecker:
         
         self.doChecks = bool( _configflags.ERROR_CHECKING and self._getErrors )
         self.checkContext = _configflags.CONTEXT_CHECKING
+        self._checkInterval = 1
+        self._callCount = 0
+        self._pending = None
     
     def glCheckError( 
         self,
@@ -46,6 +54,12 @@ cdef class _ErrorChecker:
             should call onBegin and onEnd appropriately.
         """
         cdef int err
+        if self._checkInterval != 1:
+            self._pending.append( baseOperation )
+            self._callCount += 1
+            if (not self._checkInterval) or self._callCount < self._checkInterval:
+                return result
+            return self.checkpoint( result, baseOperation, cArguments )
         if self.doChecks:
             if self.checkContext:
                 if not self._isValid():
@@ -63,6 +77,56 @@ cdef class _ErrorChecker:
                     baseOperation = baseOperation,
                 )
         return result
+    def setCheckInterval( self, interval=1 ):
+        """Set how often glGetError is queried (at run-time)
+        
+        interval -- 1 to check after every call (the default),
+            N to check after every Nth call, 0 to check only 
+            when checkpoint() is called
+        """
+        interval = int( interval )
+        if interval < 0:
+            raise ValueError( """Check interval must be >= 0, got %r"""%( interval, ))
+        if self._pending:
+            self.checkpoint()
+        self._checkInterval = interval
+        self._callCount = 0
+        if interval == 1:
+            self._pending = None
+        else:
+            self._pending = collections.deque( maxlen=self.PENDING_LIMIT )
+        return interval
+    def getCheckInterval( self ):
+        """Retrieve the current check interval (see setCheckInterval)"""
+        return self._checkInterval
+    def checkpoint( self, result=None, baseOperation=None, cArguments=None ):
+        """Check for errors now, attributing them to calls since the last check"""
+        cdef int err
+        if not self.doChecks:
+            # inside glBegin/glEnd (or checking disabled), postpone
+            return result
+        if self.checkContext:
+            if not self._isValid():
+                return result
+        err = self._getErrors()
+        operations = ()
+        if self._pending is not None:
+            operations = tuple( self._pending )
+            self._pending.clear()
+            self._callCount = 0
+        if err != self._noErrorResult:
+            if self._errorClass is None:
+                from OpenGL.error import GLError
+                self._errorClass = GLError
+            exception = self._errorClass(
+                err,
+                result,
+                cArguments = cArguments,
+                baseOperation = baseOperation,
+            )
+            exception.pendingOperations = operations
+            raise exception
+        return result
     def onBegin( self, target=None ):
         """Called by glBegin to record the fact that glGetError won't work"""
         self.doChecks = False
@@ -6,6 +6,7 @@ cimport numpy as np
 from OpenGL_accelerate.formathandler cimport FormatHandler
 import traceback, weakref
 from OpenGL.error import CopyError
+from OpenGL.arrays import copyprofile
 from OpenGL._bytes import bytes,unicode
 
 cdef extern from "Python.h":
@@ -215,11 +216,17 @@ cdef class NumpyHandler(FormatHandler):
                 # TODO: make sure there's no way to segfault here 
                 # Py_INCREF( <object> instance )
                 Py_INCREF( <object> dtype )
-                return PyArray_FromArray( 
+                result = PyArray_FromArray( 
                     instance, 
                     dtype, 
                     NPY_ARRAY_CARRAY|NPY_ARRAY_FORCECAST
                 )
+                if copyprofile.ACTIVE is not None:
+                    copyprofile.recordCopy(
+                        instance, result,
+                        'non-contiguous' if not PyArray_ISCARRAY_RO( instance ) else 'type conversion',
+                    )
+                return result
 
             else:
                 return instance
@@ -11,6 +11,40 @@ cdef extern from "Python.h":
 
 _NULL = object()
 
+cdef object dirty_span( object index, Py_ssize_t length ):
+    """Calculate the (start, stop) row span touched by index (see vbo.dirtySpan)"""
+    cdef Py_ssize_t first, last
+    if isinstance( index, slice ):
+        rows = range( *index.indices( length ) )
+        if not rows:
+            return None
+        first, last = rows[0], rows[-1]
+        if first > last:
+            first, last = last, first
+        return first, last + 1
+    first = index
+    if first < 0:
+        first += length
+    return first, first + 1
+
+cdef list merge_ranges( list ranges, long gap ):
+    """Merge overlapping/nearby (start, stop) ranges (see vbo.mergeRanges)"""
+    cdef list result = []
+    cdef long start, stop, current_start = 0, current_stop = 0
+    cdef int have = False
+    for start, stop in sorted( ranges ):
+        if have and start <= current_stop + gap:
+            if stop > current_stop:
+                current_stop = stop
+        else:
+            if have:
+                result.append( (current_start, current_stop) )
+            current_start, current_stop = start, stop
+            have = True
+    if have:
+        result.append( (current_start, current_stop) )
+    return result
+
 cdef class VBO:
     """Instances can be passed into array-handling routines
 
@@ -28,7 +62,9 @@ cdef class VBO:
         target_spec -- our (unresolved) GL constant specifier
         usage -- our resolved GL constant usage
         usage_spec -- our (unresolved) GL constant usage specifier
-        _copy_segments -- slices of data to copy to back-end
+        _copy_segments -- dirty (start, stop) byte ranges to copy to back-end
+        coalesce_gap -- dirty ranges closer than this many bytes are
+            uploaded as a single range
         _I_ -- our implementation object
         arrayType -- our reference to arraydatatype.ArrayDatatype
     """
@@ -44,6 +80,7 @@ cdef class VBO:
     cdef public object target_spec # possible string definition
     cdef public object usage_spec # possible string definition
     cdef public list _copy_segments
+    cdef public long coalesce_gap
     cdef public object _I_
     cdef public object arrayType
     _no_cache_ = True # do not cache in context data arrays
@@ -79,7 +116,9 @@ cdef class VBO:
                     image source/sink for image-manipulation operations.
         """
         from OpenGL.arrays.arraydatatype import ArrayDatatype
+        from OpenGL.arrays.vbo import COALESCE_GAP
         self.arrayType = ArrayDatatype
+        self.coalesce_gap = COALESCE_GAP
         self.c_set_array( data, size )
         self.resolved = self.created = self.copied = False
         self.usage_spec = usage
@@ -125,51 +164,39 @@ cdef class VBO:
     def __setitem__( self, slice, array):
         """Set slice of data on the array and vbo (if copied already)
 
-        slice -- the Python slice object determining how the data should
-            be copied into the vbo/array
+        slice -- the Python slice object (or integer index) determining
+            how the data should be copied into the vbo/array, stepped
+            slices are supported
         array -- something array-compatible that will be used as the
             source of the data, note that the data-format will have to
             be the same as the internal data-array to work properly, if
             not, the amount of data copied will be wrong.
 
-        This is a reasonably complex operation, it has to have all sorts
-        of state-aware changes to correctly map the source into the low-level
-        OpenGL view of the buffer (which is just bytes as far as the GL
-        is concerned).
+        The assignment is made on our data-array immediately, while the
+        GL-side update is recorded as a dirty byte-range which is
+        merged with the other dirty ranges and uploaded from our
+        data-array on the next bind (see copy_data).
         """
-        if slice.step and not slice.step == 1:
-            raise NotImplementedError( """Don't know how to map stepped arrays yet""" )
+        cdef Py_ssize_t start, stop, size
         # TODO: handle e.g. mapping character data into an integer data-set
         data = self.arrayType.asArray( array )
-        start = (slice.start or 0)
-        stop = (slice.stop or len(self.data))
-        if start < 0:
-            start += len(self.data)
-            start = max((start,0))
-        if stop < 0:
-            stop += len(self.data)
-            stop = max((stop,0))
         self.data[ slice ] = data
         if self.copied and self.created:
-            if start-stop == len(self.data):
+            span = dirty_span( slice, len(self.data) )
+            if span is None:
+                return
+            start, stop = span
+            if stop-start == len(self.data):
                 # re-copy the whole data-set
                 self.copied = False
-            elif len(data):
-                # now the fun part, we need to make the array match the
-                # structure of the array we're going to copy into and make
-                # the "size" parameter match the value we're going to copy in,
-                # note that a 2D array (rather than a 1D array) may require
-                # multiple mappings to copy into the memory area...
-
-                # find the step size from the dimensions and base size...
-                size = self.arrayType.arrayByteCount( self.data[0] )
-                #baseSize = self.arrayType.unitSize( data )
-                # now create the start and distance values...
-                start *= size
-                stop *= size
+                del self._copy_segments[:]
+            else:
+                # rows of a 2D array are contiguous, so the affected
+                # byte range is just the row span times the row size...
+                size = self.arrayType.arrayByteCount( self.data ) // len(self.data)
                 # wait until the last moment (bind) to copy the data...
                 self._copy_segments.append(
-                    (start,(stop-start), data)
+                    (start*size, stop*size)
                 )
     def __len__( self ):
         return len( self.data )
@@ -205,10 +232,13 @@ cdef class VBO:
         assert self.created, """Should do create_buffers before copy_data"""
         if self.copied:
             if self._copy_segments:
-                while self._copy_segments:
-                    start,size,data  = self._copy_segments.pop(0)
-                    dataptr = self.arrayType.voidDataPointer( data )
-                    self.get_implementation().glBufferSubData(self.target, start, size, dataptr)
+                ranges = merge_ranges( self._copy_segments, self.coalesce_gap )
+                del self._copy_segments[:]
+                base = self.arrayType.dataPointer( self.data )
+                for start,stop in ranges:
+                    self.get_implementation().glBufferSubData(
+                        self.target, start, stop-start, ctypes.c_void_p( base+start )
+                    )
         else:
             self.get_implementation().glBufferData(
                 self.target,
@@ -217,6 +247,7 @@ cdef class VBO:
                 self.usage,
             )
             self.copied = True
+            del self._copy_segments[:]
     def delete( self ):
         """Delete this buffer explicitly"""
         if self.created:
@@ -140,7 +140,7 @@ cdef class PyArgCalculator:
     ):
         self.wrapper = wrapper
         self.mapping = [
-            PyArgCalculatorElement(self,i,converter)
+            PyArgCalculatorElement(wrapper,i,converter)
             for (i,converter) in enumerate( pyConverters )
         ]
         self.length = len([ p for p in pyConverters if not getattr(p,'optional',False)])
@@ -0,0 +1,41 @@
+import pygamegltest
+import pytest
+from OpenGL.GL import *
+from OpenGL import batch, error
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@pygamegltest.pygametest()
+def test_batch_replay():
+    texture = glGenTextures(1)
+    recorded = batch.Batch()
+    recorded.add(glBindTexture, GL_TEXTURE_2D, texture)
+    recorded.add(glClearColor, 0.25, 0.5, 0.75, 1.0)
+    assert len(recorded) == 2
+    assert recorded() == 2
+    assert glGetIntegerv(GL_TEXTURE_BINDING_2D) == texture
+    assert tuple(glGetFloatv(GL_COLOR_CLEAR_VALUE)) == (0.25, 0.5, 0.75, 1.0)
+
+
+@pygamegltest.pygametest()
+def test_batch_single_error_check():
+    recorded = batch.Batch()
+    recorded.add(glEnable, 0x9999)
+    recorded.add(glClearColor, 0.0, 0.0, 0.0, 1.0)
+    with pytest.raises(error.GLError) as info:
+        recorded()
+    assert info.value.baseOperation is recorded
+
+
+@pytest.mark.skipif(not np, reason="Numpy not available")
+@pygamegltest.pygametest()
+def test_batch_array_arguments():
+    viewport = np.zeros((4,), 'i')
+    recorded = batch.Batch()
+    recorded.add(glGetIntegerv, GL_VIEWPORT, viewport)
+    recorded()
+    assert tuple(viewport[2:]) == (300, 300)
@@ -0,0 +1,47 @@
+import os
+import pygamegltest
+from OpenGL.GL import *
+from OpenGL import extensions
+
+
+def test_snapshot_bitset():
+    snapshot = extensions.CapabilitySnapshot(
+        b'Vendor', b'Renderer', b'3.3 Test', [3, 3], [b'GL_ARB_one', 'GL_ARB_two']
+    )
+    other = extensions.CapabilitySnapshot(
+        b'Vendor', b'Renderer', b'3.3 Test', [3, 3], [b'GL_ARB_two', b'GL_ARB_three']
+    )
+    assert snapshot.hasExtension(b'GL_ARB_one')
+    assert snapshot.hasExtension('GL.ARB.two')
+    assert not snapshot.hasExtension(b'GL_ARB_three')
+    assert not snapshot.hasExtension(b'GL_ARB_unknown')
+    assert other.hasExtension(b'GL_ARB_three')
+    assert not other.hasExtension(b'GL_ARB_one')
+    restored = extensions.CapabilitySnapshot.fromJSON(snapshot.toJSON())
+    assert restored.key == snapshot.key
+    assert restored.mask == snapshot.mask
+    assert restored.version == [3, 3]
+
+
+@pygamegltest.pygametest()
+def test_capability_cache(tmp_path):
+    cache = extensions.CapabilityCache(str(tmp_path))
+    key = extensions.CapabilitySnapshot.currentKey()
+    assert cache.get(key) is None
+    snapshot = cache.snapshot()
+    assert len(os.listdir(str(tmp_path))) == 1
+    assert snapshot.limits['GL_MAX_TEXTURE_SIZE'] == glGetIntegerv(GL_MAX_TEXTURE_SIZE)
+    loaded = cache.get(key)
+    assert loaded is not None and loaded.mask == snapshot.mask
+    assert set(loaded.extensions) == set(extensions.GLQuerier.pullExtensions())
+    try:
+        assert cache.install().key == key
+        assert extensions.GLQuerier.snapshot is not None
+        for extension in loaded.extensions[:10]:
+            assert extensions.hasGLExtension(extension)
+        assert not extensions.hasGLExtension('GL_PYOPENGL_not_an_extension')
+        assert extensions.hasGLExtension('GL_VERSION_GL_1_1')
+    finally:
+        extensions.GLQuerier.install(None)
+    # a different driver version misses the cache
+    assert cache.get(key[:2] + (b'0.0 Other',)) is None
@@ -0,0 +1,50 @@
+import pygamegltest
+import pytest
+from OpenGL.GL import *
+from OpenGL.GL import shaders
+
+VERTEX = '''#version 120
+uniform float scale;
+void main(void)
+{
+    gl_Position = gl_ModelViewProjectionMatrix * gl_Vertex * scale;
+}
+'''
+
+
+@pygamegltest.pygametest()
+def test_compile_programs_async():
+    broken = VERTEX.replace('scale;', 'scale')
+    pending = shaders.compileProgramsAsync(
+        [
+            [(VERTEX, GL_VERTEX_SHADER)],
+            [(VERTEX.replace('scale', 'factor'), GL_VERTEX_SHADER)],
+            [(broken, GL_VERTEX_SHADER)],
+        ],
+        threads=2,
+    )
+    assert len(pending) == 3
+    for future in pending:
+        while not future.done():
+            pass
+    first, second, third = pending
+    assert isinstance(first.result(), shaders.ShaderProgram)
+    assert glGetUniformLocation(first.result(), 'scale') != -1
+    assert glGetUniformLocation(second.result(), 'factor') != -1
+    assert isinstance(third.exception(), shaders.ShaderCompilationError)
+    with pytest.raises(shaders.ShaderCompilationError):
+        third.result()
+
+
+@pygamegltest.pygametest()
+def test_cancelled_future_releases_objects():
+    (future,) = shaders.compileProgramsAsync([[(VERTEX, GL_VERTEX_SHADER)]])
+    program = future.program
+    (shader,) = [shader for shader, source, shaderType in future.shaders]
+    assert future.cancel()
+    assert future.done()
+    assert not glIsProgram(program)
+    assert not glIsShader(shader)
+    assert future.program is None and future.shaders == ()
+    with pytest.raises(shaders.futures.CancelledError):
+        future.result()
@@ -0,0 +1,66 @@
+"""Tests for the interned constant table"""
+
+import pickle
+from OpenGL import constant, error
+
+
+def test_constants_interned():
+    from OpenGL.raw.GL.VERSION import GL_1_1, GL_1_4
+    from OpenGL.raw.GL.ARB import imaging
+
+    # the same enum from two raw modules is one object
+    assert imaging.GL_CONSTANT_COLOR is GL_1_4.GL_CONSTANT_COLOR
+    assert constant.Constant('GL_TEXTURE_2D', 0x0DE1) is GL_1_1.GL_TEXTURE_2D
+    assert constant.IntConstant('GL_TEXTURE_2D', 0x0DE1) is GL_1_1.GL_TEXTURE_2D
+    assert not hasattr(GL_1_1.GL_TEXTURE_2D, '__dict__')
+    assert repr(GL_1_1.GL_TEXTURE_2D) == 'GL_TEXTURE_2D'
+    assert GL_1_1.GL_TEXTURE_2D == 0x0DE1
+
+
+def test_constant_types():
+    first = constant.Constant('TEST_INTERNED_FLOAT', 2.5)
+    assert isinstance(first, constant.FloatConstant)
+    assert constant.Constant('TEST_INTERNED_FLOAT', 2.5) is first
+    text = constant.Constant('TEST_INTERNED_STRING', 'value')
+    assert isinstance(text, constant.StringConstant)
+    assert text == b'value' and text.name == 'TEST_INTERNED_STRING'
+
+
+def test_name_collision():
+    """Same name with a different value is a separate constant"""
+    first = constant.Constant('TEST_INTERNED_COLLISION', 1)
+    second = constant.Constant('TEST_INTERNED_COLLISION', 2)
+    assert first is not second
+    assert (first, second) == (1, 2)
+    assert second.name == first.name == 'TEST_INTERNED_COLLISION'
+    assert constant.Constant('TEST_INTERNED_COLLISION', 2) is second
+
+
+def test_reverse_index():
+    value = 0x7FFF1234
+    assert constant.namesFor(value) == ()
+    constant.Constant('TEST_REVERSE_B', value)
+    constant.Constant('TEST_REVERSE_A', value)
+    assert constant.namesFor(value) == ('TEST_REVERSE_B', 'TEST_REVERSE_A')
+    assert constant.nameFor(value) == 'TEST_REVERSE_B'
+    assert constant.nameFor(value, 'TEST_REVERSE_A') == 'TEST_REVERSE_A'
+    assert constant.nameFor(value, 'GL_') is None
+    assert constant.namesFor([value]) == ()
+
+
+def test_pickle_returns_interned():
+    from OpenGL.raw.GL.VERSION import GL_1_1
+
+    restored = pickle.loads(pickle.dumps(GL_1_1.GL_VERTEX_ARRAY))
+    assert restored is GL_1_1.GL_VERTEX_ARRAY
+
+
+def test_error_names_code():
+    from OpenGL.raw.GL.VERSION import GL_1_1
+
+    class operation(object):
+        __name__ = 'glTexImage2D'
+
+    err = error.GLError(err=int(GL_1_1.GL_INVALID_ENUM), baseOperation=operation())
+    assert 'err = 1280 (GL_INVALID_ENUM)' in str(err)
+    assert 'err=1280 (GL_INVALID_ENUM)' in repr(err)
@@ -0,0 +1,32 @@
+from OpenGL import contextdata
+
+CONTEXT = 0x1234
+
+
+def test_slot_storage():
+    key = ('test-slot', 1)
+    slot = contextdata.slotFor(key)
+    assert contextdata.slotFor(key) == slot
+    try:
+        assert contextdata.setSlot(slot, 'first', context=CONTEXT) is None
+        assert contextdata.getSlot(slot, context=CONTEXT) == 'first'
+        # dictionary API transparently uses the slot
+        assert contextdata.getValue(key, context=CONTEXT) == 'first'
+        assert contextdata.setValue(key, 'second', context=CONTEXT) == 'first'
+        assert contextdata.getSlot(slot, context=CONTEXT) == 'second'
+        assert contextdata.delValue(key, context=CONTEXT)
+        assert contextdata.getValue(key, context=CONTEXT) is None
+    finally:
+        contextdata.cleanupContext(CONTEXT)
+
+
+def test_slot_migrates_existing_value():
+    key = ('test-slot', 2)
+    contextdata.setValue(key, 'stored', context=CONTEXT)
+    try:
+        slot = contextdata.slotFor(key)
+        assert contextdata.getSlot(slot, context=CONTEXT) == 'stored'
+        assert key not in contextdata.storedPointers.get(CONTEXT, {})
+    finally:
+        contextdata.cleanupContext(CONTEXT)
+    assert contextdata.getSlot(slot, context=CONTEXT) is None
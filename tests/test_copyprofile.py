@@ -0,0 +1,64 @@
+import pygamegltest
+import pytest
+from OpenGL.GL import *
+from OpenGL import arrays
+from OpenGL.arrays import copyprofile
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+def test_record_conversions():
+    source = np.arange(12, dtype='d').reshape((3, 4))
+    with copyprofile.CopyProfiler() as profiler:
+        assert copyprofile.ACTIVE is profiler
+        arrays.GLfloatArray.asArray(source)
+        arrays.GLfloatArray.asArray(source[:, ::2])
+        matching = np.zeros((4,), 'f')
+        assert arrays.GLfloatArray.asArray(matching) is matching
+    assert copyprofile.ACTIVE is None
+    assert profiler.count == 2
+    assert profiler.bytes == 12 * 4 + 6 * 4
+    first, second = profiler.report()
+    assert first.callSite.startswith(__file__.rstrip('c'))
+    assert first.sources == {('float64', True): 1}
+    assert second.sources == {('float64', False): 1}
+    assert second.reasons == {'non-contiguous': 1}
+    assert 'type conversion' in profiler.format()
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+def test_nested_and_inactive():
+    outer = copyprofile.CopyProfiler()
+    inner = copyprofile.CopyProfiler()
+    with outer:
+        with inner:
+            arrays.GLfloatArray.asArray(np.arange(4, dtype='d'))
+        assert copyprofile.ACTIVE is outer
+    arrays.GLfloatArray.asArray(np.arange(4, dtype='d'))
+    assert inner.count == 1
+    assert outer.count == 0
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+@pygamegltest.pygametest()
+def test_entry_point():
+    with copyprofile.CopyProfiler() as profiler:
+        glLoadMatrixf(np.identity(4, dtype='d'))
+    (record,) = profiler.report()
+    assert record.entryPoint == 'glLoadMatrixf', record
+    assert record.bytes == 64
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+def test_converting_entry_point():
+    with copyprofile.CopyProfiler() as profiler:
+        copyprofile.converting(
+            glLoadMatrixf, arrays.GLfloatArray.asArray, np.arange(4, dtype='d')
+        )
+    (record,) = profiler.report()
+    assert record.entryPoint == 'glLoadMatrixf', record
+    assert getattr(copyprofile._state, 'function', None) is None
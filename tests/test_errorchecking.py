@@ -0,0 +1,41 @@
+import pygamegltest
+import pytest
+from OpenGL.GL import *
+from OpenGL import error
+from OpenGL.raw.GL import _errors
+
+
+pytestmark = pytest.mark.skipif(
+    not _errors._error_checker, reason="Error checking disabled"
+)
+
+
+@pygamegltest.pygametest()
+def test_checkpoint_only():
+    previous = error.setCheckInterval(0)
+    try:
+        glEnable(0x9999)
+        glClearColor(0, 0, 0, 1)
+        with pytest.raises(error.GLError) as info:
+            error.checkpoint()
+        names = [op.__name__ for op in info.value.pendingOperations]
+        assert names == ['glEnable', 'glClearColor']
+        # error is cleared and pending list reset
+        error.checkpoint()
+    finally:
+        error.setCheckInterval(previous)
+
+
+@pygamegltest.pygametest()
+def test_sampled_checking():
+    previous = error.setCheckInterval(3)
+    try:
+        glEnable(0x9999)
+        glClearColor(0, 0, 0, 1)
+        with pytest.raises(error.GLError) as info:
+            glClearColor(0, 0, 0, 1)
+        assert len(info.value.pendingOperations) == 3
+    finally:
+        error.setCheckInterval(previous)
+    with pytest.raises(error.GLError):
+        glEnable(0x9999)
@@ -167,6 +167,24 @@ class TestEvaluators(basetestcase.BaseTest):
                         GL_MAP1_VERTEX_3,
                 )
 
+    if np:
+        def test_nurbs_scoped_references( self ):
+            """Curve data is released at gluEndCurve, userData is replaced"""
+            nurb = GLU.gluNewNurbsRenderer()
+            knots = np.array( [0,0,0,0,1,1,1,1], 'f' )
+            control = np.array( [[-1,0,0],[0,1,0],[1,-1,0],[2,0,0]], 'f' )
+            for userData in ([1], [2], [3]):
+                GLU.gluNurbsCallbackData( nurb, userData )
+                GLU.gluBeginCurve( nurb )
+                GLU.gluNurbsCurve( nurb, knots, control, GL_MAP1_VERTEX_3 )
+                assert nurb.retainedStatistics()['scoped'] == 2
+                GLU.gluEndCurve( nurb )
+            stats = nurb.retainedStatistics()
+            assert stats['scoped'] == 0, stats
+            assert stats['persistent'] == 1, stats
+            assert stats['releasedScopes'] == 3, stats
+            assert nurb.originalObject( id(userData) ) is userData
+
     def test_gle( self ):
         from OpenGL.GLE import (
             gleSetJoinStyle,
@@ -0,0 +1,73 @@
+import pygamegltest
+import pytest
+from OpenGL.GL import *
+from OpenGL.GL import feedback
+from OpenGL.raw.GL.VERSION import GL_1_0 as raw
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _capture(mode):
+    """Capture feedback for a few primitives, returns (buffer, entryCount)"""
+    buffer = glFeedbackBuffer(1024, mode)
+    glRenderMode(GL_FEEDBACK)
+    glPassThrough(42.0)
+    glBegin(GL_LINES)
+    glColor3f(1, 0, 0)
+    glVertex2f(0.0, 0.0)
+    glVertex2f(0.5, 0.5)
+    glEnd()
+    glBegin(GL_TRIANGLES)
+    glVertex2f(-0.5, -0.5)
+    glVertex2f(0.5, -0.5)
+    glVertex2f(0.0, 0.25)
+    glEnd()
+    glBegin(GL_POINTS)
+    glVertex2f(0.25, 0.0)
+    glEnd()
+    return buffer, raw.glRenderMode(GL_RENDER)
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+@pygamegltest.pygametest()
+def test_feedback_records():
+    buffer, count = _capture(GL_3D_COLOR)
+    records = feedback.parseFeedback(buffer, count)
+    assert isinstance(records, feedback.FeedbackRecords)
+    tokens = list(records.primitives['token'])
+    assert tokens[0] == GL_PASS_THROUGH_TOKEN
+    assert tokens[1] in (GL_LINE_TOKEN, GL_LINE_RESET_TOKEN)
+    assert tokens[2:] == [GL_POLYGON_TOKEN, GL_POINT_TOKEN]
+    assert list(records.primitives['count']) == [0, 2, 3, 1]
+    assert list(records.primitives['first']) == [0, 0, 2, 5]
+    assert records.primitives['value'][0] == 42.0
+    assert records.vertices.shape == (6,)
+    assert records.vertices['color'].shape == (6, 4)
+    assert (records.vertices['color'][:2] == [1, 0, 0, 1]).all()
+    assert records[0] == (GL_PASS_THROUGH_TOKEN, 42.0)
+    line = records[1]
+    assert line[0] == tokens[1] and len(line) == 3
+    assert isinstance(line[1], feedback.Vertex)
+    assert len(records[-2]) == 4
+    assert len(list(records)) == 4
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+@pygamegltest.pygametest()
+def test_feedback_matches_objects():
+    buffer, count = _capture(GL_4D_COLOR_TEXTURE)
+    records = feedback.parseFeedback(buffer, count)
+    objects = feedback.parseFeedbackObjects(buffer, count)
+    assert len(objects) == len(records)
+    for old, new in zip(objects, records):
+        assert old[0] == new[0]
+        for a, b in zip(old[1:], new[1:]):
+            if isinstance(a, feedback.Vertex):
+                assert list(a.vertex) == list(b.vertex)
+                assert list(a.color) == list(b.color)
+                assert list(a.texture) == list(b.texture)
+            else:
+                assert a == b
@@ -0,0 +1,43 @@
+import pytest
+from OpenGL import plugins
+from OpenGL.arrays import arraydatatype
+
+
+class Unhandled(object):
+    pass
+
+
+class MyList(list):
+    pass
+
+
+def _registry():
+    return arraydatatype.ArrayDatatype.getRegistry()
+
+
+def test_negative_cache():
+    registry = _registry()
+    registry.resetStatistics()
+    for i in range(3):
+        with pytest.raises(TypeError):
+            registry(Unhandled())
+    stats = registry.statistics()
+    assert stats['failures'] == 1
+    assert stats['negativeHits'] == 2
+
+
+def test_derived_cache_and_invalidation():
+    registry = _registry()
+    handler = registry([1, 2, 3])
+    registry.resetStatistics()
+    assert registry(MyList([1])) is handler
+    assert registry(MyList([1])) is handler
+    stats = registry.statistics()
+    assert stats['misses'] == 1
+    assert stats['hits'] == 1
+    assert MyList in registry.derived
+    # any registration invalidates the derived entries
+    registry.register(handler, [list])
+    assert MyList not in registry.derived
+    assert not registry.negative
+    assert registry(MyList([1])) is handler
@@ -0,0 +1,129 @@
+"""Tests for the lazy OpenGL.GL namespace (OpenGL.LAZY_GL_NAMESPACE)"""
+
+import os, sys, subprocess, time, json
+import pytest
+from OpenGL import _configflags
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+
+def _run(script, lazy, **environ):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([ROOT] + sys.path)
+    env['PYOPENGL_LAZY_GL_NAMESPACE'] = '1' if lazy else '0'
+    env.update(environ)
+    output = subprocess.check_output([sys.executable, '-c', script], env=env)
+    return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+def _indexFlagsDefault():
+    from OpenGL.GL import _namespace
+
+    return all(
+        bool(getattr(_configflags, flag)) == value
+        for moduleName, flag, value in _namespace.INDEX_FLAGS
+    )
+
+
+@pytest.mark.skipif(
+    _configflags.LAZY_GL_NAMESPACE, reason="Index is generated from the eager namespace"
+)
+@pytest.mark.skipif(
+    not _indexFlagsDefault(), reason="Index is generated with the default flags"
+)
+def test_index_current():
+    from OpenGL.GL import _namespace
+
+    with open(
+        os.path.join(os.path.dirname(_namespace.__file__), '_lazyindex.py')
+    ) as fh:
+        current = fh.read()
+    assert (
+        _namespace.generate() == current
+    ), 'OpenGL/GL/_lazyindex.py is stale, regenerate with python -m OpenGL.GL._namespace'
+
+
+def test_lazy_namespace():
+    result = _run(
+        '''
+import sys, json
+from OpenGL.GL import glClear, GL_COLOR_BUFFER_BIT, glRotate
+import OpenGL.GL
+loaded = 'OpenGL.GL.VERSION.GL_4_6' in sys.modules
+from OpenGL.GL import images, shaders
+try:
+    OpenGL.GL.glNotAFunction
+except AttributeError:
+    missing = True
+else:
+    missing = False
+print(json.dumps({
+    'loaded': loaded,
+    'rotate': glRotate is OpenGL.GL.glRotated,
+    'images': images is sys.modules['OpenGL.GL.images'],
+    'missing': missing,
+    'dir': len(dir(OpenGL.GL)),
+}))
+''',
+        lazy=True,
+    )
+    assert result['loaded'] is False
+    assert result['rotate'] and result['images'] and result['missing']
+    assert result['dir'] > 3000
+
+
+def test_lazy_star_import():
+    script = '''
+import json
+from OpenGL.GL import *
+names = [
+    name for name, value in list(globals().items())
+    if not name.startswith('_')
+    # sub-modules are only bound once imported, which is order dependent
+    and getattr(value, '__name__', None) != 'OpenGL.GL.' + name
+]
+print(json.dumps(sorted(names)))
+'''
+    assert _run(script, lazy=True) == _run(script, lazy=False)
+
+
+def test_lazy_flag_dependent_exports():
+    """Exports which depend on a flag are found although the index lacks them"""
+    script = '''
+import json
+import OpenGL.GL
+from OpenGL.GL import glPixelStorei, glPopClientAttrib, glBegin
+from OpenGL.GL import images, exceptional
+print(json.dumps([
+    glPixelStorei is images.glPixelStorei,
+    glPopClientAttrib is images.glPopClientAttrib,
+    OpenGL.GL.glPixelStoref is images.glPixelStoref,
+    glBegin is exceptional.glBegin,
+    'glPixelStoref' in dir(OpenGL.GL),
+]))
+'''
+    flags = dict(PYOPENGL_SHADOW_PIXEL_STORE='1', PYOPENGL_ERROR_CHECKING='0')
+    assert _run(script, lazy=True, **flags) == [True] * 5
+    assert _run(script, lazy=False, **flags) == [True] * 5
+    star = '''
+import json
+from OpenGL.GL import *
+from OpenGL.GL import images
+print(json.dumps([glPixelStorei is images.glPixelStorei, glRotate is glRotated]))
+'''
+    assert _run(star, lazy=True, **flags) == [True, True]
+
+
+def test_import_benchmark():
+    """Guard the point of the lazy namespace: loading few entry points is cheap"""
+    script = '''
+import sys, time, json
+start = time.time()
+from OpenGL.GL import glClear, GL_COLOR_BUFFER_BIT
+print(json.dumps([time.time() - start, len([m for m in sys.modules if m.startswith('OpenGL')])]))
+'''
+    lazy = [_run(script, lazy=True) for i in range(3)]
+    eager = [_run(script, lazy=False) for i in range(3)]
+    assert lazy[0][1] < eager[0][1] / 2, (lazy, eager)
+    assert min(t for t, count in lazy) < min(t for t, count in eager), (lazy, eager)
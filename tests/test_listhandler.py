@@ -0,0 +1,42 @@
+import ctypes
+from OpenGL.arrays import lists
+from OpenGL.arrays import _arrayconstants as GL_1_1
+
+handler = lists.ListHandler()
+
+
+def test_flatten():
+    assert lists.flatten([[1, 2], (3, 4)]) == ([2, 2], [1, 2, 3, 4])
+    assert lists.flatten([1, 2, 3]) == ([3], [1, 2, 3])
+    assert lists.flatten([[1, 2], [3]]) is None
+    assert lists.flatten([[1, 2], 3]) is None
+    assert lists.flatten([]) is None
+
+
+def test_bulk_matches_recursive():
+    data = [[[float(i), i + 0.5] for i in range(j, j + 3)] for j in range(4)]
+    fast = handler.asArray(data, GL_1_1.GL_FLOAT)
+    slow = lists.ListHandler._asArray(data, GL_1_1.GL_FLOAT)
+    assert type(fast) is type(slow)
+    assert bytes(fast) == bytes(slow)
+    assert handler.dimensions(fast) == (4, 3, 2)
+    assert handler.dimsOf(data) == [4, 3, 2]
+
+
+def test_type_cached():
+    first = handler.asArray([[1, 2, 3]] * 2, GL_1_1.GL_INT)
+    second = handler.asArray([(4, 5, 6), (7, 8, 9)], GL_1_1.GL_INT)
+    assert type(first) is type(second)
+    assert list(second[1]) == [7, 8, 9]
+
+
+def test_fallback():
+    # irregular and out-of-range values use the recursive conversion
+    result = handler.asArray([300, 1], GL_1_1.GL_UNSIGNED_BYTE)
+    assert list(result) == [300 & 0xFF, 1]
+    try:
+        handler.asArray([[1, 2], [3]], GL_1_1.GL_FLOAT)
+    except (ValueError, TypeError):
+        pass
+    else:
+        raise AssertionError('Expected an error for irregular nesting')
@@ -0,0 +1,92 @@
+import ctypes, threading
+import pygamegltest
+import pytest
+from OpenGL.GL import *
+from OpenGL.arrays import outputpool, GLubyteArray, GLfloatArray
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def test_pool_reuse():
+    with outputpool.OutputPool(minBytes=16) as pool:
+        first = outputpool.zeros(GLubyteArray, (8, 8))
+        assert pool.misses == 1
+        ctypes.memset(GLubyteArray.dataPointer(first), 0xFF, 64)
+        assert pool.release(first)
+        assert not pool.release(first)
+        second = outputpool.zeros(GLubyteArray, (8, 8))
+        assert second is first
+        assert pool.hits == 1
+        # reused arrays are cleared
+        assert ctypes.string_at(GLubyteArray.dataPointer(second), 64) == b'\0' * 64
+        # different shape or type is a new allocation
+        assert outputpool.zeros(GLubyteArray, (8, 4)) is not first
+        assert outputpool.zeros(GLfloatArray, (8, 8)) is not first
+        # too small to pool
+        small = outputpool.zeros(GLubyteArray, (2,))
+        assert not pool.release(small)
+    assert outputpool.current() is None
+    assert not outputpool.release(second)
+
+
+def test_pool_bounds():
+    pool = outputpool.OutputPool(maxBytes=128, maxPerKey=2, minBytes=0)
+    with pool:
+        arrays = [outputpool.zeros(GLubyteArray, (64,)) for i in range(3)]
+    assert [pool.release(array) for array in arrays] == [True, True, False]
+    assert pool.bytes == 128
+    pool.clear()
+    assert pool.bytes == 0
+
+
+def test_pool_per_thread():
+    seen = []
+    with outputpool.OutputPool():
+        thread = threading.Thread(target=lambda: seen.append(outputpool.current()))
+        thread.start()
+        thread.join()
+        assert outputpool.current() is not None
+    assert seen == [None]
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+@pygamegltest.pygametest()
+def test_pooled_read_pixels():
+    glClearColor(1, 0, 0, 1)
+    glClear(GL_COLOR_BUFFER_BIT)
+    with outputpool.OutputPool() as pool:
+        first = glReadPixels(0, 0, 32, 32, GL_RGBA, GL_UNSIGNED_BYTE, outputType=None)
+        pool.release(first)
+        second = glReadPixels(0, 0, 32, 32, GL_RGBA, GL_UNSIGNED_BYTE, outputType=None)
+        assert second is first
+        # bytes results release their intermediate array automatically
+        data = glReadPixels(0, 0, 32, 32, GL_RGBA, GL_UNSIGNED_BYTE)
+        data = glReadPixels(0, 0, 32, 32, GL_RGBA, GL_UNSIGNED_BYTE)
+        assert pool.hits == 2, (pool.hits, pool.misses)
+        assert bytes(bytearray(data)) == bytes(bytearray(second))
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+@pygamegltest.pygametest()
+def test_pooled_array_passed_in():
+    """Arrays passed in as array= are never handed back to the pool"""
+    texels = np.full((32, 32, 4), 7, 'B')
+    texture = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, texture)
+    glTexImage2D(
+        GL_TEXTURE_2D, 0, GL_RGBA, 32, 32, 0, GL_RGBA, GL_UNSIGNED_BYTE, texels
+    )
+    glClearColor(1, 0, 0, 1)
+    glClear(GL_COLOR_BUFFER_BIT)
+    with outputpool.OutputPool() as pool:
+        mine = glReadPixels(0, 0, 32, 32, GL_RGBA, GL_UNSIGNED_BYTE, outputType=None)
+        data = glGetTexImage(GL_TEXTURE_2D, 0, GL_RGBA, GL_UNSIGNED_BYTE, array=mine)
+        assert bytes(bytearray(data)) == texels.tobytes()
+        glReadPixels(0, 0, 32, 32, GL_RGBA, GL_UNSIGNED_BYTE, array=mine)
+        other = glReadPixels(0, 0, 32, 32, GL_RGBA, GL_UNSIGNED_BYTE, outputType=None)
+        assert other is not mine
+        assert pool.hits == 0, (pool.hits, pool.misses)
+    glDeleteTextures([texture])
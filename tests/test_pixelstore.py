@@ -0,0 +1,89 @@
+import os, sys, subprocess, json
+import pygamegltest
+from OpenGL.GL import *
+from OpenGL import images, _configflags
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+
+@pygamegltest.pygametest()
+def test_pixel_store_shadow():
+    original = _configflags.SHADOW_PIXEL_STORE
+    _configflags.SHADOW_PIXEL_STORE = True
+    try:
+        images.invalidatePixelStore()
+        images.setupDefaultTransferMode()
+        images.rankPacking(3)
+        shadow = images.pixelStoreShadow()
+        assert shadow[GL_PACK_ALIGNMENT] == 1
+        assert shadow[GL_PACK_SWAP_BYTES] == 0
+        assert not images.setPixelStore(GL_PACK_ALIGNMENT, 1)
+        # changed behind our back, shadow is stale until invalidated
+        glPixelStorei(GL_PACK_ALIGNMENT, 4)
+        images.invalidatePixelStore(GL_PACK_ALIGNMENT)
+        assert GL_PACK_ALIGNMENT not in shadow
+        assert images.setPixelStore(GL_PACK_ALIGNMENT, 1)
+        assert glGetIntegerv(GL_PACK_ALIGNMENT) == 1
+        # odd-width RGB read requires the tight packing set above
+        data = glReadPixels(0, 0, 3, 1, GL_RGB, GL_UNSIGNED_BYTE)
+        assert len(bytes(bytearray(data))) == 9
+    finally:
+        _configflags.SHADOW_PIXEL_STORE = original
+        images.invalidatePixelStore()
+
+
+SHADOW_SCRIPT = '''
+import json, pygame
+from OpenGL.GL import *
+import OpenGL.GL
+from OpenGL.raw.GL.VERSION import GL_1_1
+from OpenGL import images
+pygame.display.init()
+pygame.display.set_mode((16, 16), pygame.OPENGL | pygame.DOUBLEBUF)
+try:
+    shadow = images.pixelStoreShadow()
+    wrapped = OpenGL.GL.glPixelStorei is not GL_1_1.glPixelStorei
+    glPixelStorei(GL_PACK_ALIGNMENT, 4)
+    recorded = shadow.get(GL_PACK_ALIGNMENT)
+    # the wrapped read resets the alignment the shadow says is 4
+    data = glReadPixels(0, 0, 3, 1, GL_RGB, GL_UNSIGNED_BYTE)
+    size = len(bytes(bytearray(data)))
+    alignment = int(glGetIntegerv(GL_PACK_ALIGNMENT))
+    glPushClientAttrib(GL_CLIENT_PIXEL_STORE_BIT)
+    glPixelStorei(GL_PACK_ALIGNMENT, 2)
+    glPopClientAttrib()
+    invalidated = GL_PACK_ALIGNMENT not in shadow
+finally:
+    pygame.display.quit()
+print(json.dumps({
+    'wrapped': wrapped,
+    'recorded': recorded,
+    'size': size,
+    'alignment': alignment,
+    'invalidated': invalidated,
+}))
+'''
+
+
+def _runShadowed(script, **environ):
+    """Run script with OpenGL.SHADOW_PIXEL_STORE set at import time"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([ROOT] + sys.path)
+    env['PYOPENGL_SHADOW_PIXEL_STORE'] = '1'
+    env.update(environ)
+    output = subprocess.check_output([sys.executable, '-c', script], env=env)
+    return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+def test_pixel_store_shadow_wrappers():
+    """OpenGL.GL pixel-store entry points keep the shadow current"""
+    for lazy in ('0', '1'):
+        result = _runShadowed(SHADOW_SCRIPT, PYOPENGL_LAZY_GL_NAMESPACE=lazy)
+        assert result == {
+            'wrapped': True,
+            'recorded': 4,
+            'size': 9,
+            'alignment': 1,
+            'invalidated': True,
+        }, (lazy, result)
@@ -0,0 +1,59 @@
+import os
+import pygamegltest
+import pytest
+from OpenGL.GL import *
+from OpenGL.GL import shaders
+
+VERTEX = '''#version 120
+uniform float scale;
+void main(void)
+{
+    gl_Position = gl_ModelViewProjectionMatrix * gl_Vertex * scale;
+}
+'''
+
+
+@pygamegltest.pygametest()
+def test_retrieve_load_roundtrip():
+    if not shaders._binariesSupported():
+        pytest.skip('No program binary formats')
+    program = shaders.compileProgram(
+        shaders.compileShader(VERTEX, GL_VERTEX_SHADER), retrievable=True
+    )
+    format, binary = program.retrieve()
+    assert len(binary) and any(bytearray(binary))
+    loaded = shaders.ShaderProgram(glCreateProgram())
+    loaded.load(format, binary, validate=False)
+    assert glGetUniformLocation(loaded, 'scale') != -1
+
+
+@pygamegltest.pygametest()
+def test_program_cache(tmp_path):
+    if not shaders._binariesSupported():
+        pytest.skip('No program binary formats')
+    cache = shaders.ProgramCache(str(tmp_path))
+    first = shaders.compileProgram((VERTEX, GL_VERTEX_SHADER), cache=cache)
+    files = os.listdir(str(tmp_path))
+    assert len(files) == 1, files
+    second = shaders.compileProgram((VERTEX, GL_VERTEX_SHADER), cache=cache)
+    assert second != first
+    assert glGetUniformLocation(second, 'scale') != -1
+    # compiled shaders hash to the same key as their sources
+    third = shaders.compileProgram(
+        shaders.compileShader(VERTEX, GL_VERTEX_SHADER), cache=cache
+    )
+    assert os.listdir(str(tmp_path)) == files
+    assert glGetUniformLocation(third, 'scale') != -1
+
+
+@pygamegltest.pygametest()
+def test_program_cache_mismatch(tmp_path):
+    if not shaders._binariesSupported():
+        pytest.skip('No program binary formats')
+    cache = shaders.ProgramCache(str(tmp_path))
+    key = cache.key([(GL_VERTEX_SHADER, VERTEX)], [('separable', False)])
+    cache.set(key, 0, b'not a program binary')
+    program = shaders.compileProgram((VERTEX, GL_VERTEX_SHADER), cache=cache)
+    assert glGetUniformLocation(program, 'scale') != -1
+    format, binary = cache.get(key)
+    assert format != 0
@@ -0,0 +1,97 @@
+import basetestcase
+from OpenGL.GL import *
+from OpenGL.GLU import *
+
+try:
+    import numpy as np
+except ImportError as err:
+    np = None
+
+
+class TestProjection(basetestcase.BaseTest):
+    if np:
+
+        def setUp(self):
+            super(TestProjection, self).setUp()
+            glMatrixMode(GL_PROJECTION)
+            glLoadIdentity()
+            gluPerspective(40.0, 1.0, 1.0, 20.0)
+            glMatrixMode(GL_MODELVIEW)
+            glLoadIdentity()
+            glTranslatef(0.5, -0.25, -8.0)
+            glRotatef(30.0, 1.0, 1.0, 0.0)
+            self.points = np.array(
+                [
+                    (x, y, z)
+                    for x in (-1.0, 0.0, 1.5)
+                    for y in (-2, 0.5)
+                    for z in (-1, 2)
+                ],
+                dtype='d',
+            )
+
+        def test_project_array_matches_gluProject(self):
+            result = gluProjectArray(self.points)
+            assert len(result) == len(self.points)
+            for point, found in zip(self.points, result):
+                expected = gluProject(*point)
+                assert np.allclose(found, expected), (point, found, expected)
+
+        def test_project_array_homogeneous(self):
+            points = np.hstack((self.points, np.ones((len(self.points), 1))))
+            assert np.allclose(gluProjectArray(points), gluProjectArray(self.points))
+            # scaling a homogeneous point does not move it
+            assert np.allclose(
+                gluProjectArray(points * 2.0), gluProjectArray(self.points)
+            )
+
+        def test_unproject_array_matches_gluUnProject(self):
+            windows = gluProjectArray(self.points)
+            result = gluUnProjectArray(windows)
+            for window, found in zip(windows, result):
+                expected = gluUnProject(*window)
+                assert np.allclose(found, expected), (window, found, expected)
+            assert np.allclose(result, self.points)
+
+        def test_unproject4_array_matches_gluUnProject4(self):
+            windows = np.hstack(
+                (gluProjectArray(self.points), np.ones((len(self.points), 1)))
+            )
+            result = gluUnProjectArray(windows, near=0.0, far=1.0)
+            assert result.shape == (len(self.points), 4)
+            for window, found in zip(windows, result):
+                expected = gluUnProject4(*window, near=0.0, far=1.0)
+                assert np.allclose(found, expected), (window, found, expected)
+
+        def test_explicit_matrices(self):
+            model = glGetDoublev(GL_MODELVIEW_MATRIX)
+            proj = glGetDoublev(GL_PROJECTION_MATRIX)
+            view = glGetIntegerv(GL_VIEWPORT)
+            expected = gluProjectArray(self.points)
+            glLoadIdentity()
+            found = gluProjectArray(self.points, model, proj, view)
+            assert np.allclose(found, expected)
+            assert np.allclose(gluUnProjectArray(found, model, proj, view), self.points)
+
+        def test_degenerate_points(self):
+            proj = np.zeros((4, 4), 'd')
+            proj[0, 0] = proj[1, 1] = proj[2, 2] = 1.0
+            found = gluProjectArray(self.points, np.identity(4), proj, (0, 0, 10, 10))
+            assert np.isnan(found).all()
+            try:
+                gluUnProjectArray(self.points, np.identity(4), proj, (0, 0, 10, 10))
+            except ValueError as err:
+                pass
+            else:
+                raise AssertionError("""Singular matrix did not raise ValueError""")
+
+        def test_single_point(self):
+            found = gluProjectArray(self.points[0])
+            assert found.shape == (1, 3)
+            assert np.allclose(found[0], gluProject(*self.points[0]))
+            try:
+                gluProjectArray(np.zeros((3, 2)))
+            except ValueError as err:
+                pass
+            else:
+                raise AssertionError("""(N,2) points did not raise ValueError""")
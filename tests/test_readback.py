@@ -0,0 +1,72 @@
+import pygamegltest
+import pytest
+from OpenGL.GL import *
+from OpenGL.GL import readback
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _pixels(value):
+    return np.frombuffer(bytes(bytearray(value)), 'B').reshape((-1, 4))
+
+
+def _clear(r, g, b):
+    glClearColor(r, g, b, 1.0)
+    glClear(GL_COLOR_BUFFER_BIT)
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+@pygamegltest.pygametest()
+def test_async_readback():
+    capture = readback.AsyncReadback(16, 8, GL_RGBA, GL_UNSIGNED_BYTE, slots=2)
+    colours = [(1, 0, 0), (0, 1, 0), (0, 0, 1)]
+    pending = []
+    for colour in colours:
+        _clear(*colour)
+        pending.append(capture.read(0, 0))
+    # third read re-used the first slot, so the first read is resolved
+    assert pending[0].done()
+    expected = glReadPixels(0, 0, 16, 8, GL_RGBA, GL_UNSIGNED_BYTE, outputType=None)
+    results = [future.result() for future in pending]
+    for colour, result in zip(colours, results):
+        assert len(_pixels(result)) == 16 * 8
+        assert (_pixels(result)[:, :3] == np.array(colour) * 255).all()
+    assert bytes(bytearray(results[-1])) == bytes(bytearray(expected))
+    out = np.zeros((8, 16, 4), 'B')
+    assert capture.read(0, 0, out=out).result() is out
+    assert out.tobytes() == bytes(bytearray(expected))
+    assert capture.poll() == []
+    capture.delete()
+    assert not capture.buffers
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+@pygamegltest.pygametest()
+def test_texture_readback():
+    texture = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, texture)
+    data = np.arange(4 * 4 * 4, dtype='B').reshape((4, 4, 4))
+    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, 4, 4, 0, GL_RGBA, GL_UNSIGNED_BYTE, data)
+    capture = readback.AsyncReadback(4, 4)
+    result = capture.readTexture(GL_TEXTURE_2D, 0).result()
+    assert bytes(bytearray(result)) == data.tobytes()
+    with pytest.raises(ValueError):
+        readback.AsyncReadback(8, 8).readTexture(GL_TEXTURE_2D, 0)
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+@pygamegltest.pygametest()
+def test_cancelled_readback_releases_slot():
+    capture = readback.AsyncReadback(4, 4, slots=2)
+    future = capture.read(0, 0)
+    assert capture.fences[0] is not None
+    assert future.cancel()
+    future.done()
+    assert capture.pending == [None, None]
+    assert capture.fences == [None, None]
+    with pytest.raises(readback.futures.CancelledError):
+        future.result()
+    capture.delete()
@@ -0,0 +1,126 @@
+import pygamegltest
+import pytest
+from OpenGL.GL import *
+from OpenGL.GL import shaders, reflection
+
+VERTEX = '''#version 140
+uniform mat4 u_mvp;
+uniform vec3 u_lights[4];
+uniform Material {
+    vec4 diffuse;
+    float shininess;
+};
+in vec3 position;
+in vec3 normal;
+out vec4 colour;
+void main(void)
+{
+    gl_Position = u_mvp * vec4(position, 1.0);
+    colour = diffuse * shininess * vec4(normal + u_lights[0] + u_lights[3], 1.0);
+}
+'''
+FRAGMENT = '''#version 140
+in vec4 colour;
+out vec4 result;
+void main(void)
+{
+    result = colour;
+}
+'''
+COMPUTE = '''#version 430
+layout(local_size_x = 1) in;
+layout(std430, binding = 2) buffer Particles {
+    vec4 positions[];
+};
+uniform float u_step;
+void main(void)
+{
+    positions[gl_GlobalInvocationID.x] += vec4(u_step);
+}
+'''
+
+
+def _program():
+    return shaders.compileProgram(
+        shaders.compileShader(VERTEX, GL_VERTEX_SHADER),
+        shaders.compileShader(FRAGMENT, GL_FRAGMENT_SHADER),
+    )
+
+
+def _check(program, found):
+    assert sorted(uniform.name for uniform in found.uniforms) == [
+        'diffuse',
+        'shininess',
+        'u_lights[0]',
+        'u_mvp',
+    ]
+    mvp = found.uniform('u_mvp')
+    assert mvp.location == glGetUniformLocation(program, 'u_mvp')
+    assert mvp.type == GL_FLOAT_MAT4 and mvp.size == 1
+    assert mvp.blockIndex == -1
+    lights = found.uniform(b'u_lights')
+    assert lights is found.uniform('u_lights[0]')
+    assert lights.size == 4 and lights.type == GL_FLOAT_VEC3
+    assert lights.location == glGetUniformLocation(program, 'u_lights')
+    assert sorted(attribute.name for attribute in found.attributes) == [
+        'normal',
+        'position',
+    ]
+    for attribute in found.attributes:
+        assert attribute.location == glGetAttribLocation(program, attribute.name)
+        assert attribute.type == GL_FLOAT_VEC3
+    (material,) = found.uniformBlocks
+    assert found.uniformBlock('Material') is material
+    assert material.dataSize >= 20
+    assert sorted(variable.name for variable in material.variables) == [
+        'diffuse',
+        'shininess',
+    ]
+    diffuse = found.uniform('diffuse')
+    assert diffuse.blockIndex == material.index
+    assert diffuse.location == -1
+    assert diffuse.offset == 0
+    assert found.uniform('shininess').offset == 16
+    with pytest.raises(KeyError):
+        found.uniform('missing')
+
+
+@pygamegltest.pygametest()
+def test_reflection_interface_query():
+    if not reflection.interfaceQuerySupported():
+        pytest.skip('No GL_ARB_program_interface_query')
+    program = _program()
+    found = program.reflection()
+    assert found.interfaceQuery
+    assert program.reflection() is found
+    _check(program, found)
+    assert program.reflection(refresh=True) is not found
+
+
+@pygamegltest.pygametest()
+def test_reflection_active_queries():
+    program = _program()
+    found = reflection.ProgramReflection(program, interfaceQuery=False)
+    assert not found.interfaceQuery
+    _check(program, found)
+    assert found.storageBlocks == ()
+
+
+@pygamegltest.pygametest()
+def test_reflection_storage_blocks():
+    if not reflection.interfaceQuerySupported():
+        pytest.skip('No GL_ARB_program_interface_query')
+    try:
+        compute = shaders.compileShader(COMPUTE, GL_COMPUTE_SHADER)
+    except (RuntimeError, GLError):
+        pytest.skip('No compute shader support')
+    program = shaders.compileProgram(compute)
+    found = program.reflection()
+    (particles,) = found.storageBlocks
+    assert found.storageBlock('Particles') is particles
+    assert particles.binding == 2
+    (positions,) = particles.variables
+    assert positions.name == 'positions[0]'
+    assert positions.type == GL_FLOAT_VEC4
+    assert positions.offset == 0 and positions.arrayStride == 16
+    assert found.uniform('u_step').location == glGetUniformLocation(program, 'u_step')
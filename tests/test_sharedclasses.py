@@ -0,0 +1,68 @@
+"""Tests that raw and wrapped entry points share classes rather than one class per function"""
+
+import ctypes, weakref
+import pygamegltest
+from OpenGL import platform, wrapper
+from OpenGL.platform import baseplatform
+
+
+def _null(name='glDoesNotExist', doc='Testing docstring', deprecated=False):
+    return platform.PLATFORM.nullFunction(
+        name,
+        platform.PLATFORM.GL,
+        resultType=None,
+        argTypes=(ctypes.c_int,),
+        doc=doc,
+        argNames=('value',),
+        deprecated=deprecated,
+    )
+
+
+def test_null_functions_share_class():
+    first, second = _null('glFirstMissing'), _null('glSecondMissing')
+    assert type(first) is type(second) is baseplatform._NullFunctionPointer
+    assert type(_null(deprecated=True)) is baseplatform._DeprecatedFunctionPointer
+    assert first.__name__ == 'glFirstMissing'
+    assert first.__doc__ == 'Testing docstring'
+    assert 'glFirstMissing object at' in repr(first)
+    first.__module__ = 'OpenGL.raw.GL.testing'
+    assert first.__module__ == 'OpenGL.raw.GL.testing'
+    assert second.__module__ != first.__module__
+    # the class itself still documents itself normally
+    assert 'Function-pointer-like' in baseplatform._NullFunctionPointer.__doc__
+    assert weakref.ref(first)() is first
+    assert not first
+
+
+def test_wrappers_share_class():
+    base = _null('glWrappedMissing')
+    wrapped = wrapper.wrapper(base)
+    assert type(wrapped) is wrapper.Wrapper
+    assert wrapper.wrapper(wrapped) is wrapped
+    assert wrapped.__name__ == 'glWrappedMissing'
+    assert wrapped.__doc__ == 'Testing docstring'
+    assert wrapped.__module__ == base.__module__
+    assert 'glWrappedMissing object at' in repr(wrapped)
+    # documentation attributes are forwarded to the base function
+    wrapped.value_LOOKUP_count = {1: 2}
+    assert base.value_LOOKUP_count == {1: 2}
+    assert wrapper.Wrapper.__doc__.startswith('Wrapper around')
+
+
+@pygamegltest.pygametest()
+def test_resolved_function_keeps_metadata():
+    from OpenGL.raw.GL.VERSION import GL_1_1
+    from OpenGL.GL import glGetError
+
+    function = GL_1_1.glFinish
+    function()
+    assert function.resolved
+    assert isinstance(function, baseplatform._NullFunctionPointer)
+    assert function.__name__ == 'glFinish'
+    assert type(function).__name__ == 'glFinish'
+    assert function.__module__ == GL_1_1.glFlush.__module__
+    # loading again does not stack per-function classes
+    function.load()
+    assert type(function).__bases__ == (baseplatform._NullFunctionPointer,)
+    function()
+    assert glGetError() == 0
@@ -0,0 +1,41 @@
+import pygamegltest
+import pytest
+from OpenGL.GL import *
+from OpenGL.arrays import vbo
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+@pygamegltest.pygametest()
+def test_streaming_ring():
+    if not glBufferStorage:
+        pytest.skip('No glBufferStorage')
+    stream = vbo.StreamingVBO((4, 3), 'f', segments=3)
+    assert stream.data.shape == (4, 3)
+    assert stream.stride % 256 == 0
+    offsets = []
+    for frame in range(5):
+        stream.data[:] = frame
+        offsets.append(stream.offset)
+        with stream:
+            glVertexPointer(3, GL_FLOAT, 0, stream)
+            glEnableClientState(GL_VERTEX_ARRAY)
+            try:
+                glDrawArrays(GL_POINTS, 0, 4)
+            finally:
+                glDisableClientState(GL_VERTEX_ARRAY)
+            assert (glGetPointerv(GL_VERTEX_ARRAY_POINTER) or 0) == stream.offset
+        stream.advance()
+    assert offsets == [0, stream.stride, 2 * stream.stride, 0, stream.stride]
+    glFinish()
+    with stream:
+        copy = glGetBufferSubData(GL_ARRAY_BUFFER, 0, stream.size)
+    copy = np.frombuffer(bytes(bytearray(copy)), 'B')
+    first = copy[: stream.nbytes].view('f')
+    assert (first == 3).all(), first
+    stream.delete()
+    assert not stream.buffers
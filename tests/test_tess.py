@@ -189,3 +189,104 @@ class TestTess( basetestcase.BaseTest ):
                 gluTessEndContour( self.tess )
         finally:
             gluTessEndPolygon(self.tess)
+
+if np:
+    from OpenGL.GLU.tess import tessellate, BatchTessellator
+
+    def _area( outline, triangles, combined ):
+        """Total (unsigned) area of the index triangles over outline+combined"""
+        points = np.concatenate( (outline, combined[:,:2]) )
+        corners = points[ triangles ]
+        a, b = corners[:,1] - corners[:,0], corners[:,2] - corners[:,0]
+        return np.abs( a[:,0]*b[:,1] - a[:,1]*b[:,0] ).sum() / 2.0
+
+    def test_tessellate_batch():
+        """tessellate() produces index triangles covering the outline"""
+        outline = np.array( TestTess.TESS_TEST_SHAPE, 'd' )
+        triangles, combined, sources, weights = tessellate( [outline] )
+        assert triangles.dtype == np.uint32, triangles.dtype
+        assert triangles.shape[1] == 3
+        assert triangles.max() < len(outline) + len(combined)
+        # the "H" shape has area 210*1480*2 + 704*157
+        area = _area( outline, triangles, combined )
+        assert abs( area - (210*1480*2 + 704*157) ) < 1e-6, area
+
+    def test_tessellate_array_normal():
+        """An explicit (numpy) normal is passed through to gluTessNormal"""
+        outline = np.array( TestTess.TESS_TEST_SHAPE, 'd' )
+        triangles, combined, sources, weights = tessellate(
+            [outline], normal=np.array( [0.0,0.0,1.0] ),
+        )
+        area = _area( outline, triangles, combined )
+        assert abs( area - (210*1480*2 + 704*157) ) < 1e-6, area
+
+    def test_tessellate_combine():
+        """Intersecting contours report combine-created vertices and their sources"""
+        squares = [
+            [(-1,-1),(1,-1),(1,1),(-1,1)],
+            np.array( [(.5,-.5,0),(1.5,-.5,0),(1.5,.5,0),(.5,.5,0)], 'f' ),
+        ]
+        triangles, combined, sources, weights = tessellate(
+            squares, windingRule=GLU_TESS_WINDING_ABS_GEQ_TWO,
+        )
+        assert combined.shape == (2,3), combined
+        assert sorted( combined[:,1].round(6).tolist() ) == [-0.5, 0.5]
+        assert sources.shape == weights.shape == (2,4)
+        assert np.allclose( weights.sum(axis=1), 1.0 )
+        # intersection region is the x .5 to 1, y -.5 to .5 rectangle
+        assert len(triangles) == 2, triangles
+        assert triangles.max() < 8 + len(combined)
+
+    def test_tessellate_reuse_and_errors():
+        tessellator = BatchTessellator()
+        try:
+            empty = tessellator.tessellate( [] )
+            assert [x.shape for x in empty] == [(0,3),(0,3),(0,4),(0,4)]
+            first = tessellator.tessellate( [[(0,0),(1,0),(1,1)]] )
+            second = tessellator.tessellate( [[(0,0),(1,0),(1,1)]] )
+            assert first[0].tolist() == second[0].tolist()
+            assert len(first[0]) == 1
+            try:
+                tessellator.tessellate( [np.zeros((3,4))] )
+            except ValueError:
+                pass
+            else:
+                raise AssertionError( 'Expected ValueError for (n,4) contour' )
+        finally:
+            tessellator.delete()
+        try:
+            tessellator.tessellate( [] )
+        except GLUError:
+            pass
+        else:
+            raise AssertionError( 'Expected GLUError after delete()' )
+
+def test_tess_reuse_releases_references():
+    """A reused tessellator releases per-polygon references at gluTessEndPolygon"""
+    tess = gluNewTess()
+    collected = []
+    gluTessCallback( tess, GLU_TESS_VERTEX_DATA, lambda vertex, data: collected.append( (vertex,data) ) )
+    gluTessCallback( tess, GLU_TESS_COMBINE, lambda coords, vertices, weights: tuple(coords) )
+    try:
+        for polygon in range( 5 ):
+            polygonData = ['polygon %s'%(polygon,)]
+            gluTessBeginPolygon( tess, polygonData )
+            for contour in (
+                [(-1,-1,0),(1,-1,0),(1,1,0),(-1,1,0)],
+                [(.5,-.5,0),(1.5,-.5,0),(1.5,.5,0),(.5,.5,0)],
+            ):
+                gluTessBeginContour( tess )
+                for point in contour:
+                    gluTessVertex( tess, point, point )
+                gluTessEndContour( tess )
+            assert tess.retainedStatistics()['scoped'] >= 16
+            gluTessEndPolygon( tess )
+            stats = tess.retainedStatistics()
+            assert stats['scoped'] == 0, stats
+            assert stats['persistent'] == 0, stats
+            assert collected and all( data is polygonData for _, data in collected )
+            del collected[:]
+        assert stats['releasedScopes'] == 5
+        assert stats['peakScoped'] >= 17, stats
+    finally:
+        gluDeleteTess( tess )
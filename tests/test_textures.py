@@ -74,6 +74,76 @@ class TestTextures(basetestcase.BaseTest):
         readback_image1 = glReadPixels(0, 0, width, height, GL_RGB, GL_BYTE)
         assert not isinstance(readback_image1, bytes), type(readback_image2)
 
+    def test_glreadpixels_memoryview(self):
+        """outputType=memoryview returns a read-only view without copying"""
+        width, height = self.width, self.height
+        expected = glReadPixels(0, 0, width, height, GL_RGB, GL_UNSIGNED_BYTE)
+        view = glReadPixels(
+            0, 0, width, height, GL_RGB, GL_UNSIGNED_BYTE, outputType=memoryview
+        )
+        assert isinstance(view, memoryview), type(view)
+        assert view.readonly
+        assert view.nbytes == width * height * 3
+        assert bytes(view) == bytes(bytearray(expected))
+        typed = glReadPixelsub(0, 0, width, height, GL_RGB, outputType=memoryview)
+        assert isinstance(typed, memoryview) and typed.readonly
+        # other types are unaffected
+        floats = glReadPixels(
+            0, 0, width, height, GL_RGB, GL_FLOAT, outputType=memoryview
+        )
+        assert not isinstance(floats, memoryview), type(floats)
+
+    def test_memoryview_caller_storage(self):
+        """Caller arrays and pixel-buffer offsets are not turned into views"""
+        from OpenGL import _configflags
+
+        texture = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, texture)
+        glTexImage2D(
+            GL_TEXTURE_2D, 0, GL_RGBA, 4, 4, 0, GL_RGBA, GL_UNSIGNED_BYTE, None
+        )
+        buffer = glGenBuffers(1)
+        original = _configflags.UNSIGNED_BYTE_IMAGES_AS_MEMORYVIEW
+        _configflags.UNSIGNED_BYTE_IMAGES_AS_MEMORYVIEW = True
+        try:
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, buffer)
+            glBufferData(GL_PIXEL_PACK_BUFFER, 4 * 4 * 4, None, GL_STREAM_READ)
+            try:
+                offset = glGetTexImage(
+                    GL_TEXTURE_2D, 0, GL_RGBA, GL_UNSIGNED_BYTE, array=0
+                )
+            finally:
+                glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+            assert offset == 0, offset
+            if np:
+                mine = np.zeros((4, 4, 4), 'B')
+                result = glGetTexImage(
+                    GL_TEXTURE_2D,
+                    0,
+                    GL_RGBA,
+                    GL_UNSIGNED_BYTE,
+                    array=mine,
+                    outputType=memoryview,
+                )
+                assert not isinstance(result, memoryview), type(result)
+        finally:
+            _configflags.UNSIGNED_BYTE_IMAGES_AS_MEMORYVIEW = original
+            glDeleteBuffers(1, [buffer])
+            glDeleteTextures([texture])
+
+    def test_readonly_view_fallback(self):
+        """Pythons without memoryview.toreadonly still get a read-only view"""
+        from OpenGL import images
+
+        data = bytearray(b'pixels')
+        view = images._readOnlyFallback(memoryview(data))
+        assert view.readonly
+        assert bytes(view) == b'pixels'
+        if np:
+            # without numpy the fallback copies
+            data[0:1] = b'P'
+            assert bytes(view) == b'Pixels'
+
     def test_passBackResults(self):
         """Test ALLOW_NUMPY_SCALARS to allow numpy scalars to be passed in"""
         textures = glGenTextures(2)
@@ -0,0 +1,108 @@
+import pygamegltest
+import pytest
+from OpenGL.GL import *
+from OpenGL.GL import shaders
+
+VERTEX = '''#version 140
+uniform mat4 u_mvp;
+uniform vec3 u_lights[4];
+uniform int u_mode;
+uniform uint u_flags;
+uniform bool u_enabled;
+uniform sampler2D u_texture;
+in vec3 position;
+out vec4 colour;
+void main(void)
+{
+    gl_Position = u_mvp * vec4(position, 1.0);
+    colour = vec4(u_lights[0] + u_lights[3], float(u_mode) + float(u_flags));
+    if (u_enabled) {
+        colour += texture(u_texture, position.xy);
+    }
+}
+'''
+FRAGMENT = '''#version 140
+in vec4 colour;
+out vec4 result;
+void main(void)
+{
+    result = colour;
+}
+'''
+MVP = [float(i) for i in range(16)]
+
+
+def _program():
+    return shaders.compileProgram(
+        shaders.compileShader(VERTEX, GL_VERTEX_SHADER),
+        shaders.compileShader(FRAGMENT, GL_FRAGMENT_SHADER),
+    )
+
+
+def _floats(program, name, count):
+    values = (GLfloat * count)()
+    glGetUniformfv(program, glGetUniformLocation(program, name), values)
+    return list(values)
+
+
+def _ints(program, name):
+    value = GLint(0)
+    glGetUniformiv(program, glGetUniformLocation(program, name), value)
+    return value.value
+
+
+def _check(program):
+    program.set('u_mvp', MVP)
+    assert _floats(program, 'u_mvp', 16) == MVP
+    program.set('u_mvp', MVP, transpose=True)
+    assert _floats(program, 'u_mvp', 16)[:4] == [0.0, 4.0, 8.0, 12.0]
+    program.set('u_lights', [1, 2, 3] * 4)
+    assert _floats(program, 'u_lights[3]', 3) == [1.0, 2.0, 3.0]
+    program.set('u_lights[2]', (7, 8, 9))
+    assert _floats(program, 'u_lights[2]', 3) == [7.0, 8.0, 9.0]
+    program.set(b'u_mode', 3)
+    assert _ints(program, 'u_mode') == 3
+    program.set('u_flags', 5)
+    assert _ints(program, 'u_flags') == 5
+    program.set('u_enabled', True)
+    assert _ints(program, 'u_enabled') == 1
+    program.set('u_texture', 2)
+    assert _ints(program, 'u_texture') == 2
+    # inactive uniforms are ignored, as for location -1
+    program.set('u_missing', 1.0)
+    assert program.uniformLocation('u_missing') == -1
+    with pytest.raises(ValueError):
+        program.set('u_lights', [1, 2])
+
+
+@pygamegltest.pygametest()
+def test_uniform_locations_cached():
+    program = _program()
+    for name in ('u_mvp', 'u_lights', 'u_lights[0]', 'u_lights[3]', 'u_mode'):
+        assert program.uniformLocation(name) == glGetUniformLocation(program, name)
+    cached = dict(program._uniforms)
+    assert program.uniformLocation('u_lights[3]') == cached['u_lights[3]'][0]
+    # re-reflecting discards the cache
+    program.reflection(refresh=True)
+    assert program._uniforms is None
+
+
+@pygamegltest.pygametest()
+def test_set_uniforms_separate():
+    if not shaders._separateUniforms():
+        pytest.skip('No glProgramUniform support')
+    program = _program()
+    # glProgramUniform* does not require the program to be in use
+    glUseProgram(0)
+    _check(program)
+    assert shaders.uniformSetter(GL_FLOAT_MAT4, True).separate
+
+
+@pygamegltest.pygametest()
+def test_set_uniforms_current(monkeypatch):
+    monkeypatch.setattr(shaders, '_separateUniforms', lambda: False)
+    program = _program()
+    with program:
+        _check(program)
+    setter = shaders.uniformSetter(GL_FLOAT_MAT4)
+    assert not setter.separate and setter.matrix and setter.components == 16
@@ -0,0 +1,62 @@
+import pygamegltest
+import pytest
+from OpenGL.GL import *
+from OpenGL.arrays import vbo
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def test_merge_ranges():
+    assert vbo.mergeRanges([]) == []
+    assert vbo.mergeRanges([(8, 12), (0, 4), (4, 6)]) == [(0, 6), (8, 12)]
+    assert vbo.mergeRanges([(8, 12), (0, 4), (4, 6)], gap=2) == [(0, 12)]
+    assert vbo.mergeRanges([(0, 10), (2, 4)]) == [(0, 10)]
+
+
+def test_dirty_span():
+    assert vbo.dirtySpan(slice(2, 5), 10) == (2, 5)
+    assert vbo.dirtySpan(slice(None, None, 3), 10) == (0, 10)
+    assert vbo.dirtySpan(slice(-1, 2, -2), 10) == (3, 10)
+    assert vbo.dirtySpan(slice(5, 5), 10) is None
+    assert vbo.dirtySpan(-1, 10) == (9, 10)
+
+
+def _gl_contents(buffer, data):
+    with buffer:
+        result = glGetBufferSubData(GL_ARRAY_BUFFER, 0, data.nbytes)
+    return np.frombuffer(bytes(bytearray(result)), data.dtype).reshape(data.shape)
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+@pygamegltest.pygametest()
+def test_coalesced_updates():
+    data = np.zeros((1000, 3), 'f')
+    buffer = vbo.VBO(data)
+    buffer.coalesce_gap = 0
+    with buffer:
+        pass
+    for i in range(0, 500, 5):
+        buffer[i : i + 2] = np.array([i, i, i], 'f')
+    buffer[600:700:10] = np.full((10, 3), 1.5, 'f')
+    buffer[-1] = np.array([9, 9, 9], 'f')
+    merged = vbo.mergeRanges(buffer._copy_segments, buffer.coalesce_gap)
+    assert len(merged) == 102, len(merged)
+    assert (_gl_contents(buffer, data) == data).all()
+    assert not buffer._copy_segments
+    assert data[620, 0] == 1.5 and data[621, 0] == 0
+    assert data[-1, 2] == 9
+
+
+@pytest.mark.skipif(not np, reason="No Numpy available")
+@pygamegltest.pygametest()
+def test_full_range_recopy():
+    data = np.zeros((10,), 'f')
+    buffer = vbo.VBO(data)
+    with buffer:
+        pass
+    buffer[:] = np.arange(10, dtype='f')
+    assert not buffer.copied
+    assert (_gl_contents(buffer, data) == np.arange(10)).all()
@@ -0,0 +1,98 @@
+"""Tests for the generated straight-line wrapper calls"""
+import os
+import pytest
+from OpenGL import wrapper, wrappergen, converters
+from OpenGL._null import NULL
+
+
+@pytest.fixture(autouse=True)
+def wrapperCache(tmp_path, monkeypatch):
+    """Keep the generated-code cache out of the user's home directory"""
+    monkeypatch.setenv('PYOPENGL_WRAPPER_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(wrappergen, '_disk_cache', None)
+    monkeypatch.setattr(wrappergen, '_factories', {})
+    monkeypatch.setattr(wrappergen, '_dirty', False)
+    yield tmp_path
+    # flush while the environment still points at tmp_path, atexit
+    # would otherwise write this test's shapes to ~/.cache/pyopengl
+    wrappergen.saveCache()
+
+
+def _base(name='baseOperation', argNames=('a', 'b', 'c')):
+    def baseOperation(*args):
+        return args
+
+    baseOperation.__name__ = name
+    baseOperation.argNames = list(argNames)
+    return baseOperation
+
+
+def _finalise(w):
+    w.finalise()
+    generated = wrappergen.generateCall(w)
+    return generated
+
+
+def test_plain_passthrough():
+    w = wrapper.wrapper(_base())
+    call = _finalise(w)
+    assert call(1, 2, 3) == (1, 2, 3)
+
+
+def test_converters_inlined():
+    w = wrapper.wrapper(_base())
+    w.setPyConverter('a', lambda incoming, function, args: incoming * 2)
+    w.setPyConverter('c')
+    w.setCConverter('c', 'constant')
+    call = _finalise(w)
+    assert call(1, 2) == (2, 2, 'constant')
+    source = wrappergen.generateSource(wrappergen.shapeOf(w))
+    assert 'yield' not in source
+    try:
+        call(1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Expected ValueError for missing arguments')
+
+
+def test_optional_and_return():
+    w = wrapper.wrapper(_base())
+    w.setPyConverter('b', wrapper.none_or_pass)
+    w.setPyConverter('c', wrapper.none_or_pass)
+    w.setReturnValues(converters.returnCArgument('b'))
+    call = _finalise(w)
+    assert call(1, 2, 3) == 2
+    assert call(1) is NULL
+
+
+def test_resolvers_and_store():
+    stored = []
+    w = wrapper.wrapper(_base())
+    w.setCResolver('b', lambda value: value + 1)
+    w.setStoreValues(lambda result, wrapper, pyArgs, cArgs: stored.append(cArgs))
+    call = _finalise(w)
+    assert call(1, 2, 3) == (1, 3, 3)
+    assert stored == [(1, 2, 3)]
+
+
+def test_shape_shared():
+    first = wrapper.wrapper(_base('first'))
+    first.setPyConverter('a', lambda incoming, function, args: incoming)
+    second = wrapper.wrapper(_base('second'))
+    second.setPyConverter('a', lambda incoming, function, args: -incoming)
+    assert _finalise(first)(1, 2, 3) == (1, 2, 3)
+    assert _finalise(second)(1, 2, 3) == (-1, 2, 3)
+    assert wrappergen.shapeOf(first) == wrappergen.shapeOf(second)
+
+
+def test_cache_file(wrapperCache):
+    filename = wrappergen.cacheFile()
+    assert os.path.dirname(filename) == str(wrapperCache)
+    digest = wrappergen.generatorDigest()
+    assert digest and digest in os.path.basename(filename)
+    w = wrapper.wrapper(_base('cached'))
+    w.setPyConverter('b', lambda incoming, function, args: incoming)
+    _finalise(w)
+    assert wrappergen.saveCache()
+    assert os.listdir(str(wrapperCache)) == [os.path.basename(filename)]